@@ -51,6 +51,25 @@ def test(session: nox.Session, django_version: str) -> None:
             session.notify("coverage", posargs=[])
 
 
+@nox.session(python=PYTHON_VERSIONS[0])
+def benchmark(session: nox.Session) -> None:
+    """Run the benchmark suite against a large synthetic catalog.
+
+    Results are saved as JSON in .benchmarks/ and compared with the last saved run.
+    Set SUPERGOOD_READS_BENCHMARK_MEDIA_ITEMS and SUPERGOOD_READS_BENCHMARK_REVIEWS to
+    change the size of the catalog.
+    """
+    args = session.posargs or ["--benchmark-autosave", "--benchmark-compare"]
+    install_poetry_groups(session, "main", "test", "dev")
+    session.install("pytest-benchmark")
+    session.run(
+        "pytest",
+        "tests/tests/benchmarks",
+        *args,
+        env={"SUPERGOOD_READS_BENCHMARK": "1"},
+    )
+
+
 @nox.session(python=PYTHON_VERSIONS)
 def mypy(session: nox.Session) -> None:
     """Type-check using mypy."""
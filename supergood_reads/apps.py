@@ -4,3 +4,15 @@ from django.apps import AppConfig
 class DjangoFlexReviewsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "supergood_reads"
+
+    def ready(self) -> None:
+        from supergood_reads.search import signals  # noqa: F401
+        from supergood_reads.utils import (  # noqa: F401
+            catalog,
+            content_type,
+            pagination,
+            rating_aggregates,
+            reading_stats,
+            review_list,
+            review_scores,
+        )
@@ -1,18 +1,53 @@
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Type, TypeVar
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import Model
 from django.forms import ModelChoiceField, ModelForm
+from django.forms.models import ModelChoiceIterator
 
-from supergood_reads.utils.content_type import model_to_content_type_id
+from supergood_reads.utils.content_type import (
+    model_to_content_type,
+    model_to_content_type_id,
+)
 
 _M = TypeVar("_M", bound=Model)
 
 
+class LazyFormDict(Mapping[int, ModelForm[Any]]):
+    """
+    Forms by content_type_id, each instantiated the first time it's looked up, so that
+    a form that is never validated or rendered is never built.
+    """
+
+    def __init__(self, factories: Dict[int, Callable[[], ModelForm[Any]]]) -> None:
+        self.factories = factories
+        self.forms: Dict[int, ModelForm[Any]] = {}
+
+    def __getitem__(self, content_type_id: int) -> ModelForm[Any]:
+        form = self.forms.get(content_type_id)
+        if form is None:
+            form = self.factories[content_type_id]()
+            self.forms[content_type_id] = form
+        return form
+
+    def __contains__(self, content_type_id: object) -> bool:
+        return content_type_id in self.factories
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.factories)
+
+    def __len__(self) -> int:
+        return len(self.factories)
+
+
 class GenericRelationFormGroup:
     """Instantiate ModelForms for generic relations and associate them with their content_type_id.
 
+    Only the selected form is instantiated up front. The others are instantiated when
+    they're first looked up, e.g. by a template that renders them.
+
     Args:
         form_classes: list of form classes to instantiate.
         selected_form_id: The content_type_id for the model whose form was selected to
@@ -36,7 +71,7 @@ class GenericRelationFormGroup:
         self.by_content_type_id = self.instantiate_forms_by_content_type_id()
         self.selected_form = self.get_selected_form()
 
-    def instantiate_forms_by_content_type_id(self) -> Dict[int, ModelForm[Any]]:
+    def instantiate_forms_by_content_type_id(self) -> LazyFormDict:
         """Organize forms by their content_type_id.
 
         This is useful in template rendering. A field can select a Model's
@@ -51,37 +86,32 @@ class GenericRelationFormGroup:
                 9: TomatoStrategyForm(),
             }
         """
-        forms_by_content_type_id = {}
-
-        if self.instance:
-            instance_content_type_id = model_to_content_type_id(self.instance)
-        else:
-            instance_content_type_id = None
-
-        for form_class in self.form_classes:
-            form_model = form_class()._meta.model
-            model_name = form_model._meta.model_name
-            model_content_type_id = model_to_content_type_id(form_model)
-
-            # Plug in instance or data into selected_form
-            if (
-                self.instance or self.data
-            ) and model_content_type_id == self.selected_form_id:
-                if instance_content_type_id and (
-                    instance_content_type_id == self.selected_form_id
-                ):
-                    instance = self.instance
-                else:
-                    instance = None
-                instantiated_form = form_class(
-                    self.data, instance=instance, prefix=model_name
+        return LazyFormDict(
+            {
+                model_to_content_type_id(form_class._meta.model): partial(
+                    self.instantiate_form, form_class
                 )
-            else:
-                instantiated_form = form_class(prefix=model_name)
-
-            forms_by_content_type_id[model_content_type_id] = instantiated_form
+                for form_class in self.form_classes
+            }
+        )
 
-        return forms_by_content_type_id
+    def instantiate_form(self, form_class: Type[ModelForm[Any]]) -> ModelForm[Any]:
+        form_model = form_class._meta.model
+        model_name = form_model._meta.model_name
+        model_content_type_id = model_to_content_type_id(form_model)
+
+        # Plug in instance or data into selected_form
+        if (
+            self.instance or self.data
+        ) and model_content_type_id == self.selected_form_id:
+            if self.instance and (
+                model_to_content_type_id(self.instance) == self.selected_form_id
+            ):
+                instance = self.instance
+            else:
+                instance = None
+            return form_class(self.data, instance=instance, prefix=model_name)
+        return form_class(prefix=model_name)
 
     def get_selected_form(self) -> Optional[ModelForm[Any]]:
         """Returns selected Form.
@@ -100,8 +130,33 @@ class GenericRelationFormGroup:
         return None
 
 
+class ContentTypeChoiceIterator(ModelChoiceIterator):
+    """Iterate over the field's ContentTypes instead of evaluating its queryset."""
+
+    field: "ContentTypeChoiceField"
+
+    def __iter__(self) -> Iterator[tuple[Any, str]]:
+        if self.field.empty_label is not None:
+            yield ("", str(self.field.empty_label))
+        for content_type in self.field.content_types:
+            yield self.choice(content_type)
+
+    def __len__(self) -> int:
+        empty_choices = 1 if self.field.empty_label is not None else 0
+        return len(self.field.content_types) + empty_choices
+
+    def __bool__(self) -> bool:
+        return self.field.empty_label is not None or bool(self.field.content_types)
+
+
 class ContentTypeChoiceField(ModelChoiceField):
-    """Choose a ContentType instance from a list of Models."""
+    """Choose a ContentType instance from a list of Models.
+
+    The ContentTypes come from the engine's registry, so listing and validating the
+    choices doesn't query the database.
+    """
+
+    iterator = ContentTypeChoiceIterator
 
     def label_from_instance(self, obj: Model) -> str:
         assert isinstance(obj, ContentType)
@@ -114,6 +169,9 @@ class ContentTypeChoiceField(ModelChoiceField):
         models: list[_M] | list[type[_M]] | None = None,
         **kwargs: Any,
     ) -> None:
+        self.content_types: tuple[ContentType, ...] = ()
+        # Identifies the choices without evaluating the queryset.
+        self.content_type_ids: tuple[int, ...] = ()
         queryset = ContentType.objects.none()
         super().__init__(queryset, *args, **kwargs)
         self.parent_model = parent_model
@@ -121,10 +179,24 @@ class ContentTypeChoiceField(ModelChoiceField):
             self.set_models(models)
 
     def set_models(self, models: list[_M] | list[type[_M]]) -> None:
-        """Set ContentType queryset based on Models."""
-        content_types = ContentType.objects.get_for_models(*models).values()
-        self.queryset = ContentType.objects.filter(
-            pk__in=[ct.pk for ct in content_types]
+        """Set ContentType choices based on Models."""
+        content_types = {model_to_content_type(model) for model in models}
+        self.content_types = tuple(sorted(content_types, key=lambda ct: ct.pk))
+        self.content_type_ids = tuple(ct.pk for ct in self.content_types)
+        self.queryset = ContentType.objects.filter(pk__in=self.content_type_ids)
+
+    def to_python(self, value: Any) -> ContentType | None:
+        if value in self.empty_values:
+            return None
+        if isinstance(value, ContentType):
+            value = value.pk
+        for content_type in self.content_types:
+            if str(content_type.pk) == str(value):
+                return content_type
+        raise ValidationError(
+            self.error_messages["invalid_choice"],
+            code="invalid_choice",
+            params={"value": value},
         )
 
     def validate(self, value: Model | None) -> None:
@@ -0,0 +1,258 @@
+from collections import defaultdict
+from typing import Any, Callable, Optional
+
+from django.contrib.auth.models import User
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.db import transaction
+from django.db.models import Model, prefetch_related_objects
+from django.forms import BaseForm, ModelForm
+from django.utils import timezone
+
+from supergood_reads.forms.review_forms import ReviewForm
+from supergood_reads.models import (
+    AbstractReviewStrategy,
+    MediaItemRatingAggregate,
+    Review,
+    ReviewListEntry,
+)
+from supergood_reads.utils.engine import supergood_reads_engine
+from supergood_reads.utils.pagination import invalidate_counts
+from supergood_reads.utils.reading_stats import bump_reading_stats_version
+
+# Where the value of each ReviewForm field is in a review payload.
+REVIEW_FIELD_PATHS = {
+    "completed_at_day": "completedAt.day",
+    "completed_at_month": "completedAt.month",
+    "completed_at_year": "completedAt.year",
+    "text": "text",
+    "media_item_content_type": "mediaItem.contentType",
+    "media_item_object_id": "mediaItem.id",
+    "strategy_content_type": "strategy.contentType",
+}
+NON_FIELD_ERRORS_PATH = "nonFieldErrors"
+
+
+def payload_object(payload: dict[str, Any], key: str) -> dict[str, Any]:
+    value = payload.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+def form_errors(form: BaseForm, path_for: Callable[[str], str]) -> dict[str, list[str]]:
+    """A form's error messages, keyed by the path of each field in the payload."""
+    return {
+        path_for(name): [error["message"] for error in errors]
+        for name, errors in form.errors.get_json_data().items()
+    }
+
+
+class BulkReviewItem:
+    """One payload of a BulkReviewFormGroup, the forms that validate it and its Review."""
+
+    strategy_form: Optional[ModelForm[Any]] = None
+    media_item_form: Optional[ModelForm[Any]] = None
+    review: Optional[Review] = None
+
+    def __init__(self, index: int, payload: Any) -> None:
+        self.index = index
+        self.errors: dict[str, list[str]] = {}
+        if not isinstance(payload, dict):
+            self.errors[NON_FIELD_ERRORS_PATH] = ["Expected an object."]
+            payload = {}
+        self.media_item_data = payload_object(payload, "mediaItem")
+        self.strategy_data = payload_object(payload, "strategy")
+        completed_at = payload_object(payload, "completedAt")
+        self.review_form = ReviewForm(
+            data={
+                "completed_at_day": completed_at.get("day"),
+                "completed_at_month": completed_at.get("month"),
+                "completed_at_year": completed_at.get("year"),
+                "text": payload.get("text"),
+                "media_item_content_type": self.media_item_data.get("contentType"),
+                "media_item_object_id": self.media_item_data.get("id"),
+                "strategy_content_type": self.strategy_data.get("contentType"),
+            },
+            strategy_choices=supergood_reads_engine.strategy_model_classes,
+            media_item_choices=supergood_reads_engine.media_item_model_classes,
+        )
+
+    @property
+    def media_item_model(self) -> Optional[type[Model]]:
+        content_type = self.review_form.cleaned_data.get("media_item_content_type")
+        return content_type.model_class() if content_type else None
+
+    @property
+    def media_item_id(self) -> Any:
+        return self.review_form.cleaned_data.get("media_item_object_id")
+
+    def result(self) -> dict[str, Any]:
+        if self.review is not None:
+            return {"index": self.index, "id": self.review.pk}
+        return {"index": self.index, "errors": self.errors}
+
+
+class BulkReviewFormGroup:
+    """
+    Create many Reviews at once, such as when importing a user's ratings.
+
+    Each payload is validated with the forms of ReviewFormGroup, and save() creates
+    the valid ones with a bulk_create() per Strategy type and one for all the Reviews.
+    New MediaItems are still saved one at a time, since bulk_create() can't insert
+    multi-table models. Invalid payloads are reported by their index, with their
+    errors keyed by the path of each field in the payload.
+
+    Payload:
+        {
+            # An existing MediaItem, or {"contentType": 7, "fields": {...}} to create
+            # one with the MediaItem's form.
+            "mediaItem": {"contentType": 7, "id": "<uuid>"},
+            "strategy": {"contentType": 9, "fields": {"stars": 4}},
+            # Each part is optional, as on the review form.
+            "completedAt": {"year": 2020, "month": 2, "day": 1},
+            "text": "It was good.",
+        }
+    """
+
+    def __init__(self, payloads: list[Any], user: User) -> None:
+        self.user = user
+        self.items = [
+            BulkReviewItem(index, payload) for index, payload in enumerate(payloads)
+        ]
+        self.valid: Optional[bool] = None
+
+    def is_valid(self) -> bool:
+        """Whether every payload is valid. save() creates the valid ones either way."""
+        for item in self.items:
+            self.validate_item(item)
+        self.validate_existing_media_items()
+        self.valid = not any(item.errors for item in self.items)
+        return self.valid
+
+    def validate_item(self, item: BulkReviewItem) -> None:
+        review_form = item.review_form
+        if not review_form.is_valid():
+            item.errors.update(
+                form_errors(
+                    review_form,
+                    lambda name: REVIEW_FIELD_PATHS.get(name, NON_FIELD_ERRORS_PATH),
+                )
+            )
+        content_types = supergood_reads_engine.content_types
+
+        strategy_content_type = review_form.cleaned_data.get("strategy_content_type")
+        if strategy_content_type:
+            strategy_form_class = content_types.by_id[
+                strategy_content_type.pk
+            ].form_class
+            item.strategy_form = strategy_form_class(
+                data=payload_object(item.strategy_data, "fields")
+            )
+            if not item.strategy_form.is_valid():
+                item.errors.update(form_errors(item.strategy_form, strategy_field_path))
+
+        media_item_content_type = review_form.cleaned_data.get(
+            "media_item_content_type"
+        )
+        if not media_item_content_type or item.media_item_id:
+            return
+        if "fields" not in item.media_item_data:
+            if "mediaItem.id" not in item.errors:
+                item.errors["mediaItem.id"] = [
+                    "Either the id of a media item or the fields of a new one are "
+                    "required."
+                ]
+            return
+        media_item_form_class = content_types.by_id[
+            media_item_content_type.pk
+        ].form_class
+        item.media_item_form = media_item_form_class(
+            data=payload_object(item.media_item_data, "fields")
+        )
+        if not item.media_item_form.is_valid():
+            item.errors.update(form_errors(item.media_item_form, media_item_field_path))
+
+    def validate_existing_media_items(self) -> None:
+        """Check that the selected MediaItems exist, in one query per MediaItem type."""
+        ids: defaultdict[type[Model], set[Any]] = defaultdict(set)
+        for item in self.items:
+            if item.media_item_id and item.media_item_model:
+                ids[item.media_item_model].add(item.media_item_id)
+        existing = {
+            model_class: set(
+                model_class._base_manager.filter(pk__in=model_ids).values_list(
+                    "pk", flat=True
+                )
+            )
+            for model_class, model_ids in ids.items()
+        }
+        for item in self.items:
+            model_class = item.media_item_model
+            if model_class in existing and item.media_item_id:
+                if item.media_item_id not in existing[model_class]:
+                    item.errors["mediaItem.id"] = [
+                        "The selected object does not exist."
+                    ]
+
+    @transaction.atomic
+    def save(self) -> list[dict[str, Any]]:
+        """Create the Reviews of the valid payloads, and return a result per payload."""
+        if self.valid is None:
+            self.is_valid()
+        items = [item for item in self.items if not item.errors]
+        if items:
+            self.create_reviews(items)
+        return [item.result() for item in self.items]
+
+    def create_reviews(self, items: list[BulkReviewItem]) -> None:
+        now = timezone.now()
+        reviews: list[Review] = []
+        strategies: list[tuple[Review, AbstractReviewStrategy]] = []
+        for item in items:
+            review = item.review_form.save(commit=False)
+            if item.media_item_form is not None:
+                media_item = item.media_item_form.save(commit=False)
+                media_item.owner = self.user
+                media_item.save()
+                review.media_item = media_item
+            assert item.strategy_form
+            strategies.append((review, item.strategy_form.save(commit=False)))
+            review.owner = self.user
+            review.created_at = now
+            review.updated_at = now
+            item.review = review
+            reviews.append(review)
+
+        supergood_reads_engine.strategy_storage.store_many(strategies)
+        for review in reviews:
+            review.score = review.strategy_score()
+        Review.objects.bulk_create(reviews)
+
+        # bulk_create() doesn't send the signals that keep these current.
+        prefetch_related_objects(reviews, "media_item")
+        ReviewListEntry.objects.bulk_create(
+            [
+                ReviewListEntry(
+                    review_id=review.pk, **ReviewListEntry.fields_for(review)
+                )
+                for review in reviews
+            ]
+        )
+        MediaItemRatingAggregate.objects.refresh(
+            {
+                review.media_item_object_id
+                for review in reviews
+                if review.media_item_object_id is not None
+            }
+        )
+        for model_class in (Review, ReviewListEntry, MediaItemRatingAggregate):
+            invalidate_counts(model_class)
+        bump_reading_stats_version(self.user.pk)
+
+
+def strategy_field_path(name: str) -> str:
+    return "strategy.fields" if name == NON_FIELD_ERRORS else f"strategy.fields.{name}"
+
+
+def media_item_field_path(name: str) -> str:
+    return (
+        "mediaItem.fields" if name == NON_FIELD_ERRORS else f"mediaItem.fields.{name}"
+    )
@@ -56,34 +56,41 @@ def validate_generic_foreign_key(
         if not MediaItemModelClass:
             raise InvalidContentTypeError
 
-        # Raises MediaItemModelClass.DoesNotExist if not foud
-        content_type.get_object_for_this_type(id=object_id)
+        # Only the object's existence matters here, so don't fetch it.
+        if not MediaItemModelClass._base_manager.filter(pk=object_id).exists():
+            raise InvalidObjectIdError
     except (ContentType.DoesNotExist, InvalidContentTypeError):
         form.add_error(
             content_type_field_name,
             "The selected content type does not exist.",
         )
         return False
-    except (MediaItemModelClass.DoesNotExist, InvalidObjectIdError):
+    except InvalidObjectIdError:
         form.add_error(object_id_field_name, "The selected object does not exist.")
         return False
     return True
 
 
+# The fields of ReviewForm that ContentTypeChoiceField validates.
+CONTENT_TYPE_FIELDS = ("media_item_content_type", "strategy_content_type")
+
+
 class ReviewForm(forms.ModelForm[Review]):
     strategy_choices: list[type[AbstractReviewStrategy]]
     media_item_choices: list[type[BaseMediaItem]]
 
     class Meta:
         model = Review
+        # The ContentType fields are declared below and copied to the Review in
+        # clean(). ContentTypeChoiceField has checked them against the engine's
+        # registry, so leaving them out of "fields" keeps the model's foreign key
+        # validation from querying for them again.
         fields = [
             "completed_at_day",
             "completed_at_month",
             "completed_at_year",
             "text",
-            "media_item_content_type",
             "media_item_object_id",
-            "strategy_content_type",
         ]
         labels = {
             "text": "Review",
@@ -151,6 +158,16 @@ class ReviewForm(forms.ModelForm[Review]):
         )
         strategy_choice_field.set_models(self.strategy_choices)
 
+        for name in CONTENT_TYPE_FIELDS:
+            self.fields[name].initial = getattr(self.instance, f"{name}_id")
+
+    def clean(self) -> dict[str, Any]:
+        super().clean()
+        for name in CONTENT_TYPE_FIELDS:
+            if name in self.cleaned_data:
+                setattr(self.instance, name, self.cleaned_data[name])
+        return self.cleaned_data
+
 
 class CreateNewMediaOption(Enum):
     SELECT_EXISTING = "SELECT_EXISTING"
@@ -251,7 +268,6 @@ class ReviewFormGroup:
                 content_type_id = None
         return content_type_id
 
-    @transaction.atomic
     def is_valid(self) -> bool:
         self.valid = True
 
@@ -309,15 +325,15 @@ class ReviewFormGroup:
             media_item.save()
             review.media_item = media_item
 
-        # If we've chosen a new strategy, delete the old strategy instance.
-        if self.original_strategy and (
-            "strategy_content_type" in self.review_form.changed_data
-        ):
-            self.original_strategy.delete()
+        # A Strategy of the same type is updated in place. If we've chosen a new type
+        # of strategy, the old strategy instance is deleted.
         selected_strategy_form = self.strategy_forms.selected_form
         assert selected_strategy_form
-        strategy = selected_strategy_form.save()
-        review.strategy = strategy
+        supergood_reads_engine.strategy_storage.save(
+            review,
+            selected_strategy_form.save(commit=False),
+            previous=self.original_strategy,
+        )
 
         if self.review_form.instance._state.adding:
             review.owner = self.user
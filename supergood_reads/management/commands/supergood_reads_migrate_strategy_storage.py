@@ -0,0 +1,34 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from supergood_reads.models import Review
+from supergood_reads.utils.engine import supergood_reads_engine
+
+
+class Command(BaseCommand):
+    """Move every Review's Strategy into the configured strategy storage.
+
+    Reviews are readable whichever storage their Strategies are in, so this can run
+    while the site is up, after changing SupergoodReadsConfig.strategy_storage_class.
+    """
+
+    help = "Move the Strategies of all Reviews into the configured storage"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of Reviews to move per transaction",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        storage = supergood_reads_engine.strategy_storage
+        count = storage.migrate(Review.objects.all(), batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Moved the strategies of {count} reviews to "
+                f"{type(storage).__name__}."
+            )
+        )
@@ -0,0 +1,30 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from supergood_reads.models import MediaItemRatingAggregate
+
+
+class Command(BaseCommand):
+    """Recompute the rating aggregate of every MediaItem, in batches.
+
+    Aggregates are kept current on Review writes, so this is only needed to backfill
+    them, or after writes that skip signals. They're computed from Review.score, so
+    run "supergood_reads_update_review_scores" first if scores might be missing.
+    """
+
+    help = "Rebuild the per-MediaItem rating aggregates"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of MediaItems to aggregate per query and transaction",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = MediaItemRatingAggregate.objects.rebuild(
+            batch_size=options["batch_size"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} rating aggregates."))
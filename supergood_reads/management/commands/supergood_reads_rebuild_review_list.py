@@ -0,0 +1,20 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from supergood_reads.models import ReviewListEntry
+
+
+class Command(BaseCommand):
+    """Recreate the review list entry of every Review.
+
+    Entries are kept current on save, so this is only needed after migrating, to
+    render the entries that migrations 0008 and 0009 backfilled, and after writes that
+    skip signals, like QuerySet.update() or bulk_create().
+    """
+
+    help = "Rebuild the review list entries"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = ReviewListEntry.objects.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} review list entries."))
@@ -0,0 +1,19 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from supergood_reads.models import MediaItemSearchDocument
+
+
+class Command(BaseCommand):
+    """Recreate the search document of every MediaItem.
+
+    Documents are kept current on save, so this is only needed after writes that skip
+    signals, like QuerySet.update(), or after adding a new MediaItem type.
+    """
+
+    help = "Rebuild the library's search documents"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = MediaItemSearchDocument.objects.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} search documents."))
@@ -0,0 +1,21 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from supergood_reads.models import MediaItemSearchDocument
+from supergood_reads.utils.engine import supergood_reads_engine
+
+
+class Command(BaseCommand):
+    """Repopulate the library's full-text search index.
+
+    Only needed on sqlite, where rebuilding a table during a migration drops the
+    triggers that keep its FTS5 index in sync.
+    """
+
+    help = "Rebuild the full-text search index"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        search_backend = supergood_reads_engine.search_backend
+        search_backend.rebuild(MediaItemSearchDocument, columns=("title", "creator"))
+        self.stdout.write(self.style.SUCCESS("Rebuilt search index."))
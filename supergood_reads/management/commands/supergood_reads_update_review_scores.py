@@ -0,0 +1,35 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from supergood_reads.models import Review
+
+
+class Command(BaseCommand):
+    """Recompute Review.score from each Review's Strategy, in batches.
+
+    Scores are kept current on save, so this is only needed to backfill existing
+    Reviews, after writes that skip signals, or after changing how a Strategy scores.
+    """
+
+    help = "Recompute the normalized score of every Review"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of Reviews to update per query and transaction",
+        )
+        parser.add_argument(
+            "--missing-only",
+            action="store_true",
+            help="Only score Reviews that don't have a score yet",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        qs = Review.objects.all()
+        if options["missing_only"]:
+            qs = qs.filter(score__isnull=True)
+        count = qs.update_scores(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Updated the scores of {count} reviews."))
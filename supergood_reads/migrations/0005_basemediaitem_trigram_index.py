@@ -0,0 +1,26 @@
+from django.db import migrations
+
+from supergood_reads.search.sql import install_trigram_index, uninstall_trigram_index
+
+TABLE = "supergood_reads_basemediaitem"
+
+
+def install(apps, schema_editor):
+    install_trigram_index(schema_editor, TABLE, "title")
+
+
+def uninstall(apps, schema_editor):
+    uninstall_trigram_index(schema_editor, TABLE, "title")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "supergood_reads",
+            "0004_tomatostrategy_rename_maximusstrategy_thumbsstrategy_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
@@ -0,0 +1,164 @@
+# Generated by Django 4.2.30 on 2026-10-16 21:07
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+from supergood_reads.search.sql import install_search_index, uninstall_search_index
+
+TABLE = "supergood_reads_mediaitemsearchdocument"
+
+# Historical models don't have the "creator" property, so spell out where it comes
+# from for the MediaItems that ship with supergood_reads. Documents for any other
+# MediaItem types are created by running "supergood_reads_rebuild_search_documents".
+CREATOR_FIELDS = {"book": "author", "film": "director"}
+BATCH_SIZE = 1000
+
+
+def install(apps, schema_editor):
+    install_search_index(schema_editor, TABLE, columns=["title", "creator"])
+
+
+def uninstall(apps, schema_editor):
+    uninstall_search_index(schema_editor, TABLE)
+
+
+def backfill(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    MediaItemSearchDocument = apps.get_model(
+        "supergood_reads", "MediaItemSearchDocument"
+    )
+    MediaItemSearchDocumentGenre = apps.get_model(
+        "supergood_reads", "MediaItemSearchDocumentGenre"
+    )
+
+    def create_documents(documents):
+        MediaItemSearchDocument.objects.bulk_create(documents)
+        MediaItemSearchDocumentGenre.objects.bulk_create(
+            [
+                MediaItemSearchDocumentGenre(document_id=document.pk, name=name)
+                for document in documents
+                for name in document.genres
+            ]
+        )
+
+    for model_name, creator_field in CREATOR_FIELDS.items():
+        model_class = apps.get_model("supergood_reads", model_name)
+        content_type, _ = ContentType.objects.get_or_create(
+            app_label="supergood_reads", model=model_name
+        )
+        documents = []
+        for media_item in model_class.objects.prefetch_related("genres").iterator(
+            chunk_size=BATCH_SIZE
+        ):
+            documents.append(
+                MediaItemSearchDocument(
+                    media_item_id=media_item.pk,
+                    content_type=content_type,
+                    title=media_item.title,
+                    creator=getattr(media_item, creator_field),
+                    year=media_item.year,
+                    genres=sorted(g.name for g in media_item.genres.all()),
+                    owner_id=media_item.owner_id,
+                    validated=media_item.validated,
+                    updated_at=media_item.updated_at,
+                )
+            )
+            if len(documents) == BATCH_SIZE:
+                create_documents(documents)
+                documents = []
+        create_documents(documents)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("supergood_reads", "0005_basemediaitem_trigram_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MediaItemSearchDocument",
+            fields=[
+                (
+                    "media_item",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_document",
+                        serialize=False,
+                        to="supergood_reads.basemediaitem",
+                    ),
+                ),
+                ("title", models.CharField(default="", max_length=256)),
+                ("creator", models.CharField(default="", max_length=256)),
+                ("year", models.IntegerField(blank=True, null=True)),
+                ("genres", models.JSONField(blank=True, default=list)),
+                ("validated", models.BooleanField(default=False)),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "owner",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("-updated_at",),
+                "indexes": [
+                    models.Index(
+                        fields=["validated", "-updated_at"],
+                        name="search_doc_validated_idx",
+                    ),
+                    models.Index(
+                        fields=["owner", "-updated_at"], name="search_doc_owner_idx"
+                    ),
+                    models.Index(
+                        fields=["content_type", "-updated_at"],
+                        name="search_doc_content_type_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="MediaItemSearchDocumentGenre",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=256)),
+                (
+                    "document",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="genre_rows",
+                        to="supergood_reads.mediaitemsearchdocument",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="mediaitemsearchdocumentgenre",
+            constraint=models.UniqueConstraint(
+                fields=("name", "document"), name="search_doc_genre_unique"
+            ),
+        ),
+        migrations.RunPython(install, uninstall),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:27
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    BaseMediaItem = apps.get_model("supergood_reads", "BaseMediaItem")
+    for model_class in apps.get_app_config("supergood_reads").get_models():
+        if BaseMediaItem not in model_class._meta.get_parent_list():
+            continue
+        content_type, _ = ContentType.objects.get_or_create(
+            app_label=model_class._meta.app_label, model=model_class._meta.model_name
+        )
+        BaseMediaItem.objects.filter(
+            pk__in=model_class.objects.values("pk"), content_type__isnull=True
+        ).update(content_type=content_type)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("supergood_reads", "0006_mediaitemsearchdocument"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="basemediaitem",
+            name="content_type",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="contenttypes.contenttype",
+            ),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,180 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:34
+
+from datetime import date
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Historical models don't have the "creator" property, so spell out where it comes
+# from for the MediaItems that ship with supergood_reads. Ratings are rendered by the
+# current Strategy models, so entries are created without them. Run
+# "supergood_reads_rebuild_review_list" after migrating to render them, along with the
+# titles of any other MediaItem types.
+CREATOR_FIELDS = {"book": "author", "film": "director"}
+BATCH_SIZE = 1000
+
+
+def batches(queryset):
+    """The rows of "queryset" in pk order, BATCH_SIZE at a time."""
+    queryset = queryset.order_by("pk")
+    last_pk = None
+    while True:
+        batch_qs = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        batch = list(batch_qs[:BATCH_SIZE])
+        if not batch:
+            return
+        yield batch
+        last_pk = batch[-1].pk
+
+
+def completed_at(review):
+    """Review.completed_at as of this migration."""
+    year = review.completed_at_year
+    month = review.completed_at_month
+    day = review.completed_at_day
+    if not year:
+        return ""
+    elif not month:
+        return str(year)
+    elif not day:
+        return date(year, month, 1).strftime("%b %Y")
+    return date(year, month, day).strftime("%d %b %Y")
+
+
+def sort_key(review):
+    """ReviewListEntry.sort_key_for() as of this migration."""
+    return (
+        f"{review.completed_at_year or 0:04d}"
+        f"{review.completed_at_month or 0:02d}"
+        f"{review.completed_at_day or 0:02d}"
+        f":{review.created_at:%Y%m%d%H%M%S%f}"
+        f":{review.pk.hex}"
+    )
+
+
+def backfill(apps, schema_editor):
+    ContentType = apps.get_model("contenttypes", "ContentType")
+    Review = apps.get_model("supergood_reads", "Review")
+    ReviewListEntry = apps.get_model("supergood_reads", "ReviewListEntry")
+    media_item_models = {
+        content_type.pk: (
+            apps.get_model("supergood_reads", content_type.model),
+            CREATOR_FIELDS[content_type.model],
+        )
+        for content_type in ContentType.objects.filter(
+            app_label="supergood_reads", model__in=CREATOR_FIELDS
+        )
+    }
+
+    for reviews in batches(Review.objects.all()):
+        media_items = {}
+        for content_type_id, (model_class, creator_field) in media_item_models.items():
+            ids = [
+                review.media_item_object_id
+                for review in reviews
+                if review.media_item_content_type_id == content_type_id
+            ]
+            if not ids:
+                continue
+            for media_item in model_class.objects.filter(pk__in=ids).only(
+                "title", "year", creator_field
+            ):
+                media_items[content_type_id, media_item.pk] = (
+                    media_item.title,
+                    media_item.year,
+                    getattr(media_item, creator_field) or "",
+                )
+
+        entries = []
+        for review in reviews:
+            key = (review.media_item_content_type_id, review.media_item_object_id)
+            title, year, creator = media_items.get(key, ("", None, ""))
+            entries.append(
+                ReviewListEntry(
+                    review_id=review.pk,
+                    owner_id=review.owner_id,
+                    validated=review.validated,
+                    media_item_content_type_id=(
+                        review.media_item_content_type_id
+                        if key in media_items
+                        else None
+                    ),
+                    media_item_object_id=review.media_item_object_id,
+                    strategy_object_id=review.strategy_object_id,
+                    title=title,
+                    year=year,
+                    creator=creator,
+                    completed_at=completed_at(review),
+                    text=review.text,
+                    sort_key=sort_key(review),
+                )
+            )
+        ReviewListEntry.objects.bulk_create(entries)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("supergood_reads", "0007_basemediaitem_content_type"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReviewListEntry",
+            fields=[
+                (
+                    "review",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="list_entry",
+                        serialize=False,
+                        to="supergood_reads.review",
+                    ),
+                ),
+                ("validated", models.BooleanField(default=False)),
+                ("media_item_object_id", models.UUIDField(db_index=True, null=True)),
+                ("strategy_object_id", models.UUIDField(db_index=True, null=True)),
+                ("title", models.CharField(default="", max_length=256)),
+                ("year", models.IntegerField(blank=True, null=True)),
+                ("creator", models.CharField(default="", max_length=256)),
+                ("completed_at", models.CharField(default="", max_length=16)),
+                ("rating_html", models.TextField(blank=True, default="")),
+                ("text", models.TextField(blank=True, default="")),
+                ("sort_key", models.CharField(max_length=64, unique=True)),
+                (
+                    "media_item_content_type",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "owner",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "review list entries",
+                "ordering": ("-sort_key",),
+                "indexes": [
+                    models.Index(
+                        fields=["owner", "-sort_key"], name="review_list_owner_idx"
+                    ),
+                    models.Index(
+                        fields=["validated", "-sort_key"],
+                        name="review_list_validated_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
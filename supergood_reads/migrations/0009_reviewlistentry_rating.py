@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:42
+
+from django.db import migrations, models
+
+# Historical models don't have the "rating" property, so the ratings of existing
+# entries are filled in by running "supergood_reads_rebuild_review_list" after
+# migrating.
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("supergood_reads", "0008_reviewlistentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reviewlistentry",
+            name="rating",
+            field=models.DecimalField(
+                blank=True, decimal_places=1, max_digits=4, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="reviewlistentry",
+            name="rating_max",
+            field=models.DecimalField(
+                blank=True, decimal_places=1, max_digits=4, null=True
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("supergood_reads", "0009_reviewlistentry_rating"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="review",
+            name="score",
+            field=models.DecimalField(
+                blank=True, db_index=True, decimal_places=1, max_digits=4, null=True
+            ),
+        ),
+    ]
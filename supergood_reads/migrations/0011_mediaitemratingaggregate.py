@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("supergood_reads", "0010_review_score"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MediaItemRatingAggregate",
+            fields=[
+                (
+                    "media_item",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rating_aggregate",
+                        serialize=False,
+                        to="supergood_reads.basemediaitem",
+                    ),
+                ),
+                ("review_count", models.PositiveIntegerField(default=0)),
+                ("score_count", models.PositiveIntegerField(default=0)),
+                (
+                    "score_sum",
+                    models.DecimalField(decimal_places=1, default=0, max_digits=12),
+                ),
+                ("bucket_1", models.PositiveIntegerField(default=0)),
+                ("bucket_2", models.PositiveIntegerField(default=0)),
+                ("bucket_3", models.PositiveIntegerField(default=0)),
+                ("bucket_4", models.PositiveIntegerField(default=0)),
+                ("bucket_5", models.PositiveIntegerField(default=0)),
+                ("last_reviewed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
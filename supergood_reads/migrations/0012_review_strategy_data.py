@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:57
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("supergood_reads", "0011_mediaitemratingaggregate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="review",
+            name="strategy_data",
+            field=models.JSONField(
+                blank=True,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                null=True,
+            ),
+        ),
+    ]
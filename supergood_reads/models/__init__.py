@@ -1,5 +1,7 @@
 from .media_items import BaseMediaItem, Book, Country, Film, Genre
+from .rating_aggregates import MediaItemRatingAggregate
 from .review import Review
+from .review_list import ReviewListEntry
 from .review_strategies import (
     AbstractReviewStrategy,
     EbertStrategy,
@@ -9,10 +11,12 @@ from .review_strategies import (
     ThumbsStrategy,
     TomatoStrategy,
 )
+from .search import MediaItemSearchDocument, MediaItemSearchDocumentGenre
 from .user_settings import UserSettings
 
 __all__ = [
     "Review",
+    "ReviewListEntry",
     "BaseMediaItem",
     "AbstractReviewStrategy",
     "EbertStrategy",
@@ -25,5 +29,8 @@ __all__ = [
     "Country",
     "Book",
     "Film",
+    "MediaItemSearchDocument",
+    "MediaItemSearchDocumentGenre",
+    "MediaItemRatingAggregate",
     "UserSettings",
 ]
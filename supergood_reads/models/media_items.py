@@ -1,36 +1,57 @@
 import uuid
-from typing import Any, Self, TypeVar, cast
+from typing import Any, Iterable, Self, TypeVar, Union, cast
 
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser, User
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist
 from django.core.validators import MaxValueValidator
 from django.db import models
-from django.db.models import CharField, F, Value
+from django.db.models import CharField, F, Prefetch, Value, prefetch_related_objects
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.functions import Concat
-from django.template.loader import render_to_string
 from django.utils import timezone
-from django.utils.html import format_html
 from django.utils.safestring import SafeText
 
 from supergood_reads.models.review import Review
+from supergood_reads.utils.fragments import render_fragment
 
 _T = TypeVar("_T", bound="BaseMediaItem")
+# Covariant like django-stubs' own, so that Book's manager is a BaseMediaItem manager.
+_M = TypeVar("_M", bound="BaseMediaItem", covariant=True)
+_Lookup = Union[str, Prefetch]
 
 
-class MediaItemQuerySet(models.QuerySet[_T]):
+class BaseMediaItemQuerySet(models.QuerySet[_M]):
+    def with_select_related(self, *models: type["BaseMediaItem"]) -> Self:
+        return self.select_related(*[m.__name__.lower() for m in models])
+
+    def as_children(self, *lookups: _Lookup) -> list["BaseMediaItem"]:
+        """
+        Evaluate the queryset as concrete MediaItems, in the same order.
+
+        Rows are grouped by type and each group is fetched in one query. "lookups" are
+        prefetched on the children of every type that has them, so
+        as_children("genres", "countries") prefetches countries for Films but not for
+        Books.
+        """
+        return self.model.get_children(self, *lookups)
+
+
+class MediaItemQuerySet(BaseMediaItemQuerySet[_M]):
     def with_autocomplete_label(self) -> Self:
         return self.annotate(autocomplete_label=self.model.autocomplete_label())
 
 
-class MediaItemManager(models.Manager[_T]):
-    def get_queryset(self) -> MediaItemQuerySet[_T]:
-        return MediaItemQuerySet[_T](self.model, using=self._db)
+class BaseMediaItemManager(models.Manager[_M]):
+    def get_queryset(self) -> BaseMediaItemQuerySet[_M]:
+        return BaseMediaItemQuerySet[_M](self.model, using=self._db)
 
 
-class BaseMediaItemQuerySet(models.QuerySet["BaseMediaItem"]):
-    def with_select_related(self, *models: type["BaseMediaItem"]) -> Self:
-        return self.select_related([m.__name__.lower() for m in models])
+class MediaItemManager(BaseMediaItemManager[_M]):
+    def get_queryset(self) -> MediaItemQuerySet[_M]:
+        return MediaItemQuerySet[_M](self.model, using=self._db)
 
 
 class BaseMediaItem(models.Model):
@@ -54,6 +75,15 @@ class BaseMediaItem(models.Model):
     created_at = models.DateTimeField(null=False)
     updated_at = models.DateTimeField(default=timezone.now, null=False, db_index=True)
     validated = models.BooleanField(default=False, db_index=True)
+    # The concrete MediaItem type of this row, so that it can be downcast without
+    # probing every child table. Set on save.
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.PROTECT,
+        null=True,
+        editable=False,
+        related_name="+",
+    )
 
     reviews = GenericRelation(
         Review,
@@ -61,6 +91,8 @@ class BaseMediaItem(models.Model):
         content_type_field="media_item_content_type",
     )
 
+    objects = BaseMediaItemManager["BaseMediaItem"]()
+
     class Meta:
         ordering = ("-updated_at",)
 
@@ -107,9 +139,29 @@ class BaseMediaItem(models.Model):
             user, self, "delete"
         )
 
+    @property
+    def child_model_class(self) -> type["BaseMediaItem"] | None:
+        """The concrete MediaItem type of this row, if it's known."""
+        if self.content_type_id is None:
+            return None
+        content_type = ContentType.objects.get_for_id(self.content_type_id)
+        model_class = content_type.model_class()
+        if model_class is None or not issubclass(model_class, BaseMediaItem):
+            return None
+        return model_class
+
     def get_child(self: _T) -> _T:
         from supergood_reads.utils.engine import supergood_reads_engine
 
+        model_class = self.child_model_class
+        if model_class is type(self):
+            return self
+        if model_class is not None:
+            # One lookup by primary key on the child's table.
+            model_name = model_class.__name__.lower()
+            return cast(_T, getattr(self, model_name, self))
+
+        # Rows saved without going through save() may not know their type.
         for model_class in supergood_reads_engine.media_item_model_classes:
             model_name = model_class.__name__.lower()
             if hasattr(self, model_name):
@@ -117,11 +169,81 @@ class BaseMediaItem(models.Model):
 
         return self
 
+    @classmethod
+    def get_children(
+        cls, media_items: Iterable["BaseMediaItem"], *lookups: _Lookup
+    ) -> list["BaseMediaItem"]:
+        """
+        Like get_child(), but for many MediaItems at once.
+
+        Children that were already loaded with select_related() are used as they are.
+        The rest are fetched with at most one query per media type. "lookups" are
+        prefetched on the children of each media type that has them.
+        """
+        from supergood_reads.utils.engine import supergood_reads_engine
+
+        media_items = list(media_items)
+        children: dict[Any, BaseMediaItem] = {}
+        unloaded: dict[type[BaseMediaItem], list[Any]] = {}
+
+        for media_item in media_items:
+            if type(media_item) is not BaseMediaItem:
+                children[media_item.pk] = media_item
+                continue
+            child_model_class = media_item.child_model_class
+            if child_model_class is BaseMediaItem:
+                children[media_item.pk] = media_item
+                continue
+            fields_cache = media_item._state.fields_cache
+            model_classes = (
+                [child_model_class]
+                if child_model_class
+                else supergood_reads_engine.media_item_model_classes
+            )
+            for model_class in model_classes:
+                model_name = model_class.__name__.lower()
+                if model_name not in fields_cache:
+                    unloaded.setdefault(model_class, []).append(media_item.pk)
+                elif fields_cache[model_name] is not None:
+                    children[media_item.pk] = fields_cache[model_name]
+                    break
+
+        for model_class, pks in unloaded.items():
+            pks = [pk for pk in pks if pk not in children]
+            if pks:
+                children.update(model_class.objects.in_bulk(pks))
+
+        results = [
+            children.get(media_item.pk, media_item) for media_item in media_items
+        ]
+        if lookups:
+            by_type: dict[type[BaseMediaItem], list[BaseMediaItem]] = {}
+            for child in results:
+                by_type.setdefault(type(child), []).append(child)
+            for model_class, group in by_type.items():
+                model_lookups = [
+                    lookup for lookup in lookups if cls._has_lookup(model_class, lookup)
+                ]
+                if model_lookups:
+                    prefetch_related_objects(group, *model_lookups)
+        return results
+
+    @staticmethod
+    def _has_lookup(model_class: type["BaseMediaItem"], lookup: _Lookup) -> bool:
+        path = lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
+        try:
+            model_class._meta.get_field(path.split(LOOKUP_SEP)[0])
+        except FieldDoesNotExist:
+            return False
+        return True
+
     def save(self, *args: Any, **kwargs: Any) -> None:
         self.clean()
         now = timezone.now()
         if self._state.adding:
             self.created_at = now
+        if self.content_type_id is None:
+            self.content_type = ContentType.objects.get_for_model(self)
         self.updated_at = now
         super().save(*args, **kwargs)
 
@@ -163,8 +285,10 @@ class Book(BaseMediaItem, GenreMixin):
 
     @classmethod
     def icon(cls) -> SafeText:
-        value = render_to_string("supergood_reads/components/svg/book.html")
-        return format_html("<span class='text-xs text-cyan-500'>{}</span>", value)
+        return render_fragment(
+            "supergood_reads/components/svg/book.html",
+            "<span class='text-xs text-cyan-500'>{}</span>",
+        )
 
     @classmethod
     def autocomplete_label(cls) -> Any:
@@ -216,8 +340,10 @@ class Film(BaseMediaItem, GenreMixin, CountryMixin):
 
     @classmethod
     def icon(cls) -> SafeText:
-        value = render_to_string("supergood_reads/components/svg/film.html")
-        return format_html("<span class='text-xs text-cyan-500'>{}</span>", value)
+        return render_fragment(
+            "supergood_reads/components/svg/film.html",
+            "<span class='text-xs text-cyan-500'>{}</span>",
+        )
 
     @classmethod
     def autocomplete_label(cls) -> Any:
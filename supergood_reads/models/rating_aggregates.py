@@ -0,0 +1,206 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Iterable, Optional
+
+from django.db import models, transaction
+from django.db.models import Count, F, Max, Q, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from supergood_reads.models.media_items import BaseMediaItem
+from supergood_reads.models.review import Review
+
+# Review.score is bucketed into five histogram bars: [0, 20), [20, 40), ... [80, 100].
+BUCKET_WIDTH = 20
+BUCKET_FIELDS = ("bucket_1", "bucket_2", "bucket_3", "bucket_4", "bucket_5")
+
+
+def bucket_field(score: Decimal) -> str:
+    index = min(int(score // BUCKET_WIDTH), len(BUCKET_FIELDS) - 1)
+    return BUCKET_FIELDS[max(index, 0)]
+
+
+def score_bucket_counts() -> dict[str, Count]:
+    """Aggregates that count the Reviews with a Review.score in each bucket."""
+    return {
+        field: Count(
+            "pk",
+            filter=Q(
+                score__gte=i * BUCKET_WIDTH,
+                **(
+                    {"score__lt": (i + 1) * BUCKET_WIDTH}
+                    if i < len(BUCKET_FIELDS) - 1
+                    else {}
+                ),
+            ),
+        )
+        for i, field in enumerate(BUCKET_FIELDS)
+    }
+
+
+def rating_aggregates_changed() -> None:
+    """Expire cached responses that include rating aggregates, such as search's."""
+    # The catalog utils import the models.
+    from supergood_reads.utils.catalog import bump_ratings_version
+
+    bump_ratings_version()
+
+
+class MediaItemRatingAggregateManager(models.Manager["MediaItemRatingAggregate"]):
+    def adjust(
+        self,
+        media_item_id: uuid.UUID,
+        reviews: int = 0,
+        added_score: Optional[Decimal] = None,
+        removed_score: Optional[Decimal] = None,
+        reviewed_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Apply the change made by adding, removing or rescoring Reviews of one MediaItem
+        with a single UPDATE of F() expressions, so that concurrent writes don't lose
+        each other's changes.
+        """
+        deltas: dict[str, Any] = {}
+        if reviews:
+            deltas["review_count"] = reviews
+        if added_score is not None:
+            deltas["score_count"] = deltas.get("score_count", 0) + 1
+            deltas["score_sum"] = deltas.get("score_sum", 0) + added_score
+            field = bucket_field(added_score)
+            deltas[field] = deltas.get(field, 0) + 1
+        if removed_score is not None:
+            deltas["score_count"] = deltas.get("score_count", 0) - 1
+            deltas["score_sum"] = deltas.get("score_sum", 0) - removed_score
+            field = bucket_field(removed_score)
+            deltas[field] = deltas.get(field, 0) - 1
+
+        updates: dict[str, Any] = {
+            field: F(field) + delta for field, delta in deltas.items() if delta
+        }
+        if reviewed_at is not None:
+            updates["last_reviewed_at"] = Greatest(
+                Coalesce(F("last_reviewed_at"), Value(reviewed_at)), Value(reviewed_at)
+            )
+        if not updates:
+            return
+
+        qs = self.filter(media_item_id=media_item_id)
+        # Once a MediaItem has an aggregate, this is the only write.
+        updated = qs.update(**updates)
+        # Removals never create an aggregate. When a MediaItem is deleted along with
+        # its Reviews, its aggregate may already be gone.
+        if not updated and (reviews > 0 or added_score is not None):
+            with transaction.atomic():
+                self.get_or_create(media_item_id=media_item_id)
+                qs.update(**updates)
+        if reviews < 0:
+            # The latest Review might be the one that's gone.
+            qs.update(last_reviewed_at=self.latest_review_subquery(media_item_id))
+        rating_aggregates_changed()
+
+    def latest_review_subquery(self, media_item_id: uuid.UUID) -> Any:
+        return models.Subquery(
+            Review.objects.filter(media_item_object_id=media_item_id)
+            .order_by("-created_at")
+            .values("created_at")[:1]
+        )
+
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """
+        Replace every aggregate with one computed from the current Reviews. MediaItems
+        are processed "batch_size" at a time, in one transaction and one grouped query
+        per batch. Returns the number of aggregates written.
+        """
+        self.all().delete()
+        count = 0
+        ids = BaseMediaItem.objects.order_by("pk").values_list("pk", flat=True)
+        last_id = None
+        while True:
+            batch_ids = list(
+                (ids if last_id is None else ids.filter(pk__gt=last_id))[:batch_size]
+            )
+            if not batch_ids:
+                rating_aggregates_changed()
+                return count
+            with transaction.atomic():
+                aggregates = self.compute(batch_ids)
+                self.bulk_create(aggregates, batch_size=batch_size)
+            count += len(aggregates)
+            last_id = batch_ids[-1]
+
+    def refresh(self, media_item_ids: Iterable[uuid.UUID]) -> None:
+        """
+        Recompute the aggregates of "media_item_ids" in one grouped query and replace
+        them in one transaction, for Reviews written without signals, as by
+        bulk_create().
+        """
+        media_item_ids = list(media_item_ids)
+        with transaction.atomic(savepoint=False):
+            aggregates = self.compute(media_item_ids)
+            self.filter(media_item__in=media_item_ids).delete()
+            self.bulk_create(aggregates)
+        rating_aggregates_changed()
+
+    def compute(
+        self, media_item_ids: Iterable[uuid.UUID]
+    ) -> list["MediaItemRatingAggregate"]:
+        """Aggregate the Reviews of "media_item_ids" from scratch."""
+        rows = (
+            Review.objects.filter(media_item_object_id__in=media_item_ids)
+            .order_by()
+            .values("media_item_object_id")
+            .annotate(
+                review_count=Count("pk"),
+                score_count=Count("score"),
+                score_sum=Coalesce(Sum("score"), Value(Decimal(0))),
+                last_reviewed_at=Max("created_at"),
+                **score_bucket_counts(),
+            )
+        )
+        return [
+            self.model(media_item_id=row.pop("media_item_object_id"), **row)
+            for row in rows
+        ]
+
+
+class MediaItemRatingAggregate(models.Model):
+    """
+    Review count, rating average and rating histogram of a MediaItem.
+
+    Kept current incrementally by the signal receivers in
+    "supergood_reads.utils.rating_aggregates", so that reading them never has to touch
+    Reviews or Strategies. Rebuild them with "supergood_reads_rebuild_rating_aggregates".
+    """
+
+    media_item = models.OneToOneField(
+        BaseMediaItem,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="rating_aggregate",
+    )
+    review_count = models.PositiveIntegerField(default=0)
+    # Number and sum of the Reviews that have a Review.score.
+    score_count = models.PositiveIntegerField(default=0)
+    score_sum = models.DecimalField(max_digits=12, decimal_places=1, default=0)
+    # Number of scores in each of the histogram buckets. See BUCKET_FIELDS.
+    bucket_1 = models.PositiveIntegerField(default=0)
+    bucket_2 = models.PositiveIntegerField(default=0)
+    bucket_3 = models.PositiveIntegerField(default=0)
+    bucket_4 = models.PositiveIntegerField(default=0)
+    bucket_5 = models.PositiveIntegerField(default=0)
+    last_reviewed_at = models.DateTimeField(blank=True, null=True)
+
+    objects = MediaItemRatingAggregateManager()
+
+    def __str__(self) -> str:
+        return str(self.media_item_id)
+
+    @property
+    def average_score(self) -> Optional[Decimal]:
+        if not self.score_count:
+            return None
+        return (Decimal(self.score_sum) / self.score_count).quantize(Decimal("0.1"))
+
+    @property
+    def histogram(self) -> list[int]:
+        return [getattr(self, field) for field in BUCKET_FIELDS]
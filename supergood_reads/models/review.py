@@ -1,13 +1,16 @@
 import uuid
 from datetime import datetime
-from typing import Any
+from decimal import Decimal
+from typing import Any, Optional
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models import prefetch_related_objects
 from django.utils import timezone
 
 from supergood_reads.models.review_strategies import AbstractReviewStrategy
@@ -17,10 +20,69 @@ class ReviewQuerySet(models.QuerySet["Review"]):
     def with_generic_relations(self) -> models.QuerySet["Review"]:
         return self.prefetch_related("strategy", "media_item")
 
+    def update_scores(self, batch_size: int = 1000) -> int:
+        """
+        Recompute the score of every Review in this QuerySet, "batch_size" Reviews and
+        one transaction at a time, loading each batch's Strategies with one query per
+        Strategy type. Returns the number of Reviews updated.
+        """
+        count = 0
+        qs = self.order_by("pk").only(
+            "pk",
+            "strategy_content_type",
+            "strategy_object_id",
+            "strategy_data",
+            "score",
+        )
+        last_pk = None
+        while True:
+            batch_qs = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+            batch = list(batch_qs[:batch_size])
+            if not batch:
+                return count
+            prefetch_related_objects(batch, "strategy")
+            for review in batch:
+                review.score = review.strategy_score()
+            with transaction.atomic():
+                self.model.objects.bulk_update(batch, ["score"])
+            count += len(batch)
+            last_pk = batch[-1].pk
+
 
 ReviewManager = models.Manager.from_queryset(ReviewQuerySet)
 
 
+class StrategyForeignKey(GenericForeignKey):
+    """
+    The Strategy of a Review: a row of the Strategy's own table, or an unsaved
+    Strategy built from Review.strategy_data when that is set. Either way, its type is
+    Review.strategy_content_type. See "supergood_reads.utils.strategy_storage".
+    """
+
+    def __get__(self, instance: Any, cls: Any = None) -> Any:
+        if (
+            instance is None
+            or instance.strategy_data is None
+            or instance.strategy_content_type_id is None
+        ):
+            return super().__get__(instance, cls)
+        model_class = ContentType.objects.get_for_id(
+            instance.strategy_content_type_id
+        ).model_class()
+        if model_class is None or not issubclass(model_class, AbstractReviewStrategy):
+            return None
+        rel_obj = self.get_cached_value(instance, default=None)
+        if type(rel_obj) is not model_class:
+            rel_obj = model_class.from_data(instance.strategy_data)
+            self.set_cached_value(instance, rel_obj)
+        return rel_obj
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        # Assigning a Strategy links to its row.
+        instance.strategy_data = None
+        super().__set__(instance, value)
+
+
 class Review(models.Model):
     """Entry Class for generating a User Review.
 
@@ -44,6 +106,10 @@ class Review(models.Model):
     completed_at_year = models.IntegerField(blank=True, null=True)
     text = models.TextField(default="", blank=True)
     validated = models.BooleanField(default=False, db_index=True)
+    # The Strategy's rating from 0 to 100. See AbstractReviewStrategy.normalized_score.
+    score = models.DecimalField(
+        max_digits=4, decimal_places=1, blank=True, null=True, db_index=True
+    )
 
     # Allow reviews of any Strategy type
     strategy_content_type = models.ForeignKey(
@@ -54,7 +120,9 @@ class Review(models.Model):
         null=True,
     )
     strategy_object_id = models.UUIDField(blank=True, null=True)  # noqa: DJ01
-    strategy = GenericForeignKey("strategy_content_type", "strategy_object_id")
+    # The Strategy's field values, when it isn't stored in its own table.
+    strategy_data = models.JSONField(blank=True, null=True, encoder=DjangoJSONEncoder)
+    strategy = StrategyForeignKey("strategy_content_type", "strategy_object_id")
 
     # Allow reviews for any media_item
     media_item_content_type = models.ForeignKey(
@@ -115,6 +183,11 @@ class Review(models.Model):
                 "%d %m %Y",
             ).strftime("%d %b %Y")
 
+    def strategy_score(self) -> Optional[Decimal]:
+        if isinstance(self.strategy, AbstractReviewStrategy):
+            return self.strategy.normalized_score
+        return None
+
     @property
     def rating_html(self) -> str:
         if self.strategy:
@@ -170,4 +243,5 @@ class Review(models.Model):
         if self._state.adding:
             self.created_at = now
         self.updated_at = now
+        self.score = self.strategy_score()
         super().save(*args, **kwargs)
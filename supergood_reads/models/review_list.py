@@ -0,0 +1,235 @@
+from typing import Any, Self
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser, User
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.utils.safestring import SafeText
+
+from supergood_reads.models.media_items import BaseMediaItem
+from supergood_reads.models.review import Review, ReviewQuerySet
+from supergood_reads.models.review_strategies import AbstractReviewStrategy
+from supergood_reads.utils.pagination import invalidate_counts
+
+
+class ReviewListEntryQuerySet(models.QuerySet["ReviewListEntry"]):
+    def visible_to(self, user: User | AnonymousUser) -> Self:
+        """
+        Staff that can change any Review see every entry, signed in users see their
+        own and everyone else sees validated ones.
+        """
+        if user.has_perm("supergood_reads.change_review"):
+            return self
+        elif user.is_authenticated:
+            return self.filter(owner=user)
+        else:
+            return self.filter(validated=True)
+
+
+class ReviewListEntryManager(models.Manager["ReviewListEntry"]):
+    def get_queryset(self) -> ReviewListEntryQuerySet:
+        return ReviewListEntryQuerySet(self.model, using=self._db)
+
+    def update_for(self, review: Review, created: bool = False) -> None:
+        """
+        Create or refresh the entry for a single Review, with one write when "created"
+        says whether the Review is new.
+        """
+        fields = self.model.fields_for(review)
+        if created or not self.updated(
+            self.filter(review_id=review.pk).update(**fields)
+        ):
+            self.create(review_id=review.pk, **fields)
+
+    def update_for_media_item(self, media_item: BaseMediaItem) -> int:
+        """Copy a MediaItem's title, year and creator to the entries of its Reviews."""
+        return self.updated(
+            self.filter(media_item_object_id=media_item.pk).update(
+                **self.model.media_item_fields_for(media_item)
+            )
+        )
+
+    def update_for_strategy(self, strategy: AbstractReviewStrategy) -> int:
+        """Copy a Strategy's rating to the entry of its Review."""
+        return self.updated(
+            self.filter(strategy_object_id=strategy.pk).update(
+                **self.model.strategy_fields_for(strategy)
+            )
+        )
+
+    def clear_strategy(self, strategy_id: Any) -> int:
+        return self.updated(
+            self.filter(strategy_object_id=strategy_id).update(
+                rating_html="", rating=None, rating_max=None
+            )
+        )
+
+    def updated(self, count: int) -> int:
+        """
+        Invalidate the cached counts of entries after "count" were written with
+        update(), which sends no signal.
+        """
+        if count:
+            invalidate_counts(self.model)
+        return count
+
+    @transaction.atomic
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """
+        Replace every entry with one built from the current Reviews. Returns the number
+        of entries written.
+        """
+        self.all().delete()
+        return self.write_for(Review.objects.using(self.db).all(), batch_size)
+
+    def write_for(self, reviews: ReviewQuerySet, batch_size: int) -> int:
+        """
+        Replace the entries of "reviews", "batch_size" Reviews and one transaction at a
+        time. Returns the number of entries written.
+        """
+        count = 0
+        qs = reviews.with_generic_relations().order_by("pk")
+        last_pk = None
+        while True:
+            batch_qs = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+            batch = list(batch_qs[:batch_size])
+            if not batch:
+                # bulk_create() sends no signal.
+                invalidate_counts(self.model)
+                return count
+            with transaction.atomic(using=self.db):
+                self.filter(review_id__in=[review.pk for review in batch]).delete()
+                self.bulk_create(
+                    [
+                        self.model(review_id=review.pk, **self.model.fields_for(review))
+                        for review in batch
+                    ]
+                )
+            count += len(batch)
+            last_pk = batch[-1].pk
+
+
+class ReviewListEntry(models.Model):
+    """
+    Everything a row of the review list displays, with one row per Review.
+
+    Listing reviews from the entries is a scan of one table, with no generic relations
+    to prefetch and nothing to format or render per row. Entries are kept current by
+    the signal receivers in "supergood_reads.utils.review_list" and can be rebuilt from
+    scratch with the "supergood_reads_rebuild_review_list" command.
+    """
+
+    review = models.OneToOneField(
+        Review, on_delete=models.CASCADE, primary_key=True, related_name="list_entry"
+    )
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True
+    )
+    validated = models.BooleanField(default=False)
+    media_item_content_type = models.ForeignKey(
+        ContentType, on_delete=models.CASCADE, null=True, related_name="+"
+    )
+    media_item_object_id = models.UUIDField(null=True, db_index=True)  # noqa: DJ01
+    strategy_object_id = models.UUIDField(null=True, db_index=True)  # noqa: DJ01
+    title = models.CharField(default="", max_length=256)
+    year = models.IntegerField(blank=True, null=True)
+    creator = models.CharField(default="", max_length=256)
+    completed_at = models.CharField(default="", max_length=16)
+    rating_html = models.TextField(default="", blank=True)
+    # The Strategy's numeric rating, out of "rating_max".
+    rating = models.DecimalField(max_digits=4, decimal_places=1, blank=True, null=True)
+    rating_max = models.DecimalField(
+        max_digits=4, decimal_places=1, blank=True, null=True
+    )
+    text = models.TextField(default="", blank=True)
+    # Orders entries like Review.Meta.ordering, newest first, in one indexed column.
+    # See sort_key_for().
+    sort_key = models.CharField(max_length=64, unique=True)
+
+    objects = ReviewListEntryManager()
+
+    class Meta:
+        ordering = ("-sort_key",)
+        verbose_name_plural = "review list entries"
+        indexes = [
+            models.Index(fields=["owner", "-sort_key"], name="review_list_owner_idx"),
+            models.Index(
+                fields=["validated", "-sort_key"],
+                name="review_list_validated_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return self.title
+
+    @property
+    def icon(self) -> SafeText:
+        if self.media_item_content_type_id is None:
+            return SafeText("")
+        model_class = ContentType.objects.get_for_id(
+            self.media_item_content_type_id
+        ).model_class()
+        if model_class is None or not issubclass(model_class, BaseMediaItem):
+            return SafeText("")
+        return model_class.icon()
+
+    @classmethod
+    def fields_for(cls, review: Review) -> dict[str, Any]:
+        media_item = review.media_item
+        strategy = review.strategy
+        fields: dict[str, Any] = {
+            "owner_id": review.owner_id,
+            "validated": review.validated,
+            "media_item_object_id": review.media_item_object_id,
+            "strategy_object_id": review.strategy_object_id,
+            "completed_at": review.completed_at,
+            "text": review.text,
+            "sort_key": cls.sort_key_for(review),
+        }
+        if isinstance(strategy, AbstractReviewStrategy):
+            fields.update(cls.strategy_fields_for(strategy))
+        else:
+            fields.update(rating_html="", rating=None, rating_max=None)
+        if isinstance(media_item, BaseMediaItem):
+            fields.update(cls.media_item_fields_for(media_item))
+        else:
+            fields.update(media_item_content_type=None, title="", year=None, creator="")
+        return fields
+
+    @staticmethod
+    def media_item_fields_for(media_item: BaseMediaItem) -> dict[str, Any]:
+        if type(media_item) is BaseMediaItem:
+            media_item = media_item.get_child()
+        try:
+            creator = media_item.creator
+        except NotImplementedError:
+            creator = ""
+        return {
+            "media_item_content_type": ContentType.objects.get_for_model(media_item),
+            "title": media_item.title,
+            "year": media_item.year,
+            "creator": creator or "",
+        }
+
+    @staticmethod
+    def strategy_fields_for(strategy: AbstractReviewStrategy) -> dict[str, Any]:
+        return {
+            "rating_html": strategy.rating_html,
+            "rating": strategy.rating,
+            "rating_max": strategy.rating_max,
+        }
+
+    @staticmethod
+    def sort_key_for(review: Review) -> str:
+        """
+        "YYYYMMDD:<created_at>:<id>" from the completion date, with missing parts as
+        zeros, so that Reviews without a completion date sort after those with one.
+        The id makes every key unique.
+        """
+        return (
+            f"{review.completed_at_year or 0:04d}"
+            f"{review.completed_at_month or 0:02d}"
+            f"{review.completed_at_day or 0:02d}"
+            f":{review.created_at:%Y%m%d%H%M%S%f}"
+            f":{review.pk.hex}"
+        )
@@ -1,14 +1,28 @@
 import math
 import uuid
 from decimal import Decimal
+from typing import Any, ClassVar, Optional, Self
 
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.template.loader import render_to_string
 from django.utils.html import format_html
 from django.utils.safestring import SafeText
 
+from supergood_reads.utils.fragments import render_fragment
+
+
+def data_fields(model: type[models.Model]) -> list[models.Field[Any, Any]]:
+    """The concrete fields of "model" that are stored on Review.strategy_data."""
+    return [
+        field
+        for field in model._meta.get_fields()
+        if isinstance(field, models.Field)
+        and field.concrete
+        and not field.many_to_many
+        and not field.primary_key
+    ]
+
 
 class AbstractReviewStrategy(models.Model):
     """
@@ -17,10 +31,18 @@ class AbstractReviewStrategy(models.Model):
     Subclasses can add any fields they want.
     But they must implement:
     - "rating_html" property for rendering with "reviews" table
+    - "rating" property and "rating_max", for APIs that want a number instead
+    And can override "normalized_score" if their rating doesn't scale linearly to 100.
+
+    Strategies are either rows of their own tables or, with JsonStrategyStorage, field
+    values on Review.strategy_data. See "to_data" and "from_data".
     """
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
+    # The highest "rating" this Strategy can give.
+    rating_max: ClassVar[Decimal] = Decimal(1)
+
     class Meta:
         abstract = True
 
@@ -28,6 +50,47 @@ class AbstractReviewStrategy(models.Model):
     def rating_html(self) -> SafeText:
         return format_html("")
 
+    @property
+    def rating(self) -> Optional[Decimal]:
+        """The rating as a number from 0 to "rating_max", or None if there isn't one."""
+        return None
+
+    @property
+    def normalized_score(self) -> Optional[Decimal]:
+        """
+        The rating from 0 to 100, so that Reviews with different Strategies can be
+        sorted and aggregated together. Stored on Review.score.
+        """
+        rating = self.rating
+        if rating is None:
+            return None
+        return (Decimal(100) * rating / self.rating_max).quantize(Decimal("0.1"))
+
+    def to_data(self) -> dict[str, Any]:
+        """The Strategy's field values, other than its id, for Review.strategy_data."""
+        return {
+            field.attname: field.value_from_object(self)
+            for field in data_fields(type(self))
+        }
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> Self:
+        """An unsaved Strategy with the field values of Review.strategy_data."""
+        fields = {field.attname: field for field in data_fields(cls)}
+        return cls(
+            **{
+                name: fields[name].to_python(value)
+                for name, value in data.items()
+                if name in fields
+            }
+        )
+
+
+def half_stars(lowest: Decimal, highest: Decimal) -> list[Decimal]:
+    """Every multiple of 0.5 from "lowest" to "highest", inclusive."""
+    steps = int((highest - lowest) * 2)
+    return [lowest + Decimal("0.5") * step for step in range(steps + 1)]
+
 
 def ebert_star_validator(value: Decimal) -> None:
     """Ensure that star rating is valid."""
@@ -58,21 +121,40 @@ class EbertStrategy(AbstractReviewStrategy):
     )
     goat = models.BooleanField(default=False, null=False)
 
+    rating_max = Decimal(4)
+
     class Meta:
         verbose_name = "Ebert"
 
     @property
-    def rating_html(self) -> SafeText:
+    def rating(self) -> Optional[Decimal]:
+        return self.stars
+
+    @property
+    def normalized_score(self) -> Optional[Decimal]:
         if self.goat:
+            return Decimal(100)
+        return super().normalized_score
+
+    @property
+    def rating_html(self) -> SafeText:
+        rating_html = EBERT_RATING_HTML.get((self.stars, self.goat))
+        if rating_html is None:
+            rating_html = self.render_rating_html(self.stars, self.goat)
+        return rating_html
+
+    @staticmethod
+    def render_rating_html(stars: Decimal | None, goat: bool) -> SafeText:
+        if goat:
             value = "GOAT"
             return format_html("<span class='goat-font text-gray-900'>{}</span>", value)
-        elif self.stars is None:
+        elif stars is None:
             value = "No Star Rating"
-        elif self.stars == Decimal("0.0"):
+        elif stars == Decimal("0.0"):
             value = "Zero Stars"
         else:
-            star_count = math.floor(self.stars)
-            remainder = self.stars % 1
+            star_count = math.floor(stars)
+            remainder = stars % 1
             value = "★" * star_count
             if remainder:
                 value += "½"
@@ -90,13 +172,26 @@ class GoodreadsStrategy(AbstractReviewStrategy):
         null=False, validators=[MinValueValidator(1), MaxValueValidator(5)]
     )
 
+    rating_max = Decimal(5)
+
     class Meta:
         verbose_name = "Goodreads"
 
+    @property
+    def rating(self) -> Optional[Decimal]:
+        return Decimal(self.stars)
+
     @property
     def rating_html(self) -> SafeText:
-        stars = "★" * self.stars
-        remainder = 5 - self.stars
+        rating_html = GOODREADS_RATING_HTML.get(self.stars)
+        if rating_html is None:
+            rating_html = self.render_rating_html(self.stars)
+        return rating_html
+
+    @staticmethod
+    def render_rating_html(star_count: int) -> SafeText:
+        stars = "★" * star_count
+        remainder = 5 - star_count
         empty_stars = "★" * remainder
         return format_html(
             "<span class='text-orange-500'>{}</span><span class='text-slate-200'>{}</span>",
@@ -116,9 +211,15 @@ class ImdbStrategy(AbstractReviewStrategy):
         null=False, validators=[MinValueValidator(1), MaxValueValidator(10)]
     )
 
+    rating_max = Decimal(10)
+
     class Meta:
         verbose_name = "IMDB"
 
+    @property
+    def rating(self) -> Optional[Decimal]:
+        return Decimal(self.score)
+
     @property
     def rating_html(self) -> SafeText:
         return format_html(
@@ -151,13 +252,26 @@ class LetterboxdStrategy(AbstractReviewStrategy):
         validators=[letterboxd_star_validator],
     )
 
+    rating_max = Decimal(5)
+
     class Meta:
         verbose_name = "Letterboxd"
 
+    @property
+    def rating(self) -> Optional[Decimal]:
+        return self.stars
+
     @property
     def rating_html(self) -> SafeText:
-        star_count = math.floor(self.stars)
-        remainder = self.stars % 1
+        rating_html = LETTERBOXD_RATING_HTML.get(self.stars)
+        if rating_html is None:
+            rating_html = self.render_rating_html(self.stars)
+        return rating_html
+
+    @staticmethod
+    def render_rating_html(stars: Decimal) -> SafeText:
+        star_count = math.floor(stars)
+        remainder = stars % 1
         value = "★" * star_count
         if remainder:
             value += "½"
@@ -175,14 +289,19 @@ class ThumbsStrategy(AbstractReviewStrategy):
     class Meta:
         verbose_name = "Thumbs"
 
+    @property
+    def rating(self) -> Optional[Decimal]:
+        return Decimal(self.recommended)
+
     @property
     def rating_html(self) -> SafeText:
         if self.recommended:
             template_name = "supergood_reads/components/svg/thumbs_up.html"
         else:
             template_name = "supergood_reads/components/svg/thumbs_down.html"
-        value = render_to_string(template_name)
-        return format_html("<span class='text-emerald-600'>{}</span>", value)
+        return render_fragment(
+            template_name, "<span class='text-emerald-600'>{}</span>"
+        )
 
 
 class TomatoStrategy(AbstractReviewStrategy):
@@ -193,11 +312,32 @@ class TomatoStrategy(AbstractReviewStrategy):
     class Meta:
         verbose_name = "Tomatoes"
 
+    @property
+    def rating(self) -> Optional[Decimal]:
+        return Decimal(self.fresh)
+
     @property
     def rating_html(self) -> SafeText:
         if self.fresh:
             return format_html("<span>🍅</span>")
         else:
-            template_name = "supergood_reads/components/svg/rotten.html"
-            value = render_to_string(template_name)
-            return format_html("<span class='text-lime-700'>{}</span>", value)
+            return render_fragment(
+                "supergood_reads/components/svg/rotten.html",
+                "<span class='text-lime-700'>{}</span>",
+            )
+
+
+# The rating_html of every valid rating, built once so that rendering a list of
+# reviews only has to look each one up.
+EBERT_RATING_HTML: dict[tuple[Decimal | None, bool], SafeText] = {
+    (stars, goat): EbertStrategy.render_rating_html(stars, goat)
+    for stars in [None, *half_stars(Decimal("0"), Decimal("4"))]
+    for goat in (False, True)
+}
+GOODREADS_RATING_HTML: dict[int, SafeText] = {
+    stars: GoodreadsStrategy.render_rating_html(stars) for stars in range(6)
+}
+LETTERBOXD_RATING_HTML: dict[Decimal, SafeText] = {
+    stars: LetterboxdStrategy.render_rating_html(stars)
+    for stars in half_stars(Decimal("0.5"), Decimal("5"))
+}
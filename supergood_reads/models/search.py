@@ -0,0 +1,183 @@
+from typing import Any, Iterable, Self
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+
+from supergood_reads.models.media_items import BaseMediaItem, GenreMixin
+
+
+class MediaItemSearchDocumentQuerySet(models.QuerySet["MediaItemSearchDocument"]):
+    def with_any_genre(self, names: Iterable[str]) -> Self:
+        # A semi-join on the indexed genre names, which needs no DISTINCT.
+        return self.filter(
+            pk__in=MediaItemSearchDocumentGenre.objects.filter(
+                name__in=list(names)
+            ).values("document_id")
+        )
+
+
+class MediaItemSearchDocumentManager(models.Manager["MediaItemSearchDocument"]):
+    def get_queryset(self) -> MediaItemSearchDocumentQuerySet:
+        return MediaItemSearchDocumentQuerySet(self.model, using=self._db)
+
+    def update_for(self, media_item: BaseMediaItem) -> None:
+        """Create or refresh the document for a single MediaItem."""
+        if type(media_item) is BaseMediaItem:
+            media_item = media_item.get_child()
+        genres: list[str] = []
+        if issubclass(media_item.__class__, GenreMixin):  # type: ignore
+            genres = list(media_item.genres.values_list("name", flat=True))  # type: ignore
+        document, _ = self.update_or_create(
+            media_item_id=media_item.pk,
+            defaults=self.model.fields_for(media_item, genres),
+        )
+        rows = MediaItemSearchDocumentGenre.objects.filter(document=document)
+        rows.exclude(name__in=document.genres).delete()
+        if document.genres:
+            MediaItemSearchDocumentGenre.objects.bulk_create(
+                [
+                    MediaItemSearchDocumentGenre(document=document, name=name)
+                    for name in document.genres
+                ],
+                ignore_conflicts=True,
+            )
+
+    @transaction.atomic
+    def rebuild(self, batch_size: int = 1000) -> int:
+        """
+        Replace every document with one built from the current MediaItems. Returns the
+        number of documents written.
+        """
+        from supergood_reads.utils.engine import supergood_reads_engine
+
+        self.all().delete()
+        count = 0
+        for model_class in supergood_reads_engine.media_item_model_classes:
+            qs = model_class.objects.order_by("pk")
+            has_genres = issubclass(model_class, GenreMixin)
+            if has_genres:
+                qs = qs.prefetch_related("genres")
+
+            documents = []
+            for media_item in qs.iterator(chunk_size=batch_size):
+                genres = (
+                    [g.name for g in media_item.genres.all()]  # type: ignore
+                    if has_genres
+                    else []
+                )
+                documents.append(
+                    self.model(
+                        media_item_id=media_item.pk,
+                        **self.model.fields_for(media_item, genres),
+                    )
+                )
+                if len(documents) == batch_size:
+                    count += self.create_documents(documents)
+                    documents = []
+            count += self.create_documents(documents)
+        return count
+
+    def create_documents(self, documents: list["MediaItemSearchDocument"]) -> int:
+        """Insert new documents along with their genre rows."""
+        self.bulk_create(documents)
+        MediaItemSearchDocumentGenre.objects.bulk_create(
+            [
+                MediaItemSearchDocumentGenre(document=document, name=name)
+                for document in documents
+                for name in document.genres
+            ]
+        )
+        return len(documents)
+
+
+class MediaItemSearchDocument(models.Model):
+    """
+    Flat copy of the fields that the library search filters and orders by, with one
+    row per MediaItem.
+
+    Searching the documents needs no joins across the MediaItem child tables and no
+    DISTINCT. Documents are kept current by the signal receivers in
+    "supergood_reads.search.signals" and can be rebuilt from scratch with the
+    "supergood_reads_rebuild_search_documents" command.
+    """
+
+    media_item = models.OneToOneField(
+        BaseMediaItem,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="search_document",
+    )
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    title = models.CharField(default="", max_length=256)
+    creator = models.CharField(default="", max_length=256)
+    year = models.IntegerField(blank=True, null=True)
+    # Sorted genre names, for facet counts. Filtering by genre uses the indexed
+    # MediaItemSearchDocumentGenre rows instead.
+    genres = models.JSONField(default=list, blank=True)
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True
+    )
+    validated = models.BooleanField(default=False)
+    updated_at = models.DateTimeField()
+
+    objects = MediaItemSearchDocumentManager()
+
+    class Meta:
+        ordering = ("-updated_at",)
+        indexes = [
+            models.Index(
+                fields=["validated", "-updated_at"], name="search_doc_validated_idx"
+            ),
+            models.Index(fields=["owner", "-updated_at"], name="search_doc_owner_idx"),
+            models.Index(
+                fields=["content_type", "-updated_at"],
+                name="search_doc_content_type_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return self.title
+
+    @property
+    def genre_names(self) -> list[str]:
+        return list(self.genres)
+
+    @classmethod
+    def fields_for(cls, media_item: BaseMediaItem, genres: list[str]) -> dict[str, Any]:
+        try:
+            creator = media_item.creator
+        except NotImplementedError:
+            creator = ""
+        return {
+            "content_type": ContentType.objects.get_for_model(media_item),
+            "title": media_item.title,
+            "creator": creator or "",
+            "year": media_item.year,
+            "genres": sorted(genres),
+            "owner_id": media_item.owner_id,
+            "validated": media_item.validated,
+            "updated_at": media_item.updated_at,
+        }
+
+
+class MediaItemSearchDocumentGenre(models.Model):
+    """
+    One genre name of a search document. The unique constraint doubles as the index
+    that filtering by genre name uses.
+    """
+
+    document = models.ForeignKey(
+        MediaItemSearchDocument, on_delete=models.CASCADE, related_name="genre_rows"
+    )
+    name = models.CharField(max_length=256)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["name", "document"], name="search_doc_genre_unique"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return self.name
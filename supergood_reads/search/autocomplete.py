@@ -0,0 +1,254 @@
+import threading
+import time
+from typing import Any, Optional, Type, cast
+
+from django.db import connection
+from django.db.models import Case, Q, Value, When
+
+from supergood_reads.models import BaseMediaItem
+from supergood_reads.models.media_items import MediaItemQuerySet
+from supergood_reads.search.ngram import IndexEntry, NgramIndex
+from supergood_reads.search.prefix import PrefixIndex
+
+AutocompleteResult = dict[str, Any]
+
+AUTOCOMPLETE_FIELDS = ("id", "title", "autocomplete_label")
+
+
+def autocomplete_queryset(
+    model_class: Type[BaseMediaItem],
+) -> MediaItemQuerySet[BaseMediaItem]:
+    qs = cast(MediaItemQuerySet[BaseMediaItem], model_class.objects.all())
+    return qs.with_autocomplete_label()
+
+
+class BaseAutocompleteBackend:
+    """
+    Find the MediaItems of a single type whose titles match what a user has typed so
+    far.
+
+    Subclasses must implement "search". Backends that keep their own index can
+    override "media_item_saved" and "media_item_deleted", which are called after any
+    MediaItem write has been committed.
+    """
+
+    limit = 20
+
+    def search(
+        self, model_class: Type[BaseMediaItem], q: str
+    ) -> list[AutocompleteResult]:
+        raise NotImplementedError
+
+    def media_item_saved(self, instance: BaseMediaItem) -> None:
+        pass
+
+    def media_item_deleted(self, model_class: Type[BaseMediaItem], pk: Any) -> None:
+        pass
+
+
+class IContainsAutocompleteBackend(BaseAutocompleteBackend):
+    """Unindexed, unordered substring matching. Works on every database."""
+
+    def search(
+        self, model_class: Type[BaseMediaItem], q: str
+    ) -> list[AutocompleteResult]:
+        qs = autocomplete_queryset(model_class).filter(
+            title__icontains=q, validated=True
+        )
+        return list(qs.values(*AUTOCOMPLETE_FIELDS)[: self.limit])
+
+
+class WordPrefixAutocompleteBackend(BaseAutocompleteBackend):
+    """
+    Unindexed matching of titles with a word that starts with q, the same matches a
+    PrefixIndex finds. Titles that start with q come first. Works on every database.
+    """
+
+    def search(
+        self, model_class: Type[BaseMediaItem], q: str
+    ) -> list[AutocompleteResult]:
+        qs = (
+            autocomplete_queryset(model_class)
+            .filter(Q(title__istartswith=q) | Q(title__icontains=f" {q}"))
+            .filter(validated=True)
+            .annotate(
+                title_prefix=Case(
+                    When(title__istartswith=q, then=Value(0)), default=Value(1)
+                )
+            )
+            .order_by("title_prefix", "title")
+        )
+        return list(qs.values(*AUTOCOMPLETE_FIELDS)[: self.limit])
+
+
+class TrigramAutocompleteBackend(BaseAutocompleteBackend):
+    """
+    Typo-tolerant matching, ordered by trigram similarity.
+
+    On postgresql this uses the pg_trgm GIN index on "title". Everywhere else, each
+    MediaItem type gets an in-process NgramIndex of its validated titles, which is
+    built on first use and kept current by "media_item_saved" and
+    "media_item_deleted".
+    """
+
+    threshold = 0.3
+
+    def __init__(self) -> None:
+        self._indexes: dict[Type[BaseMediaItem], NgramIndex] = {}
+        self._lock = threading.Lock()
+
+    def search(
+        self, model_class: Type[BaseMediaItem], q: str
+    ) -> list[AutocompleteResult]:
+        if not q:
+            qs = autocomplete_queryset(model_class).filter(validated=True)
+            return list(qs.order_by("title").values(*AUTOCOMPLETE_FIELDS)[: self.limit])
+        if connection.vendor == "postgresql":
+            return self.search_postgres(model_class, q)
+        return self.search_index(model_class, q)
+
+    def search_postgres(
+        self, model_class: Type[BaseMediaItem], q: str
+    ) -> list[AutocompleteResult]:
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        # "trigram_similar" compares against pg_trgm.similarity_threshold, which
+        # defaults to 0.3.
+        qs = (
+            autocomplete_queryset(model_class)
+            .filter(validated=True, title__trigram_similar=q)
+            .annotate(similarity=TrigramSimilarity("title", q))
+            .order_by("-similarity", "title")
+        )
+        return list(qs.values(*AUTOCOMPLETE_FIELDS)[: self.limit])
+
+    def search_index(
+        self, model_class: Type[BaseMediaItem], q: str
+    ) -> list[AutocompleteResult]:
+        index = self.get_index(model_class)
+        with self._lock:
+            entries = index.search(q, limit=self.limit, threshold=self.threshold)
+        return [entry._asdict() for entry in entries]
+
+    def get_index(self, model_class: Type[BaseMediaItem]) -> NgramIndex:
+        with self._lock:
+            if model_class not in self._indexes:
+                index = NgramIndex()
+                qs = autocomplete_queryset(model_class).filter(validated=True)
+                rows = qs.values_list(*AUTOCOMPLETE_FIELDS)
+                index.build(IndexEntry(*row) for row in rows.iterator())
+                self._indexes[model_class] = index
+            return self._indexes[model_class]
+
+    def media_item_saved(self, instance: BaseMediaItem) -> None:
+        index = self._indexes.get(type(instance))
+        if index is None:
+            return
+
+        row = None
+        if instance.validated:
+            qs = autocomplete_queryset(type(instance)).filter(pk=instance.pk)
+            row = qs.values_list(*AUTOCOMPLETE_FIELDS).first()
+
+        with self._lock:
+            if row:
+                index.add(IndexEntry(*row))
+            else:
+                index.discard(instance.pk)
+
+    def media_item_deleted(self, model_class: Type[BaseMediaItem], pk: Any) -> None:
+        index = self._indexes.get(model_class)
+        if index is None:
+            return
+        with self._lock:
+            index.discard(pk)
+
+
+class PrefixAutocompleteBackend(BaseAutocompleteBackend):
+    """
+    Answer prefix queries from an in-process PrefixIndex of validated titles, without
+    touching the database.
+
+    Each MediaItem type gets its own index, built on first use and kept current by
+    "media_item_saved" and "media_item_deleted". Those hooks only see writes made by
+    this process, so indexes are also rebuilt once they're older than "max_age"
+    seconds.
+
+    At most "max_titles" of the most recently updated titles are indexed per type. If a
+    type has more titles than that, queries that the index can't fill are passed on to
+    "fallback_backend_class".
+    """
+
+    max_titles = 100_000
+    max_age: Optional[int] = 15 * 60
+    fallback_backend_class: Type[
+        BaseAutocompleteBackend
+    ] = WordPrefixAutocompleteBackend
+
+    def __init__(self) -> None:
+        self.fallback_backend = self.fallback_backend_class()
+        self._indexes: dict[Type[BaseMediaItem], PrefixIndex] = {}
+        self._built_at: dict[Type[BaseMediaItem], float] = {}
+        self._complete: dict[Type[BaseMediaItem], bool] = {}
+        self._lock = threading.Lock()
+
+    def search(
+        self, model_class: Type[BaseMediaItem], q: str
+    ) -> list[AutocompleteResult]:
+        index = self.get_index(model_class)
+        with self._lock:
+            entries = index.search(q, limit=self.limit)
+            complete = self._complete[model_class]
+        if len(entries) < self.limit and not complete:
+            return self.fallback_backend.search(model_class, q)
+        return [entry._asdict() for entry in entries]
+
+    def get_index(self, model_class: Type[BaseMediaItem]) -> PrefixIndex:
+        with self._lock:
+            built_at = self._built_at.get(model_class)
+            expired = built_at is None or (
+                self.max_age is not None and time.monotonic() - built_at > self.max_age
+            )
+            if expired:
+                self._build(model_class)
+            return self._indexes[model_class]
+
+    def _build(self, model_class: Type[BaseMediaItem]) -> None:
+        qs = autocomplete_queryset(model_class).filter(validated=True)
+        rows = list(
+            qs.order_by("-updated_at").values_list(*AUTOCOMPLETE_FIELDS)[
+                : self.max_titles + 1
+            ]
+        )
+        index = PrefixIndex()
+        index.build(IndexEntry(*row) for row in rows[: self.max_titles])
+        self._indexes[model_class] = index
+        self._complete[model_class] = len(rows) <= self.max_titles
+        self._built_at[model_class] = time.monotonic()
+
+    def media_item_saved(self, instance: BaseMediaItem) -> None:
+        self.fallback_backend.media_item_saved(instance)
+        index = self._indexes.get(type(instance))
+        if index is None:
+            return
+
+        row = None
+        if instance.validated:
+            qs = autocomplete_queryset(type(instance)).filter(pk=instance.pk)
+            row = qs.values_list(*AUTOCOMPLETE_FIELDS).first()
+
+        with self._lock:
+            if not row:
+                index.discard(instance.pk)
+            elif instance.pk in index or len(index) < self.max_titles:
+                index.add(IndexEntry(*row))
+            else:
+                self._complete[type(instance)] = False
+
+    def media_item_deleted(self, model_class: Type[BaseMediaItem], pk: Any) -> None:
+        self.fallback_backend.media_item_deleted(model_class, pk)
+        index = self._indexes.get(model_class)
+        if index is None:
+            return
+        with self._lock:
+            index.discard(pk)
@@ -0,0 +1,138 @@
+import re
+from typing import Optional, Sequence, Type, TypeVar
+
+from django.db import connection
+from django.db.models import Model, QuerySet
+from django.db.models.expressions import RawSQL
+
+from supergood_reads.search.sql import (
+    POSTGRES_SEARCH_CONFIG,
+    SEARCH_VECTOR_COLUMN,
+    fts_table_name,
+    has_fts5,
+    install_search_index,
+)
+
+_M = TypeVar("_M", bound=Model)
+
+
+def search_terms(q: str) -> list[str]:
+    """Split a search query into lowercase word tokens.
+
+    Anything that isn't a word character is dropped, which also makes the tokens safe
+    to interpolate into tsquery and FTS5 MATCH syntax.
+    """
+    return re.findall(r"\w+", q.lower())
+
+
+class BaseSearchBackend:
+    """
+    Filter a MediaItem queryset down to the rows matching a search query, ordered by
+    relevance.
+
+    Subclasses must implement "filter". Matching rows should be annotated with a
+    "search_rank", where a higher rank is a better match.
+    """
+
+    def search(self, qs: QuerySet[_M], q: str) -> QuerySet[_M]:
+        q = q.strip()
+        if not q:
+            return qs.order_by("-updated_at")
+        return self.filter(qs, q)
+
+    def filter(self, qs: QuerySet[_M], q: str) -> QuerySet[_M]:
+        raise NotImplementedError
+
+    def rebuild(self, model: Type[Model], columns: Sequence[str] = ("title",)) -> None:
+        """Repopulate the backend's index for a model, if it has one."""
+
+
+class IContainsSearchBackend(BaseSearchBackend):
+    """Unindexed substring matching. Works on every database."""
+
+    def filter(self, qs: QuerySet[_M], q: str) -> QuerySet[_M]:
+        return qs.filter(title__icontains=q).order_by("-updated_at")
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Match against the generated "search_vector" tsvector column, which is covered by a
+    GIN index. Every search term is treated as a prefix so that results keep up with
+    the user as they type.
+    """
+
+    def filter(self, qs: QuerySet[_M], q: str) -> QuerySet[_M]:
+        from django.contrib.postgres.search import (
+            SearchQuery,
+            SearchRank,
+            SearchVectorField,
+        )
+
+        terms = search_terms(q)
+        if not terms:
+            return qs.none()
+
+        table = qs.model._meta.db_table
+        vector = RawSQL(
+            f'"{table}"."{SEARCH_VECTOR_COLUMN}"', (), output_field=SearchVectorField()
+        )
+        query = SearchQuery(
+            " & ".join(f"{term}:*" for term in terms),
+            config=POSTGRES_SEARCH_CONFIG,
+            search_type="raw",
+        )
+        qs = (
+            qs.alias(search_vector=vector)
+            .filter(search_vector=query)
+            .annotate(search_rank=SearchRank(vector, query))
+        )
+        return qs.order_by("-search_rank", "-updated_at")
+
+
+class SqliteFTS5SearchBackend(BaseSearchBackend):
+    """
+    Match against an FTS5 virtual table that shadows the model's table. Intended for
+    small and test deployments.
+    """
+
+    def filter(self, qs: QuerySet[_M], q: str) -> QuerySet[_M]:
+        terms = search_terms(q)
+        if not terms:
+            return qs.none()
+
+        table = qs.model._meta.db_table
+        pk = qs.model._meta.pk
+        assert pk is not None
+        pk_column = pk.column
+        fts_table = fts_table_name(table)
+        match = " ".join(f'"{term}"*' for term in terms)
+
+        matching_ids = RawSQL(
+            f'SELECT t."{pk_column}" FROM "{fts_table}" '
+            f'INNER JOIN "{table}" t ON t.rowid = "{fts_table}".rowid '
+            f'WHERE "{fts_table}" MATCH %s',
+            (match,),
+        )
+        # bm25() scores better matches with lower numbers.
+        rank = RawSQL(
+            f'SELECT -bm25("{fts_table}") FROM "{fts_table}" '
+            f'WHERE "{fts_table}".rowid = "{table}".rowid '
+            f'AND "{fts_table}" MATCH %s',
+            (match,),
+        )
+        qs = qs.filter(pk__in=matching_ids).annotate(search_rank=rank)
+        return qs.order_by("-search_rank", "-updated_at")
+
+    def rebuild(self, model: Type[Model], columns: Sequence[str] = ("title",)) -> None:
+        with connection.schema_editor() as schema_editor:
+            install_search_index(schema_editor, model._meta.db_table, columns)
+
+
+def default_search_backend_class() -> Type[BaseSearchBackend]:
+    """Choose the indexed backend that matches the default database."""
+    backend_class: Optional[Type[BaseSearchBackend]] = None
+    if connection.vendor == "postgresql":
+        backend_class = PostgresSearchBackend
+    elif connection.vendor == "sqlite" and has_fts5(connection):
+        backend_class = SqliteFTS5SearchBackend
+    return backend_class or IContainsSearchBackend
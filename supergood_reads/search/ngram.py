@@ -0,0 +1,96 @@
+import heapq
+import re
+from array import array
+from collections import Counter
+from typing import Any, Iterable, NamedTuple, Optional
+
+
+class IndexEntry(NamedTuple):
+    id: Any
+    title: str
+    autocomplete_label: str
+
+
+class NgramIndex:
+    """
+    In-memory trigram index over MediaItem titles.
+
+    Titles are split into trigrams the same way pg_trgm does it, and matches are scored
+    with pg_trgm's similarity(): shared trigrams / (query trigrams + title trigrams -
+    shared trigrams). That keeps results consistent with the Postgres trigram index.
+
+    Removed entries are tombstoned and the index is compacted once more than half of it
+    is dead.
+    """
+
+    def __init__(self, n: int = 3) -> None:
+        self.n = n
+        self._entries: list[Optional[IndexEntry]] = []
+        self._gram_counts = array("H")
+        self._postings: dict[str, array[int]] = {}
+        self._positions: dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, id: Any) -> bool:
+        return id in self._positions
+
+    def ngrams(self, text: str) -> set[str]:
+        grams = set()
+        for word in re.findall(r"\w+", text.lower()):
+            padded = f"{' ' * (self.n - 1)}{word} "
+            for i in range(len(padded) - self.n + 1):
+                grams.add(padded[i : i + self.n])
+        return grams
+
+    def build(self, entries: Iterable[IndexEntry]) -> None:
+        self._entries = []
+        self._gram_counts = array("H")
+        self._postings = {}
+        self._positions = {}
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: IndexEntry) -> None:
+        self.discard(entry.id)
+        grams = self.ngrams(entry.title)
+        position = len(self._entries)
+        self._entries.append(entry)
+        self._gram_counts.append(min(len(grams), 0xFFFF))
+        self._positions[entry.id] = position
+        for gram in grams:
+            self._postings.setdefault(gram, array("I")).append(position)
+
+    def discard(self, id: Any) -> None:
+        position = self._positions.pop(id, None)
+        if position is None:
+            return
+        self._entries[position] = None
+        if len(self._positions) < len(self._entries) // 2:
+            self.build(e for e in self._entries if e is not None)
+
+    def search(
+        self, q: str, limit: int = 20, threshold: float = 0.3
+    ) -> list[IndexEntry]:
+        """Return the entries most similar to q, best match first."""
+        query_grams = self.ngrams(q)
+        if not query_grams:
+            return []
+
+        shared: Counter[int] = Counter()
+        for gram in query_grams:
+            shared.update(self._postings.get(gram, ()))
+
+        scored: list[tuple[float, str, IndexEntry]] = []
+        for position, count in shared.items():
+            entry = self._entries[position]
+            if entry is None:
+                continue
+            total = len(query_grams) + self._gram_counts[position] - count
+            similarity = count / total
+            if similarity >= threshold:
+                scored.append((similarity, entry.title, entry))
+
+        best = heapq.nsmallest(limit, scored, key=lambda s: (-s[0], s[1]))
+        return [entry for _, _, entry in best]
@@ -0,0 +1,129 @@
+import re
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterable, Optional
+
+from supergood_reads.search.ngram import IndexEntry
+
+
+def normalize(text: str) -> str:
+    return " ".join(re.findall(r"\w+", text.casefold()))
+
+
+class PrefixIndex:
+    """
+    In-memory prefix index over MediaItem titles.
+
+    Rather than a node-per-character trie, the index is a sorted list of keys with a
+    parallel array of entry positions, searched with bisect. Every title gets one key
+    per word, starting at that word, so "sam" finds "Seven Samurai". Keys are cut off
+    at "key_length" characters to bound memory; longer queries are checked against the
+    full title.
+
+    Removed entries are tombstoned and the index is compacted once more than half of it
+    is dead.
+    """
+
+    def __init__(self, key_length: int = 24) -> None:
+        self.key_length = key_length
+        self._keys: list[str] = []
+        self._refs = array("I")
+        self._title_keys: list[str] = []
+        self._title_refs = array("I")
+        self._entries: list[Optional[IndexEntry]] = []
+        self._positions: dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, id: Any) -> bool:
+        return id in self._positions
+
+    def keys(self, title: str) -> list[str]:
+        words = normalize(title).split(" ")
+        return [
+            " ".join(words[i:])[: self.key_length]
+            for i in range(len(words))
+            if words[i]
+        ]
+
+    def build(self, entries: Iterable[IndexEntry]) -> None:
+        keyed: list[tuple[str, int]] = []
+        title_keyed: list[tuple[str, int]] = []
+        self._entries = []
+        self._positions = {}
+        for entry in entries:
+            position = self._append(entry)
+            keys = self.keys(entry.title)
+            keyed.extend((key, position) for key in keys)
+            title_keyed.extend((key, position) for key in keys[:1])
+        keyed.sort()
+        title_keyed.sort()
+        self._keys = [key for key, _ in keyed]
+        self._refs = array("I", (position for _, position in keyed))
+        self._title_keys = [key for key, _ in title_keyed]
+        self._title_refs = array("I", (position for _, position in title_keyed))
+
+    def add(self, entry: IndexEntry) -> None:
+        self.discard(entry.id)
+        position = self._append(entry)
+        keys = self.keys(entry.title)
+        for key in keys:
+            i = bisect_left(self._keys, key)
+            self._keys.insert(i, key)
+            self._refs.insert(i, position)
+        for key in keys[:1]:
+            i = bisect_left(self._title_keys, key)
+            self._title_keys.insert(i, key)
+            self._title_refs.insert(i, position)
+
+    def discard(self, id: Any) -> None:
+        position = self._positions.pop(id, None)
+        if position is None:
+            return
+        self._entries[position] = None
+        if len(self._positions) < len(self._entries) // 2:
+            self.build(e for e in self._entries if e is not None)
+
+    def search(self, q: str, limit: int = 20) -> list[IndexEntry]:
+        """
+        Return up to "limit" entries with a word that starts with q. Titles that start
+        with q come first, and are collected before any other match.
+        """
+        prefix = normalize(q)
+        matches: dict[int, IndexEntry] = {}
+        self._collect(self._title_keys, self._title_refs, prefix, matches, limit)
+        self._collect(self._keys, self._refs, prefix, matches, limit)
+        return sorted(
+            matches.values(),
+            key=lambda e: (not normalize(e.title).startswith(prefix), e.title),
+        )
+
+    def _collect(
+        self,
+        keys: list[str],
+        refs: "array[int]",
+        prefix: str,
+        matches: dict[int, IndexEntry],
+        limit: int,
+    ) -> None:
+        """Add the entries of the keys that start with prefix to matches, up to limit."""
+        key_prefix = prefix[: self.key_length]
+        i = bisect_left(keys, key_prefix)
+        while i < len(keys) and len(matches) < limit and keys[i].startswith(key_prefix):
+            position = refs[i]
+            entry = self._entries[position]
+            i += 1
+            if entry is None or position in matches:
+                continue
+            if len(prefix) > self.key_length:
+                title = normalize(entry.title)
+                if not (title.startswith(prefix) or f" {prefix}" in title):
+                    continue
+            matches[position] = entry
+
+    def _append(self, entry: IndexEntry) -> int:
+        position = len(self._entries)
+        self._entries.append(entry)
+        self._positions[entry.id] = position
+        return position
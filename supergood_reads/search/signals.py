@@ -0,0 +1,106 @@
+from typing import Any, Optional
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from supergood_reads.models import BaseMediaItem, Genre, MediaItemSearchDocument
+from supergood_reads.models.media_items import GenreMixin
+from supergood_reads.utils.engine import supergood_reads_engine
+
+
+@receiver(post_save)
+def update_autocomplete_index_on_save(
+    sender: Any, instance: Any, **kwargs: Any
+) -> None:
+    """Keep in-process autocomplete indexes in sync with saved MediaItems."""
+    if not isinstance(instance, BaseMediaItem):
+        return
+    backend = supergood_reads_engine.autocomplete_backend
+    transaction.on_commit(lambda: backend.media_item_saved(instance))
+
+
+@receiver(post_delete)
+def update_autocomplete_index_on_delete(
+    sender: Any, instance: Any, **kwargs: Any
+) -> None:
+    """Drop deleted MediaItems from in-process autocomplete indexes."""
+    if not isinstance(instance, BaseMediaItem):
+        return
+    backend = supergood_reads_engine.autocomplete_backend
+    # Django clears instance.pk once the delete finishes, so capture it now.
+    model_class, pk = type(instance), instance.pk
+    transaction.on_commit(lambda: backend.media_item_deleted(model_class, pk))
+
+
+def media_items_with_genre(genre: Genre) -> list[BaseMediaItem]:
+    media_items: list[BaseMediaItem] = []
+    for model_class in supergood_reads_engine.media_item_model_classes:
+        if issubclass(model_class, GenreMixin):  # type: ignore
+            media_items.extend(model_class.objects.filter(genres=genre))  # type: ignore
+    return media_items
+
+
+@receiver(post_save)
+def update_search_document_on_save(
+    sender: Any, instance: Any, raw: bool = False, **kwargs: Any
+) -> None:
+    """Keep each MediaItem's search document in sync with the MediaItem."""
+    if raw or not isinstance(instance, BaseMediaItem):
+        return
+    MediaItemSearchDocument.objects.update_for(instance)
+
+
+@receiver(m2m_changed)
+def update_search_document_on_genres_changed(
+    sender: Any,
+    instance: Any,
+    action: str,
+    reverse: bool,
+    model: Any,
+    pk_set: Optional[set[Any]],
+    **kwargs: Any,
+) -> None:
+    """Refresh the genre names of search documents when genres are (un)assigned."""
+    if isinstance(instance, BaseMediaItem) and model is Genre:
+        if action.startswith("post_"):
+            MediaItemSearchDocument.objects.update_for(instance)
+    elif isinstance(instance, Genre) and issubclass(model, BaseMediaItem):
+        # genre.film_set.clear() doesn't say which Films it cleared.
+        if action == "pre_clear":
+            instance._search_document_media_items = media_items_with_genre(  # type: ignore[attr-defined]
+                instance
+            )
+        elif action == "post_clear":
+            for media_item in getattr(instance, "_search_document_media_items", []):
+                MediaItemSearchDocument.objects.update_for(media_item)
+        elif action.startswith("post_") and pk_set:
+            for media_item in model.objects.filter(pk__in=pk_set):
+                MediaItemSearchDocument.objects.update_for(media_item)
+
+
+@receiver(post_save, sender=Genre)
+def update_search_documents_on_genre_save(
+    sender: Any, instance: Genre, raw: bool = False, **kwargs: Any
+) -> None:
+    if raw:
+        return
+    for media_item in media_items_with_genre(instance):
+        MediaItemSearchDocument.objects.update_for(media_item)
+
+
+@receiver(pre_delete, sender=Genre)
+def collect_search_documents_on_genre_delete(
+    sender: Any, instance: Genre, **kwargs: Any
+) -> None:
+    instance._search_document_media_items = media_items_with_genre(  # type: ignore[attr-defined]
+        instance
+    )
+
+
+@receiver(post_delete, sender=Genre)
+def update_search_documents_on_genre_delete(
+    sender: Any, instance: Genre, **kwargs: Any
+) -> None:
+    for media_item in getattr(instance, "_search_document_media_items", []):
+        MediaItemSearchDocument.objects.update_for(media_item)
@@ -0,0 +1,133 @@
+"""Raw SQL for the database-specific search indexes.
+
+None of these indexes can be declared on a Django model without tying the model to a
+single database vendor, so they're installed by RunPython migrations that check the
+vendor of the connection they run against.
+
+Full-text search:
+- postgresql: a generated tsvector column with a GIN index.
+- sqlite: an FTS5 virtual table kept in sync with triggers.
+
+Trigram similarity:
+- postgresql: a pg_trgm GIN index.
+"""
+
+from typing import Any, Sequence
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+POSTGRES_SEARCH_CONFIG = "simple"
+SEARCH_VECTOR_COLUMN = "search_vector"
+TSVECTOR_WEIGHTS = ("A", "B", "C", "D")
+
+
+def fts_table_name(table: str) -> str:
+    return f"{table}_fts"
+
+
+def install_search_index(
+    schema_editor: Any, table: str, columns: Sequence[str] = ("title",)
+) -> None:
+    """Create and populate the search index for a table.
+
+    Safe to call more than once. On sqlite, call it again after any migration that
+    rebuilds the table, since sqlite drops the table's triggers and renumbers its rowids
+    when it does that.
+    """
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        _install_postgres_search_index(schema_editor, table, columns)
+    elif connection.vendor == "sqlite" and has_fts5(connection):
+        _install_sqlite_search_index(schema_editor, table, columns)
+
+
+def uninstall_search_index(schema_editor: Any, table: str) -> None:
+    connection = schema_editor.connection
+    if connection.vendor == "postgresql":
+        schema_editor.execute(
+            f'ALTER TABLE "{table}" DROP COLUMN IF EXISTS "{SEARCH_VECTOR_COLUMN}"'
+        )
+    elif connection.vendor == "sqlite":
+        for suffix in ("ai", "ad", "au"):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS "{table}_fts_{suffix}"')
+        schema_editor.execute(f'DROP TABLE IF EXISTS "{fts_table_name(table)}"')
+
+
+def has_fts5(connection: BaseDatabaseWrapper) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA compile_options")
+        options = {row[0] for row in cursor.fetchall()}
+    return "ENABLE_FTS5" in options
+
+
+def _install_postgres_search_index(
+    schema_editor: Any, table: str, columns: Sequence[str]
+) -> None:
+    document = " || ".join(
+        f"setweight(to_tsvector('{POSTGRES_SEARCH_CONFIG}', "
+        f"coalesce(\"{column}\", '')), '{weight}')"
+        for column, weight in zip(columns, TSVECTOR_WEIGHTS)
+    )
+    schema_editor.execute(
+        f'ALTER TABLE "{table}" ADD COLUMN IF NOT EXISTS "{SEARCH_VECTOR_COLUMN}" '
+        f"tsvector GENERATED ALWAYS AS ({document}) STORED"
+    )
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS "{table}_search_vector_idx" '
+        f'ON "{table}" USING GIN ("{SEARCH_VECTOR_COLUMN}")'
+    )
+
+
+def _install_sqlite_search_index(
+    schema_editor: Any, table: str, columns: Sequence[str]
+) -> None:
+    fts_table = fts_table_name(table)
+    column_list = ", ".join(f'"{c}"' for c in columns)
+    new_values = ", ".join(f'new."{c}"' for c in columns)
+    old_values = ", ".join(f'old."{c}"' for c in columns)
+    insert_new = (
+        f'INSERT INTO "{fts_table}"(rowid, {column_list}) '
+        f"VALUES (new.rowid, {new_values});"
+    )
+    delete_old = (
+        f'INSERT INTO "{fts_table}"("{fts_table}", rowid, {column_list}) '
+        f"VALUES ('delete', old.rowid, {old_values});"
+    )
+    schema_editor.execute(
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts_table}" USING fts5('
+        f"{column_list}, content='{table}', content_rowid='rowid', "
+        "tokenize='unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute(
+        f'CREATE TRIGGER IF NOT EXISTS "{table}_fts_ai" AFTER INSERT ON "{table}" '
+        f"BEGIN {insert_new} END"
+    )
+    schema_editor.execute(
+        f'CREATE TRIGGER IF NOT EXISTS "{table}_fts_ad" AFTER DELETE ON "{table}" '
+        f"BEGIN {delete_old} END"
+    )
+    schema_editor.execute(
+        f'CREATE TRIGGER IF NOT EXISTS "{table}_fts_au" '
+        f'AFTER UPDATE OF {column_list} ON "{table}" '
+        f"BEGIN {delete_old} {insert_new} END"
+    )
+    schema_editor.execute(
+        f'INSERT INTO "{fts_table}"("{fts_table}") VALUES (\'rebuild\')'
+    )
+
+
+def install_trigram_index(schema_editor: Any, table: str, column: str) -> None:
+    """Create a pg_trgm GIN index. Other databases use an in-process index instead."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS "{table}_{column}_trgm_idx" '
+        f'ON "{table}" USING GIN ("{column}" gin_trgm_ops)'
+    )
+
+
+def uninstall_trigram_index(schema_editor: Any, table: str, column: str) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS "{table}_{column}_trgm_idx"')
@@ -1,5 +1,5 @@
 import json
-from typing import no_type_check
+from typing import Any, Optional, no_type_check
 
 from django import template
 from django.forms import BoundField, ModelChoiceField
@@ -10,15 +10,31 @@ from django.utils.html import (  # type: ignore [attr-defined]
 )
 from django.utils.safestring import SafeText, mark_safe
 
+from supergood_reads.forms.base import ContentTypeChoiceField
+
 register = template.Library()
 
 
-@register.simple_tag
-def vue_field_interface(field: BoundField) -> str:
-    """
-    Convert Field into a json dump of all attributes required to render that field in
-    a vue Component.
-    """
+FieldSchemaKey = tuple[Any, ...]
+
+# JSON of the parts of each field's Vue schema that don't depend on the form's data,
+# without the closing brace. See field_schema_json().
+_field_schemas: dict[FieldSchemaKey, str] = {}
+
+
+def field_schema_key(field: BoundField) -> Optional[FieldSchemaKey]:
+    """None for fields whose choices can change from one render to the next."""
+    form_field = field.field
+    choices_key: Any = None
+    if isinstance(form_field, ContentTypeChoiceField):
+        choices_key = form_field.content_type_ids
+    elif isinstance(form_field, ModelChoiceField):
+        return None
+    form = field.form
+    return (type(form), form.prefix, form.auto_id, field.name, choices_key)
+
+
+def field_schema(field: BoundField) -> dict[str, Any]:
     if isinstance(field.field, ModelChoiceField):
         choices = [
             (obj.value if obj else obj, label) for obj, label in field.field.choices  # type: ignore[union-attr]
@@ -28,20 +44,48 @@ def vue_field_interface(field: BoundField) -> str:
     else:
         choices = []
 
-    errors_html = str(field.errors)
-    initial_value = field.value() if field.value() is not None else ""
-
-    field_data = {
-        "errorsHtml": errors_html,
+    return {
         "name": field.html_name,
         "label": field.label,
         "id": field.id_for_label,
         "helpText": field.help_text,
-        "initialValue": initial_value,
         "choices": choices,
+    }
+
+
+def field_schema_json(field: BoundField) -> str:
+    """
+    The JSON of a field's name, label, id, help text and choices, computed once per
+    form class, prefix and field and then served from memory. Forms must not change
+    these per instance, other than with ContentTypeChoiceField.set_models().
+    """
+    key = field_schema_key(field)
+    schema_json = _field_schemas.get(key) if key is not None else None
+    if schema_json is None:
+        schema_json = json.dumps(field_schema(field))[:-1]
+        if key is not None:
+            _field_schemas[key] = schema_json
+    return schema_json
+
+
+def clear_field_schemas() -> None:
+    _field_schemas.clear()
+
+
+@register.simple_tag
+def vue_field_interface(field: BoundField) -> str:
+    """
+    Convert Field into a json dump of all attributes required to render that field in
+    a vue Component.
+    """
+    value = field.value()
+    field_data = {
+        "errorsHtml": str(field.errors),
+        "initialValue": value if value is not None else "",
         "disabled": field.field.disabled,
     }
-    return json.dumps(field_data)
+    # Splice the bound parts into the cached static ones.
+    return f"{field_schema_json(field)}, {json.dumps(field_data)[1:]}"
 
 
 @no_type_check
@@ -35,6 +35,21 @@ urlpatterns = [
         views.MediaItemSearchView.as_view(),
         name="media_search",
     ),
+    path(
+        "reviews-api/",
+        views.ReviewListApiView.as_view(),
+        name="reviews_api",
+    ),
+    path(
+        "reviews-bulk-api/",
+        views.BulkCreateReviewsApiView.as_view(),
+        name="reviews_bulk_api",
+    ),
+    path(
+        "stats-api/",
+        views.ReadingStatsApiView.as_view(),
+        name="reading_stats_api",
+    ),
     path(
         "media-type-choices-api/",
         views.MediaTypeChoicesApiView.as_view(),
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import math
+import time
+import uuid
+from typing import Any, NamedTuple
+
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from supergood_reads.models import BaseMediaItem, Country, Genre
+
+CATALOG_CACHE_PREFIX = "supergood_reads:catalog"
+CATALOG_VERSION_KEY = f"{CATALOG_CACHE_PREFIX}:version"
+RATINGS_VERSION_KEY = f"{CATALOG_CACHE_PREFIX}:ratings:version"
+
+# Writes to any of these models change the catalog.
+CATALOG_MODELS = (BaseMediaItem, Genre, Country)
+
+
+class CatalogVersion(NamedTuple):
+    version: str
+    # Unix timestamp, in whole seconds, of the last write to the catalog.
+    modified: int
+
+
+def get_catalog_version() -> CatalogVersion:
+    """
+    Return the current catalog version.
+
+    If the version has been evicted from the cache, a new one is started as if the
+    catalog had just been written to, so nothing stale can be served.
+    """
+    return get_version(CATALOG_VERSION_KEY)
+
+
+def bump_catalog_version() -> CatalogVersion:
+    return bump_version(CATALOG_VERSION_KEY)
+
+
+def get_ratings_version() -> CatalogVersion:
+    """
+    Return the current version of the MediaItemRatingAggregates, which responses that
+    include ratings are keyed on along with the catalog version.
+    """
+    return get_version(RATINGS_VERSION_KEY)
+
+
+def bump_ratings_version() -> CatalogVersion:
+    return bump_version(RATINGS_VERSION_KEY)
+
+
+def get_version(key: str) -> CatalogVersion:
+    data = cache.get(key)
+    if data is None:
+        return bump_version(key)
+    return CatalogVersion(*data)
+
+
+def bump_version(key: str) -> CatalogVersion:
+    version = CatalogVersion(uuid.uuid4().hex, math.ceil(time.time()))
+    cache.set(key, tuple(version), None)
+    return version
+
+
+def combine_versions(*versions: CatalogVersion) -> CatalogVersion:
+    """A version that changes whenever any of "versions" does."""
+    return CatalogVersion(
+        ":".join(version.version for version in versions),
+        max(version.modified for version in versions),
+    )
+
+
+def catalog_cache_key(version: CatalogVersion, *parts: Any) -> str:
+    """
+    Key for something computed from this version of the catalog, that varies by
+    "parts". The last segment of the key is a digest that can also be used as an ETag.
+    """
+    data = json.dumps([version.version, *parts], default=str)
+    digest = hashlib.sha1(data.encode()).hexdigest()
+    return f"{CATALOG_CACHE_PREFIX}:{digest}"
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_catalog_version_on_write(sender: Any, **kwargs: Any) -> None:
+    if issubclass(sender, CATALOG_MODELS):
+        bump_catalog_version()
+
+
+@receiver(m2m_changed)
+def bump_catalog_version_on_m2m_change(
+    sender: Any, instance: Any, action: str, **kwargs: Any
+) -> None:
+    if isinstance(instance, CATALOG_MODELS) and action.startswith("post_"):
+        bump_catalog_version()
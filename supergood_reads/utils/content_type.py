@@ -1,17 +1,99 @@
-from typing import Any, Type
+from types import MappingProxyType
+from typing import Any, Iterable, NamedTuple, Type
 
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Model
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+from django.forms import ModelForm
+
+
+class ContentTypeEntry(NamedTuple):
+    """A Strategy or MediaItem model configured in the engine."""
+
+    model: Type[Model]
+    content_type: ContentType
+    form_class: Type[ModelForm[Any]]
+
+    @property
+    def id(self) -> int:
+        return self.content_type.pk
+
+    @property
+    def label(self) -> str:
+        return str(self.model._meta.verbose_name)
+
+
+class ContentTypeRegistry:
+    """
+    The ContentTypes of the engine's Strategy and MediaItem models, fetched in one
+    query when the registry is built and then looked up without any.
+    """
+
+    def __init__(self, form_classes: Iterable[Type[ModelForm[Any]]]) -> None:
+        form_classes = list(form_classes)
+        content_types = ContentType.objects.get_for_models(
+            *(form_class._meta.model for form_class in form_classes)
+        )
+        self.entries: tuple[ContentTypeEntry, ...] = tuple(
+            ContentTypeEntry(
+                form_class._meta.model,
+                content_types[form_class._meta.model],
+                form_class,
+            )
+            for form_class in form_classes
+        )
+        self.by_model: MappingProxyType[
+            Type[Model], ContentTypeEntry
+        ] = MappingProxyType({entry.model: entry for entry in self.entries})
+        self.by_id: MappingProxyType[int, ContentTypeEntry] = MappingProxyType(
+            {entry.id: entry for entry in self.entries}
+        )
+
+    def get_content_type(self, model: Any) -> ContentType:
+        """The ContentType of a model or instance, falling back to ContentType's cache."""
+        model_class: Type[Model] = model if isinstance(model, type) else type(model)
+        entry = self.by_model.get(model_class._meta.concrete_model or model_class)
+        if entry is not None:
+            return entry.content_type
+        return ContentType.objects.get_for_model(model)
+
+    def get_model(self, content_type_id: int) -> Type[Model] | None:
+        entry = self.by_id.get(content_type_id)
+        if entry is not None:
+            return entry.model
+        return ContentType.objects.get_for_id(content_type_id).model_class()
+
+
+def content_type_registry() -> ContentTypeRegistry:
+    # The engine imports the forms, which import this module.
+    from supergood_reads.utils.engine import supergood_reads_engine
+
+    return supergood_reads_engine.content_types
+
+
+def model_to_content_type(model: Any) -> ContentType:
+    """Get the ContentType for a model."""
+    return content_type_registry().get_content_type(model)
 
 
 def model_to_content_type_id(model: Any) -> int:
     """Get the content_type id for a model."""
-    return ContentType.objects.get_for_model(model).id
+    return model_to_content_type(model).id
 
 
 def content_type_id_to_model(content_type_id: int) -> Type[Model]:
     """Get the model from content_type_id."""
-    model = ContentType.objects.get_for_id(content_type_id).model_class()
+    model = content_type_registry().get_model(content_type_id)
     if not model:
         raise LookupError
     return model
+
+
+@receiver(post_migrate)
+def clear_content_type_registry(**kwargs: Any) -> None:
+    # ContentTypes may have been created or flushed, like ContentType's own cache,
+    # which is cleared on post_migrate too.
+    from supergood_reads.utils.engine import supergood_reads_engine
+
+    supergood_reads_engine.clear_content_types()
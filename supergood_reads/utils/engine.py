@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, Optional, Type
 
 from django.conf import settings
@@ -15,6 +16,19 @@ from supergood_reads.forms.strategy_forms import (
     TomatoStrategyForm,
 )
 from supergood_reads.models import AbstractReviewStrategy, BaseMediaItem
+from supergood_reads.search.autocomplete import (
+    BaseAutocompleteBackend,
+    IContainsAutocompleteBackend,
+)
+from supergood_reads.search.backends import (
+    BaseSearchBackend,
+    default_search_backend_class,
+)
+from supergood_reads.utils.content_type import ContentTypeRegistry
+from supergood_reads.utils.strategy_storage import (
+    BaseStrategyStorage,
+    TableStrategyStorage,
+)
 
 SUPERGOOD_READS_CONFIG = "SUPERGOOD_READS_CONFIG"
 
@@ -41,6 +55,30 @@ class SupergoodReadsConfig:
     """
     media_item_form_classes: list[Type[ModelForm[Any]]] = []
 
+    """
+    Full-text search backend used to filter and rank the library search.
+    Leave as None to pick the indexed backend that matches the default database.
+    """
+    search_backend_class: Optional[Type[BaseSearchBackend]] = None
+
+    """
+    Backend used to match titles in the media item autocomplete.
+    Use TrigramAutocompleteBackend for typo-tolerant matches ordered by similarity, or
+    PrefixAutocompleteBackend to answer prefix queries from an in-process index.
+    """
+    autocomplete_backend_class: Type[
+        BaseAutocompleteBackend
+    ] = IContainsAutocompleteBackend
+
+    """
+    Where Strategies are written when Reviews are saved.
+    TableStrategyStorage gives each Strategy a row of its own table.
+    JsonStrategyStorage keeps its fields on the Review, so listing Reviews needs no
+    query per Strategy type and saving one is a single write.
+    Run "supergood_reads_migrate_strategy_storage" after switching.
+    """
+    strategy_storage_class: Type[BaseStrategyStorage] = TableStrategyStorage
+
 
 class DefaultSupergoodReadsConfig(SupergoodReadsConfig):
     strategy_form_classes = [
@@ -105,6 +143,38 @@ class SupergoodReadsEngine:
 
         return config_cls()
 
+    @cached_property
+    def search_backend(self) -> BaseSearchBackend:
+        """
+        Instantiated lazily, since choosing a default backend may need to inspect the
+        database.
+        """
+        backend_class = (
+            self.config.search_backend_class or default_search_backend_class()
+        )
+        return backend_class()
+
+    @cached_property
+    def autocomplete_backend(self) -> BaseAutocompleteBackend:
+        return self.config.autocomplete_backend_class()
+
+    @cached_property
+    def strategy_storage(self) -> BaseStrategyStorage:
+        return self.config.strategy_storage_class()
+
+    @cached_property
+    def content_types(self) -> ContentTypeRegistry:
+        """
+        Built on first use rather than in __init__, since the engine is created at
+        import time, before ContentTypes can be queried.
+        """
+        return ContentTypeRegistry(
+            [*self.strategy_form_classes, *self.media_item_form_classes]
+        )
+
+    def clear_content_types(self) -> None:
+        self.__dict__.pop("content_types", None)
+
     def validate_strategy_form_classes(self) -> None:
         """Validate that all strategy_form_classes are Strategies."""
         for form_class in self.strategy_form_classes:
@@ -0,0 +1,33 @@
+from typing import Any
+
+from django.template.loader import render_to_string
+from django.utils.html import format_html
+from django.utils.safestring import SafeText
+
+FragmentKey = tuple[str, str, tuple[tuple[str, Any], ...]]
+
+_fragments: dict[FragmentKey, SafeText] = {}
+
+
+def render_fragment(
+    template_name: str, wrapper: str = "{}", **context: Any
+) -> SafeText:
+    """
+    Render a template whose output only depends on its name and "context", such as an
+    SVG icon, and insert it into "wrapper" with format_html().
+
+    Each fragment is rendered once per process and then served from memory. Fragments
+    are keyed on the template name, the wrapper and the context, so context values must
+    be hashable.
+    """
+    key = (template_name, wrapper, tuple(sorted(context.items())))
+    fragment = _fragments.get(key)
+    if fragment is None:
+        fragment = format_html(wrapper, render_to_string(template_name, context))
+        _fragments[key] = fragment
+    return fragment
+
+
+def clear_fragments() -> None:
+    """Forget every rendered fragment, e.g. after templates have changed."""
+    _fragments.clear()
@@ -0,0 +1,282 @@
+import base64
+import hashlib
+import json
+import uuid
+from functools import cached_property
+from typing import Any, NamedTuple, Optional, Sequence, Type
+
+from django.core.cache import cache
+from django.core.paginator import InvalidPage, Page, Paginator
+from django.db import connections
+from django.db.models import Model, QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+COUNT_CACHE_PREFIX = "supergood_reads:count"
+
+
+def count_version_key(model: Type[Model]) -> str:
+    return f"{COUNT_CACHE_PREFIX}:version:{model._meta.label_lower}"
+
+
+def invalidate_counts(model: Type[Model]) -> None:
+    """
+    Invalidate every cached count over "model" and the models it inherits from.
+    """
+    for m in [model, *model._meta.get_parent_list()]:
+        cache.set(count_version_key(m), uuid.uuid4().hex, None)
+
+
+def unsliced_queryset(object_list: Any) -> Optional[QuerySet[Any]]:
+    """object_list if it's a QuerySet that can still be filtered, ordered and counted."""
+    # django-stubs' QuerySet is a parameterized alias, which isinstance() rejects.
+    if isinstance(object_list, QuerySet):  # type: ignore[misc]
+        return None if object_list.query.is_sliced else object_list
+    return None
+
+
+class CachedCountPaginator(Paginator[Any]):
+    """
+    Paginator that caches each queryset's count.
+
+    Counts are keyed on the queryset's SQL without its ordering, so every request with
+    the same filters shares one count. They're invalidated whenever an instance of the
+    queryset's model is saved or deleted, or has its many-to-many relations changed.
+    Writes that send no signals, like update() and bulk_create(), have to call
+    invalidate_counts() themselves.
+    """
+
+    count_cache_timeout = 60 * 60
+
+    @cached_property
+    def count(self) -> int:
+        qs = unsliced_queryset(self.object_list)
+        if qs is None:
+            return super().count
+
+        key = self.count_cache_key(qs)
+        count = cache.get(key)
+        if count is None:
+            count = qs.count()
+            cache.set(key, count, self.count_cache_timeout)
+        return int(count)
+
+    def count_cache_key(self, qs: QuerySet[Any]) -> str:
+        version_key = count_version_key(qs.model)
+        version = cache.get(version_key)
+        if version is None:
+            version = uuid.uuid4().hex
+            cache.set(version_key, version, None)
+
+        sql, params = qs.order_by().query.sql_with_params()
+        filters = json.dumps([qs.db, sql, params], default=str)
+        digest = hashlib.sha1(filters.encode()).hexdigest()
+        return f"{COUNT_CACHE_PREFIX}:{qs.model._meta.label_lower}:{version}:{digest}"
+
+
+def dump_cursor(data: dict[str, Any]) -> str:
+    """The fields of a cursor as an opaque string that's safe to put in a URL."""
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode("ascii")
+
+
+def load_cursor(encoded: str) -> dict[str, Any]:
+    """The fields of a dump_cursor() string. Raises ValueError if it isn't one."""
+    data = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+    if not isinstance(data, dict):
+        raise ValueError("Invalid cursor")
+    return data
+
+
+class KeysetCursor(NamedTuple):
+    key: str
+    offset: int
+    reverse: bool
+
+
+class KeysetPage(Page[Any]):
+    """
+    A page of a KeysetPaginator. Links to its neighbours with cursors rather than page
+    numbers, so "next_cursor" and "previous_cursor" replace next_page_number() and
+    previous_page_number().
+    """
+
+    def __init__(
+        self,
+        object_list: Sequence[Any],
+        paginator: "KeysetPaginator",
+        offset: int,
+        has_next: bool,
+        has_previous: bool,
+    ) -> None:
+        super().__init__(object_list, offset // paginator.per_page + 1, paginator)
+        self.offset = offset
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.next_cursor: Optional[str] = None
+        self.previous_cursor: Optional[str] = None
+        key = paginator.key
+        if has_next:
+            self.next_cursor = paginator.encode_cursor(
+                KeysetCursor(
+                    getattr(object_list[-1], key), offset + len(object_list), False
+                )
+            )
+        if has_previous:
+            self.previous_cursor = paginator.encode_cursor(
+                KeysetCursor(getattr(object_list[0], key), offset, True)
+            )
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def start_index(self) -> int:
+        return self.offset + 1 if self.object_list else 0
+
+    def end_index(self) -> int:
+        return self.offset + len(self.object_list)
+
+
+class KeysetPaginator(CachedCountPaginator):
+    """
+    Paginator that finds pages by seeking past the "key" of the previous page's last
+    row instead of with an OFFSET, so deep pages cost the same as the first one.
+
+    "key" must be a unique column and the object_list is ordered by it, descending. Use
+    cursor_page() with the cursor of a KeysetPage, or None for the first page. Cursors
+    also carry the position of their page, so that pages still know their start and
+    end index.
+    """
+
+    def __init__(self, *args: Any, key: str, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        queryset = unsliced_queryset(self.object_list)
+        if queryset is None:
+            raise TypeError("KeysetPaginator needs an unsliced QuerySet.")
+        self.queryset = queryset
+        self.key = key
+
+    def cursor_page(self, encoded: Optional[str]) -> KeysetPage:
+        cursor = self.decode_cursor(encoded) if encoded else None
+        if cursor is None:
+            qs = self.queryset.order_by(f"-{self.key}")
+        elif cursor.reverse:
+            qs = self.queryset.filter(**{f"{self.key}__gt": cursor.key})
+            qs = qs.order_by(self.key)
+        else:
+            qs = self.queryset.filter(**{f"{self.key}__lt": cursor.key})
+            qs = qs.order_by(f"-{self.key}")
+
+        # Fetch one extra row to find out whether there's another page after this one.
+        rows = list(qs[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if cursor is None:
+            return KeysetPage(rows, self, 0, has_next=has_more, has_previous=False)
+        elif cursor.reverse:
+            rows.reverse()
+            offset = max(cursor.offset - len(rows), 0)
+            return KeysetPage(rows, self, offset, has_next=True, has_previous=has_more)
+        else:
+            return KeysetPage(
+                rows, self, cursor.offset, has_next=has_more, has_previous=bool(rows)
+            )
+
+    def decode_cursor(self, encoded: str) -> KeysetCursor:
+        try:
+            data = load_cursor(encoded)
+            return KeysetCursor(
+                key=str(data["k"]),
+                offset=max(int(data["o"]), 0),
+                reverse=bool(data["r"]),
+            )
+        except (TypeError, ValueError, KeyError):
+            raise InvalidPage("Invalid cursor")
+
+    def encode_cursor(self, cursor: KeysetCursor) -> str:
+        return dump_cursor({"k": cursor.key, "o": cursor.offset, "r": cursor.reverse})
+
+
+class EstimatedCountPaginator(Paginator[Any]):
+    """
+    Paginator that never counts more than "count_limit" rows past the start of the
+    requested page.
+
+    If there are more rows than that, "count" is set to the planner's estimate on
+    postgresql, or to the number of rows that were counted everywhere else, and
+    "count_is_exact" is False. Either way you can still page forwards, because the
+    limit moves along with the requested page.
+    """
+
+    count_limit = 1000
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.count_is_exact = True
+        self.count_is_estimate = False
+        self.requested_number = 1
+
+    def page(self, number: Any) -> Page[Any]:
+        try:
+            self.requested_number = max(int(number), 1)
+        except (TypeError, ValueError):
+            pass
+        return super().page(number)
+
+    @cached_property
+    def count(self) -> int:
+        object_list = unsliced_queryset(self.object_list)
+        if object_list is None:
+            return super().count
+
+        limit = (self.requested_number - 1) * self.per_page + self.count_limit
+        qs = object_list.order_by()
+        count = qs[: limit + 1].count()
+        if count <= limit:
+            return count
+
+        self.count_is_exact = False
+        estimate = self.planner_estimate(qs)
+        if estimate is not None and estimate > limit:
+            self.count_is_estimate = True
+            return estimate
+        return limit
+
+    @property
+    def count_label(self) -> str:
+        if self.count_is_exact:
+            return str(self.count)
+        if self.count_is_estimate:
+            return f"~{self.count}"
+        return f"{self.count}+"
+
+    def planner_estimate(self, qs: QuerySet[Any]) -> Optional[int]:
+        connection = connections[qs.db]
+        if connection.vendor != "postgresql":
+            return None
+        sql, params = qs.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_counts_on_write(sender: Any, instance: Any, **kwargs: Any) -> None:
+    if instance._meta.app_label == "supergood_reads":
+        invalidate_counts(type(instance))
+
+
+@receiver(m2m_changed)
+def invalidate_counts_on_m2m_change(
+    sender: Any, instance: Any, action: str, model: Any, **kwargs: Any
+) -> None:
+    if instance._meta.app_label == "supergood_reads" and action.startswith("post_"):
+        invalidate_counts(type(instance))
+        invalidate_counts(model)
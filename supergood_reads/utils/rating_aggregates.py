@@ -0,0 +1,141 @@
+import uuid
+from decimal import Decimal
+from typing import Any, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from supergood_reads.models import BaseMediaItem, MediaItemRatingAggregate, Review
+
+
+def aggregated_media_item_id(
+    content_type_id: Optional[int], object_id: Optional[uuid.UUID]
+) -> Optional[uuid.UUID]:
+    """The id of the MediaItem that a Review counts towards, if any."""
+    if content_type_id is None or object_id is None:
+        return None
+    model_class = ContentType.objects.get_for_id(content_type_id).model_class()
+    if model_class is None or not issubclass(model_class, BaseMediaItem):
+        return None
+    return object_id
+
+
+def review_rescored(
+    content_type_id: Optional[int],
+    object_id: Optional[uuid.UUID],
+    old_score: Optional[Decimal],
+    new_score: Optional[Decimal],
+) -> None:
+    """For writes that change Review.score without Review.save()."""
+    media_item_id = aggregated_media_item_id(content_type_id, object_id)
+    if media_item_id is not None and old_score != new_score:
+        MediaItemRatingAggregate.objects.adjust(
+            media_item_id, added_score=new_score, removed_score=old_score
+        )
+
+
+# The Review fields that decide what it counts towards. Saves with "update_fields"
+# that include none of these leave the aggregates alone.
+AGGREGATED_FIELDS = frozenset(
+    {
+        "media_item_content_type",
+        "media_item_content_type_id",
+        "media_item_object_id",
+        "score",
+    }
+)
+
+
+def stored_aggregation(review: Review) -> Optional[tuple[Any, ...]]:
+    """
+    The media item and score that a Review counts with in the database. These can
+    differ from the instance's, since strategy changes rescore Reviews with update().
+    """
+    return (
+        Review.objects.filter(pk=review.pk)
+        .values_list("media_item_content_type_id", "media_item_object_id", "score")
+        .first()
+    )
+
+
+@receiver(pre_save, sender=Review)
+def remember_aggregated_review(
+    sender: Any, instance: Review, raw: bool = False, **kwargs: Any
+) -> None:
+    """Remember what the Review counted towards before this save."""
+    instance._aggregated = None  # type: ignore[attr-defined]
+    if raw or instance._state.adding:
+        return
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not AGGREGATED_FIELDS & update_fields:
+        return
+    instance._aggregated = stored_aggregation(instance)  # type: ignore[attr-defined]
+
+
+@receiver(post_save, sender=Review)
+def update_rating_aggregates_on_review_save(
+    sender: Any,
+    instance: Review,
+    created: bool = False,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    if raw:
+        return
+    aggregated = getattr(instance, "_aggregated", None)
+    if aggregated is None and not created:
+        # remember_aggregated_review() skipped a save that can't change the aggregates.
+        return
+    if aggregated == (
+        instance.media_item_content_type_id,
+        instance.media_item_object_id,
+        instance.score,
+    ):
+        return
+    media_item_id = aggregated_media_item_id(
+        instance.media_item_content_type_id, instance.media_item_object_id
+    )
+    old_media_item_id, old_score = None, None
+    if aggregated is not None:
+        old_media_item_id = aggregated_media_item_id(aggregated[0], aggregated[1])
+        old_score = aggregated[2]
+
+    if aggregated is not None and old_media_item_id == media_item_id:
+        review_rescored(
+            instance.media_item_content_type_id,
+            instance.media_item_object_id,
+            old_score,
+            instance.score,
+        )
+        return
+    if old_media_item_id is not None:
+        MediaItemRatingAggregate.objects.adjust(
+            old_media_item_id, reviews=-1, removed_score=old_score
+        )
+    if media_item_id is not None:
+        MediaItemRatingAggregate.objects.adjust(
+            media_item_id,
+            reviews=1,
+            added_score=instance.score,
+            reviewed_at=instance.created_at,
+        )
+
+
+@receiver(pre_delete, sender=Review)
+def remember_deleted_review(sender: Any, instance: Review, **kwargs: Any) -> None:
+    instance._aggregated = stored_aggregation(instance)  # type: ignore[attr-defined]
+
+
+@receiver(post_delete, sender=Review)
+def update_rating_aggregates_on_review_delete(
+    sender: Any, instance: Review, **kwargs: Any
+) -> None:
+    aggregated = getattr(instance, "_aggregated", None)
+    if aggregated is None:
+        return
+    media_item_id = aggregated_media_item_id(aggregated[0], aggregated[1])
+    if media_item_id is not None:
+        MediaItemRatingAggregate.objects.adjust(
+            media_item_id, reviews=-1, removed_score=aggregated[2]
+        )
@@ -0,0 +1,139 @@
+import uuid
+from typing import Any, Iterable, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db.models import Count, F, Q, Sum
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from supergood_reads.models import BaseMediaItem, Book, Review
+from supergood_reads.models.rating_aggregates import score_bucket_counts
+
+READING_STATS_CACHE_PREFIX = "supergood_reads:reading_stats"
+READING_STATS_TIMEOUT = 60 * 60 * 24
+
+
+def reading_stats_version_key(user_id: Any) -> str:
+    return f"{READING_STATS_CACHE_PREFIX}:{user_id}:version"
+
+
+def bump_reading_stats_version(user_id: Any) -> str:
+    version = uuid.uuid4().hex
+    cache.set(reading_stats_version_key(user_id), version, None)
+    return version
+
+
+def bump_reading_stats_versions(user_ids: Iterable[Any]) -> None:
+    """bump_reading_stats_version() for many users, in one cache round trip."""
+    cache.set_many(
+        {reading_stats_version_key(user_id): uuid.uuid4().hex for user_id in user_ids},
+        None,
+    )
+
+
+def get_reading_stats(user_id: Any) -> dict[str, Any]:
+    """
+    Return the reading stats of a user, from the cache if they're current.
+
+    Cached stats are keyed on a per-user version, which is bumped by writes to the
+    user's Reviews and to the Books they reviewed, whose page counts the stats sum.
+    Loading current stats costs two cache round trips.
+    """
+    version = cache.get(reading_stats_version_key(user_id))
+    if version is None:
+        version = bump_reading_stats_version(user_id)
+
+    key = f"{READING_STATS_CACHE_PREFIX}:{user_id}:{version}"
+    stats: Optional[dict[str, Any]] = cache.get(key)
+    if stats is None:
+        stats = compute_reading_stats(user_id)
+        cache.set(key, stats, READING_STATS_TIMEOUT)
+    return stats
+
+
+def compute_reading_stats(user_id: Any) -> dict[str, Any]:
+    """
+    Reading stats of a user's Reviews, in four grouped queries however many Reviews
+    there are. Pages read is the sum of Book.pages over the distinct Books reviewed.
+    """
+    reviews = Review.objects.filter(owner_id=user_id).order_by()
+
+    completed = (
+        reviews.filter(completed_at_year__isnull=False)
+        .values("completed_at_year", "completed_at_month")
+        .annotate(count=Count("pk"))
+        .order_by("completed_at_year", F("completed_at_month").asc(nulls_first=True))
+    )
+
+    media_types = []
+    for row in (
+        reviews.filter(media_item_content_type__isnull=False)
+        .values("media_item_content_type_id")
+        .annotate(count=Count("pk"))
+    ):
+        content_type_id = row["media_item_content_type_id"]
+        model_class = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model_class is not None and issubclass(model_class, BaseMediaItem):
+            media_types.append(
+                {
+                    "id": content_type_id,
+                    "name": str(model_class._meta.verbose_name),
+                    "count": row["count"],
+                }
+            )
+
+    book_ids = reviews.filter(
+        media_item_content_type=ContentType.objects.get_for_model(Book)
+    ).values("media_item_object_id")
+    pages: Optional[int] = Book.objects.filter(pk__in=book_ids).aggregate(
+        pages=Sum("pages")
+    )["pages"]
+
+    buckets = score_bucket_counts()
+    ratings = reviews.aggregate(
+        **buckets, unrated=Count("pk", filter=Q(score__isnull=True))
+    )
+
+    return {
+        "reviewCount": sum(t["count"] for t in media_types),
+        "completed": [
+            {
+                "year": row["completed_at_year"],
+                "month": row["completed_at_month"],
+                "count": row["count"],
+            }
+            for row in completed
+        ],
+        "mediaTypes": sorted(media_types, key=lambda t: t["name"]),
+        "pagesRead": pages or 0,
+        "ratings": {
+            "buckets": [ratings[field] for field in buckets],
+            "unrated": ratings["unrated"],
+        },
+    }
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def bump_reading_stats_version_on_review_write(
+    sender: Any, instance: Review, **kwargs: Any
+) -> None:
+    if instance.owner_id is not None:
+        bump_reading_stats_version(instance.owner_id)
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def bump_reading_stats_versions_on_book_write(
+    sender: Any, instance: Book, **kwargs: Any
+) -> None:
+    """Only Book.pages is part of the stats, so saves that leave it alone are skipped."""
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and "pages" not in update_fields:
+        return
+    bump_reading_stats_versions(
+        Review.objects.filter(media_item_object_id=instance.pk, owner__isnull=False)
+        .values_list("owner_id", flat=True)
+        .distinct()
+    )
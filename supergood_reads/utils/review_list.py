@@ -0,0 +1,55 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from supergood_reads.models import (
+    AbstractReviewStrategy,
+    BaseMediaItem,
+    Review,
+    ReviewListEntry,
+)
+from supergood_reads.utils.strategy_storage import is_saving_with_review
+
+
+@receiver(post_save, sender=Review)
+def update_review_list_entry_on_save(
+    sender: Any, instance: Review, created: bool, raw: bool = False, **kwargs: Any
+) -> None:
+    """
+    Keep each Review's list entry in sync with the Review. ReviewFormGroup.save() saves
+    the Review last, inside its transaction, so this also picks up a new Strategy or
+    MediaItem.
+    """
+    if raw:
+        return
+    ReviewListEntry.objects.update_for(instance, created=created)
+
+
+@receiver(post_save)
+def update_review_list_entries_on_media_item_save(
+    sender: Any, instance: Any, raw: bool = False, **kwargs: Any
+) -> None:
+    if raw or not isinstance(instance, BaseMediaItem):
+        return
+    ReviewListEntry.objects.update_for_media_item(instance)
+
+
+@receiver(post_save)
+def update_review_list_entry_on_strategy_save(
+    sender: Any, instance: Any, raw: bool = False, **kwargs: Any
+) -> None:
+    if raw or not isinstance(instance, AbstractReviewStrategy):
+        return
+    if is_saving_with_review(instance):
+        return
+    ReviewListEntry.objects.update_for_strategy(instance)
+
+
+@receiver(post_delete)
+def update_review_list_entry_on_strategy_delete(
+    sender: Any, instance: Any, **kwargs: Any
+) -> None:
+    if isinstance(instance, AbstractReviewStrategy):
+        if not is_saving_with_review(instance):
+            ReviewListEntry.objects.clear_strategy(instance.pk)
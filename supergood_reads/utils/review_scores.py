@@ -0,0 +1,52 @@
+from decimal import Decimal
+from typing import Any, Optional
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from supergood_reads.models import AbstractReviewStrategy, Review
+from supergood_reads.utils.rating_aggregates import review_rescored
+from supergood_reads.utils.reading_stats import bump_reading_stats_version
+from supergood_reads.utils.strategy_storage import is_saving_with_review
+
+
+@receiver(post_save)
+def update_review_score_on_strategy_save(
+    sender: Any, instance: Any, raw: bool = False, **kwargs: Any
+) -> None:
+    """
+    Review.save() sets the score, but a Strategy can also be changed on its own, as in
+    the admin or the shell.
+    """
+    if raw or not isinstance(instance, AbstractReviewStrategy):
+        return
+    if is_saving_with_review(instance):
+        return
+    set_strategy_score(instance.pk, instance.normalized_score)
+
+
+@receiver(post_delete)
+def clear_review_score_on_strategy_delete(
+    sender: Any, instance: Any, **kwargs: Any
+) -> None:
+    if isinstance(instance, AbstractReviewStrategy):
+        if not is_saving_with_review(instance):
+            set_strategy_score(instance.pk, None)
+
+
+def set_strategy_score(strategy_id: Any, score: Optional[Decimal]) -> None:
+    """
+    Set the score of a Strategy's Reviews, and update their rating aggregates and their
+    owners' reading stats.
+    """
+    reviews = Review.objects.filter(strategy_object_id=strategy_id)
+    owner_ids = set()
+    for content_type_id, object_id, old_score, owner_id in reviews.values_list(
+        "media_item_content_type_id", "media_item_object_id", "score", "owner_id"
+    ):
+        review_rescored(content_type_id, object_id, old_score, score)
+        if owner_id is not None and old_score != score:
+            owner_ids.add(owner_id)
+    reviews.update(score=score)
+    for owner_id in owner_ids:
+        bump_reading_stats_version(owner_id)
@@ -0,0 +1,208 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import QuerySet, prefetch_related_objects
+
+from supergood_reads.models import AbstractReviewStrategy, Review, ReviewListEntry
+from supergood_reads.utils.pagination import invalidate_counts
+
+# The ids of Strategy rows, by Strategy type.
+ReplacedRows = dict[type[AbstractReviewStrategy], list[Any]]
+
+
+@contextmanager
+def saving_with_review(strategy: AbstractReviewStrategy) -> Iterator[None]:
+    """
+    Mark the writes to "strategy" made inside this block as part of saving its Review,
+    which rescores the Review and refreshes its list entry itself.
+    """
+    strategy._saving_with_review = True  # type: ignore[attr-defined]
+    try:
+        yield
+    finally:
+        del strategy._saving_with_review  # type: ignore[attr-defined]
+
+
+def is_saving_with_review(strategy: AbstractReviewStrategy) -> bool:
+    return getattr(strategy, "_saving_with_review", False)
+
+
+class BaseStrategyStorage:
+    """
+    Where the Strategies of Reviews are written.
+
+    Reading doesn't depend on the storage, since Review.strategy returns a Strategy
+    from wherever it was stored. Reviews written with different storages can be mixed,
+    such as while "migrate" is moving them from one to another.
+
+    Subclasses must implement "store", "to_migrate" and "migrate_batch".
+    """
+
+    def save(
+        self,
+        review: Review,
+        strategy: AbstractReviewStrategy,
+        previous: Optional[AbstractReviewStrategy] = None,
+    ) -> None:
+        """
+        Make "strategy" the Strategy of "review", replacing "previous". The Review
+        itself still has to be saved.
+
+        Saving the Review rescores it, refreshes its list entry and updates its rating
+        aggregates, so the receivers that do that work when a Strategy is written on
+        its own skip the writes made here.
+        """
+        if (
+            previous is not None
+            and previous is not strategy
+            and not previous._state.adding
+        ):
+            with saving_with_review(previous):
+                previous.delete()
+        self.store(review, strategy)
+
+    def store(self, review: Review, strategy: AbstractReviewStrategy) -> None:
+        raise NotImplementedError
+
+    def store_many(
+        self, strategies: list[tuple[Review, AbstractReviewStrategy]]
+    ) -> None:
+        """
+        "store" for the Strategies of new Reviews that are about to be created together
+        with bulk_create(), as (Review, Strategy) pairs.
+        """
+        for review, strategy in strategies:
+            self.store(review, strategy)
+
+    def migrate(self, queryset: QuerySet[Review], batch_size: int = 1000) -> int:
+        """
+        Move the Strategies of the Reviews in "queryset" into this storage,
+        "batch_size" Reviews and one transaction at a time. Returns the number of
+        Reviews moved.
+        """
+        count = 0
+        qs = self.to_migrate(queryset).order_by("pk")
+        last_pk = None
+        while True:
+            batch_qs = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+            batch = list(batch_qs[:batch_size])
+            if not batch:
+                return count
+            with transaction.atomic():
+                migrated, replaced = self.migrate_batch(batch)
+                Review.objects.bulk_update(
+                    migrated, ["strategy_object_id", "strategy_data"]
+                )
+                # Entries are refreshed by id when a Strategy row changes.
+                ReviewListEntry.objects.bulk_update(
+                    [
+                        ReviewListEntry(
+                            review_id=review.pk,
+                            strategy_object_id=review.strategy_object_id,
+                        )
+                        for review in migrated
+                    ],
+                    ["strategy_object_id"],
+                )
+                # No Review links to these any more, so their delete receivers, which
+                # rescore the Reviews that do, have nothing to update.
+                for model_class, ids in replaced.items():
+                    model_class._default_manager.filter(pk__in=ids).delete()
+            count += len(migrated)
+            last_pk = batch[-1].pk
+
+    def to_migrate(self, queryset: QuerySet[Review]) -> QuerySet[Review]:
+        """The Reviews of "queryset" whose Strategies are stored elsewhere."""
+        raise NotImplementedError
+
+    def migrate_batch(self, batch: list[Review]) -> tuple[list[Review], ReplacedRows]:
+        """
+        Store the Strategies of "batch" here. Returns the Reviews that were changed,
+        which are saved by "migrate", and the ids of the Strategy rows they no longer
+        link to by type, which "migrate" deletes once they're saved.
+        """
+        raise NotImplementedError
+
+
+class TableStrategyStorage(BaseStrategyStorage):
+    """
+    Each Strategy is a row of its model's table, linked to by Review.strategy_object_id.
+
+    Listing Reviews costs a prefetch query per Strategy type and saving one costs a
+    write to each table, but Strategies can be queried and changed on their own.
+    """
+
+    def store(self, review: Review, strategy: AbstractReviewStrategy) -> None:
+        with saving_with_review(strategy):
+            strategy.save()
+        review.strategy = strategy
+
+    def store_many(
+        self, strategies: list[tuple[Review, AbstractReviewStrategy]]
+    ) -> None:
+        """One INSERT per Strategy type."""
+        by_type: defaultdict[
+            type[AbstractReviewStrategy], list[AbstractReviewStrategy]
+        ] = defaultdict(list)
+        for review, strategy in strategies:
+            by_type[type(strategy)].append(strategy)
+            review.strategy = strategy
+        for model_class, objs in by_type.items():
+            model_class._default_manager.bulk_create(objs)
+            invalidate_counts(model_class)
+
+    def to_migrate(self, queryset: QuerySet[Review]) -> QuerySet[Review]:
+        return queryset.filter(strategy_data__isnull=False)
+
+    def migrate_batch(self, batch: list[Review]) -> tuple[list[Review], ReplacedRows]:
+        strategies: defaultdict[
+            type[AbstractReviewStrategy], list[AbstractReviewStrategy]
+        ] = defaultdict(list)
+        migrated = []
+        for review in batch:
+            strategy = review.strategy
+            if not isinstance(strategy, AbstractReviewStrategy):
+                continue
+            strategies[type(strategy)].append(strategy)
+            review.strategy_object_id = strategy.pk
+            review.strategy_data = None
+            migrated.append(review)
+        for model_class, objs in strategies.items():
+            model_class._default_manager.bulk_create(objs)
+        return migrated, {}
+
+
+class JsonStrategyStorage(BaseStrategyStorage):
+    """
+    Each Strategy is a dict of field values on Review.strategy_data, with its type in
+    Review.strategy_content_type.
+
+    Listing Reviews needs no queries for their Strategies and saving one is a single
+    write, but Strategies only change along with their Reviews.
+    """
+
+    def store(self, review: Review, strategy: AbstractReviewStrategy) -> None:
+        review.strategy_content_type = ContentType.objects.get_for_model(strategy)
+        review.strategy_object_id = None
+        review.strategy_data = strategy.to_data()
+        Review.strategy.set_cached_value(review, strategy)
+
+    def to_migrate(self, queryset: QuerySet[Review]) -> QuerySet[Review]:
+        return queryset.filter(strategy_object_id__isnull=False)
+
+    def migrate_batch(self, batch: list[Review]) -> tuple[list[Review], ReplacedRows]:
+        prefetch_related_objects(batch, "strategy")
+        replaced: ReplacedRows = defaultdict(list)
+        migrated = []
+        for review in batch:
+            strategy = review.strategy
+            if not isinstance(strategy, AbstractReviewStrategy):
+                continue
+            replaced[type(strategy)].append(strategy.pk)
+            review.strategy_object_id = None
+            review.strategy_data = strategy.to_data()
+            migrated.append(review)
+        return migrated, replaced
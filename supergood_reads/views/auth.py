@@ -32,7 +32,8 @@ def has_owner_permission(
     user: User | AnonymousUser,
     obj: BaseMediaItem | Review,
 ) -> bool:
-    return user.is_authenticated and obj.owner == user
+    # Compare ids so that the owner doesn't have to be fetched.
+    return user.is_authenticated and obj.owner_id == user.pk
 
 
 class BasePermissionMixin:
@@ -77,7 +78,7 @@ class UpdateReviewPermissionMixin(BasePermissionMixin):
         if not self.has_get_permission():
             return self.handle_unauthorized()
 
-        obj = self.get_object()  # type: ignore
+        obj = self.get_permission_object()
         if obj.validated and not user.has_perm("supergood_reads.change_review"):
             self.send_demo_notification()
 
@@ -88,6 +89,12 @@ class UpdateReviewPermissionMixin(BasePermissionMixin):
             return self.handle_unauthorized()
         return super().post(request, *args, **kwargs)  # type: ignore
 
+    def get_permission_object(self) -> Review:
+        # The view usually fetched the Review in dispatch().
+        obj = getattr(self, "object", None) or self.get_object()  # type: ignore
+        assert isinstance(obj, Review)
+        return obj
+
     def has_get_permission(self) -> bool:
         """
         A user can only view the update page for a review only if one of these
@@ -97,7 +104,7 @@ class UpdateReviewPermissionMixin(BasePermissionMixin):
           - The user owns the Review
         """
         user = self.request.user
-        obj = self.get_object()  # type: ignore
+        obj = self.get_permission_object()
         return (
             obj.validated
             or user.has_perm("supergood_reads.view_review")
@@ -111,7 +118,7 @@ class UpdateReviewPermissionMixin(BasePermissionMixin):
           - The user owns the Review
         """
         user = self.request.user
-        obj = self.get_object()  # type: ignore
+        obj = self.get_permission_object()
         return user.has_perm("supergood_reads.change_review") or has_owner_permission(
             user, obj
         )
@@ -1,6 +1,20 @@
 import logging
-from functools import wraps
-from typing import Any, Callable, Dict, Protocol, Type, TypeVar, cast
+import uuid
+from collections import Counter
+from datetime import datetime
+from functools import cached_property, wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from django.conf import settings
 from django.contrib import messages
@@ -8,9 +22,11 @@ from django.contrib.auth import logout
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
-from django.core.paginator import EmptyPage, Paginator
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, InvalidPage, Page, Paginator
 from django.db import transaction
-from django.db.models import Model, Prefetch, Q, QuerySet
+from django.db.models import Count, Model, Q, QuerySet
+from django.db.models.manager import BaseManager
 from django.forms import ModelForm
 from django.http import (
     Http404,
@@ -23,21 +39,43 @@ from django.http import (
 )
 from django.shortcuts import redirect, render
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
 from django.views import View
 from django.views.generic import ListView, TemplateView
 from django.views.generic.detail import DetailView, SingleObjectMixin
 from django.views.generic.edit import DeleteView
-from rest_framework import generics, pagination, serializers, views
+from rest_framework import generics, pagination, permissions, serializers, views
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from supergood_reads.forms.bulk_review_forms import BulkReviewFormGroup
 from supergood_reads.forms.media_item_forms import MediaItemFormGroup
 from supergood_reads.forms.review_forms import InvalidContentTypeError, ReviewFormGroup
-from supergood_reads.models import BaseMediaItem, Country, Genre, Review, UserSettings
-from supergood_reads.models.media_items import (
-    CountryMixin,
-    GenreMixin,
-    MediaItemQuerySet,
+from supergood_reads.models import (
+    BaseMediaItem,
+    Country,
+    Genre,
+    MediaItemRatingAggregate,
+    MediaItemSearchDocument,
+    Review,
+    ReviewListEntry,
+    UserSettings,
+)
+from supergood_reads.models.media_items import CountryMixin, GenreMixin
+from supergood_reads.models.review_list import ReviewListEntryQuerySet
+from supergood_reads.models.search import MediaItemSearchDocumentQuerySet
+from supergood_reads.search.autocomplete import (
+    AUTOCOMPLETE_FIELDS,
+    autocomplete_queryset,
+)
+from supergood_reads.utils.catalog import (
+    CatalogVersion,
+    catalog_cache_key,
+    combine_versions,
+    get_catalog_version,
+    get_ratings_version,
 )
 from supergood_reads.utils.content_type import (
     content_type_id_to_model,
@@ -45,6 +83,13 @@ from supergood_reads.utils.content_type import (
 )
 from supergood_reads.utils.engine import supergood_reads_engine
 from supergood_reads.utils.json import UUIDEncoder
+from supergood_reads.utils.pagination import (
+    EstimatedCountPaginator,
+    KeysetPaginator,
+    dump_cursor,
+    load_cursor,
+)
+from supergood_reads.utils.reading_stats import get_reading_stats
 from supergood_reads.utils.uuid import is_uuid
 from supergood_reads.views.auth import (
     CreateMediaItemPermissionMixin,
@@ -55,6 +100,9 @@ from supergood_reads.views.auth import (
     UpdateReviewPermissionMixin,
 )
 
+if TYPE_CHECKING:
+    from django.core.paginator import _SupportsPagination
+
 logger = logging.getLogger(__name__)
 
 ViewType = TypeVar("ViewType", bound="View")
@@ -142,9 +190,10 @@ class ReviewFormView(TemplateView):
 
         return context_data
 
-    @transaction.atomic
     @log_post_request_data
     def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        # ReviewFormGroup.save() writes everything in one transaction of its own, and
+        # validation doesn't need one.
         review_form_group = ReviewFormGroup(
             data=request.POST, instance=self.object, user=cast(User, self.request.user)
         )
@@ -267,9 +316,20 @@ class DeleteReview(DeleteReviewPermissionMixin, DeleteView[Review, ModelForm[Rev
         return super().form_valid(form)  # type: ignore[safe-super]
 
 
-class MediaItemAutocompleteView(View):
-    limit = 20
+def rating_aggregate_fields(
+    aggregate: Optional[MediaItemRatingAggregate],
+) -> dict[str, Any]:
+    """The review count and average score of a MediaItem, for JSON responses."""
+    if aggregate is None:
+        return {"reviewCount": 0, "averageScore": None}
+    average_score = aggregate.average_score
+    return {
+        "reviewCount": aggregate.review_count,
+        "averageScore": None if average_score is None else float(average_score),
+    }
 
+
+class MediaItemAutocompleteView(View):
     def get(self, request: HttpRequest) -> JsonResponse:
         query_dict = request.GET
         content_type_id = query_dict.get("content_type_id", "")
@@ -278,36 +338,59 @@ class MediaItemAutocompleteView(View):
         try:
             if not content_type_id:
                 raise InvalidContentTypeError
-            content_type = ContentType.objects.get_for_id(int(content_type_id))
-            model_class = content_type.model_class()
-            if not (model_class and issubclass(model_class, BaseMediaItem)):
+            model_class = content_type_id_to_model(int(content_type_id))
+            if not issubclass(model_class, BaseMediaItem):
                 raise InvalidContentTypeError
-        except (ContentType.DoesNotExist, InvalidContentTypeError, ValueError):
+        except (
+            ContentType.DoesNotExist,
+            InvalidContentTypeError,
+            LookupError,
+            ValueError,
+        ):
             return JsonResponse(
                 {"error": f"Invalid content type ID {content_type_id}"}, status=400
             )
 
-        manager = cast(MediaItemQuerySet[BaseMediaItem], model_class.objects)
-
         if is_uuid(q):
-            qs = manager.filter(pk=q)
+            qs = autocomplete_queryset(model_class).filter(pk=q)
+            results = list(qs.values(*AUTOCOMPLETE_FIELDS))
         else:
-            qs = manager.filter(title__icontains=q, validated=True)
-        qs = qs.with_autocomplete_label()[: self.limit]
-        values = qs.values("id", "title", "autocomplete_label")  # type: ignore[misc]
+            autocomplete_backend = supergood_reads_engine.autocomplete_backend
+            results = autocomplete_backend.search(model_class, q)
+
+        aggregates = MediaItemRatingAggregate.objects.in_bulk(
+            [result["id"] for result in results]
+        )
+        for result in results:
+            result.update(rating_aggregate_fields(aggregates.get(result["id"])))
 
         return JsonResponse(
             {
-                "results": list(values),
+                "results": results,
             },
             encoder=UUIDEncoder,
         )
 
 
 class SupergoodPagination(pagination.PageNumberPagination):
+    """
+    Page number pagination. Views can choose how pages are counted by setting
+    "paginator_class", just like a Django ListView.
+    """
+
     page_query_param = "page"
     page_size = 40
 
+    def paginate_queryset(
+        self, queryset: Any, request: Request, view: Any = None
+    ) -> Optional[list[Any]]:
+        self.django_paginator_class: Type[Paginator[Any]] = getattr(
+            view, "paginator_class", self.django_paginator_class
+        )
+        return cast(
+            Optional[list[Any]], super().paginate_queryset(queryset, request, view)
+        )
+
     def get_page_number(self, request: Request, paginator: Paginator[Any]) -> int:
         try:
             return int(super().get_page_number(request, paginator))
@@ -331,12 +414,232 @@ class SupergoodPagination(pagination.PageNumberPagination):
                     "startIndex": self.page.start_index(),
                     "endIndex": self.page.end_index(),
                     "count": self.page.paginator.count,
+                    "countLabel": getattr(
+                        self.page.paginator,
+                        "count_label",
+                        str(self.page.paginator.count),
+                    ),
+                },
+                "results": data,
+            }
+        )
+
+
+class Cursor(NamedTuple):
+    updated_at: datetime
+    pk: uuid.UUID
+    offset: int
+    reverse: bool
+
+
+class SupergoodCursorPagination(pagination.BasePagination):
+    """
+    Keyset pagination ordered by ("-updated_at", "-pk").
+
+    Pages are found by seeking past the (updated_at, pk) of the previous page's last
+    row rather than with an OFFSET, and no COUNT is run, so deep pages cost the same as
+    the first one. Cursors are opaque to the client. They also carry the position of
+    the page so that "startIndex" and "endIndex" can still be reported; "count" is
+    always null.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 40
+    ordering = ("-updated_at", "-pk")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Any], request: Request, view: Any = None
+    ) -> list[Any]:
+        cursor = self.decode_cursor(request)
+        if cursor is None:
+            qs = queryset.order_by(*self.ordering)
+        elif cursor.reverse:
+            qs = queryset.filter(
+                Q(updated_at__gt=cursor.updated_at)
+                | Q(updated_at=cursor.updated_at, pk__gt=cursor.pk)
+            ).order_by("updated_at", "pk")
+        else:
+            qs = queryset.filter(
+                Q(updated_at__lt=cursor.updated_at)
+                | Q(updated_at=cursor.updated_at, pk__lt=cursor.pk)
+            ).order_by(*self.ordering)
+
+        # Fetch one extra row to find out whether there's another page after this one.
+        rows = list(qs[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+
+        if cursor is None:
+            self.offset = 0
+            self.has_next = has_more
+            self.has_previous = False
+        elif cursor.reverse:
+            self.page.reverse()
+            self.offset = max(cursor.offset - len(self.page), 0)
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.offset = cursor.offset
+            self.has_next = has_more
+            self.has_previous = bool(self.page)
+        return self.page
+
+    def get_paginated_response(self, data: Any) -> Response:
+        next_cursor = previous_cursor = None
+        if self.has_next:
+            last = self.page[-1]
+            next_cursor = self.encode_cursor(
+                Cursor(last.updated_at, last.pk, self.offset + len(self.page), False)
+            )
+        if self.has_previous:
+            first = self.page[0]
+            previous_cursor = self.encode_cursor(
+                Cursor(first.updated_at, first.pk, self.offset, True)
+            )
+        return Response(
+            {
+                "pagination": {
+                    "hasNext": self.has_next,
+                    "hasPrevious": self.has_previous,
+                    "nextPageNumber": None,
+                    "previousPageNumber": None,
+                    "nextCursor": next_cursor,
+                    "previousCursor": previous_cursor,
+                    "startIndex": self.offset + 1 if self.page else 0,
+                    "endIndex": self.offset + len(self.page),
+                    "count": None,
+                },
+                "results": data,
+            }
+        )
+
+    def decode_cursor(self, request: Request) -> Optional[Cursor]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            data = load_cursor(encoded)
+            return Cursor(
+                updated_at=datetime.fromisoformat(data["u"]),
+                pk=uuid.UUID(data["i"]),
+                offset=max(int(data["o"]), 0),
+                reverse=bool(data["r"]),
+            )
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, cursor: Cursor) -> str:
+        return dump_cursor(
+            {
+                "u": cursor.updated_at.isoformat(),
+                "i": str(cursor.pk),
+                "o": cursor.offset,
+                "r": cursor.reverse,
+            }
+        )
+
+
+class KeysetCursorPagination(pagination.BasePagination):
+    """
+    Keyset pagination with a KeysetPaginator, so that APIs page through the same
+    cursors as the Django views that use one. Responses have the same shape as
+    SupergoodCursorPagination's, plus the (cached) "count".
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 40
+    key = "sort_key"
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Any], request: Request, view: Any = None
+    ) -> list[Any]:
+        paginator = KeysetPaginator(queryset, self.page_size, key=self.key)
+        try:
+            self.page = paginator.cursor_page(
+                request.query_params.get(self.cursor_query_param)
+            )
+        except InvalidPage as e:
+            raise NotFound(str(e))
+        return list(self.page)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response(
+            {
+                "pagination": {
+                    "hasNext": self.page.has_next(),
+                    "hasPrevious": self.page.has_previous(),
+                    "nextPageNumber": None,
+                    "previousPageNumber": None,
+                    "nextCursor": self.page.next_cursor,
+                    "previousCursor": self.page.previous_cursor,
+                    "startIndex": self.page.start_index(),
+                    "endIndex": self.page.end_index(),
+                    "count": self.page.paginator.count,
                 },
                 "results": data,
             }
         )
 
 
+class CatalogCacheMixin:
+    """
+    For API views whose responses only change when the catalog does.
+
+    Responses carry an ETag and Last-Modified derived from the catalog version, so
+    that clients can revalidate with a conditional GET and get a 304. Responses that
+    are the same for everyone who shares a cache scope are also cached server-side,
+    keyed on the catalog version, the query params and the scope.
+    """
+
+    request: Request
+    catalog_cache_timeout = 60 * 60
+
+    def get_catalog_cache_scope(self) -> str:
+        """Identifies everyone who gets the same response for the same query."""
+        return "public"
+
+    def is_catalog_cache_shared(self) -> bool:
+        """Whether responses for this scope can be cached server-side."""
+        return True
+
+    def get_cache_version(self) -> CatalogVersion:
+        """The version that responses are keyed on."""
+        return get_catalog_version()
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        version = self.get_cache_version()
+        query_params = sorted(
+            (key, sorted(values)) for key, values in request.query_params.lists()
+        )
+        key = catalog_cache_key(
+            version, request.path, query_params, self.get_catalog_cache_scope()
+        )
+        etag = quote_etag(key.rsplit(":", 1)[-1])
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=version.modified
+        )
+        if response is None:
+            shared = self.is_catalog_cache_shared()
+            data = cache.get(key) if shared else None
+            if data is not None:
+                response = Response(data)
+            else:
+                response = super().get(request, *args, **kwargs)  # type: ignore[misc]
+                if (
+                    shared
+                    and isinstance(response, Response)
+                    and response.status_code == 200
+                ):
+                    cache.set(key, response.data, self.catalog_cache_timeout)
+
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(version.modified)
+        patch_vary_headers(response, ("Cookie",))
+        return response
+
+
 class MediaTypeOptionSerializer(serializers.BaseSerializer):
     def to_representation(self, obj: BaseMediaItem) -> dict[str, Any]:
         return {
@@ -345,12 +648,13 @@ class MediaTypeOptionSerializer(serializers.BaseSerializer):
         }
 
 
-class MediaTypeChoicesApiView(views.APIView):
-    def get(self, request: Any, *args: Any, **kwargs: Any) -> Response:
+class MediaTypeChoicesApiView(CatalogCacheMixin, generics.ListAPIView):
+    serializer_class = MediaTypeOptionSerializer
+
+    # CatalogCacheMixin.get() calls this on a cache miss.
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         media_item_options = supergood_reads_engine.media_item_model_classes
-        serializer = MediaTypeOptionSerializer(
-            media_item_options, many=True
-        )  # Serialize the list
+        serializer = self.get_serializer(media_item_options, many=True)
         return Response(serializer.data)
 
 
@@ -360,7 +664,7 @@ class GenreSerializer(serializers.ModelSerializer):
         fields = ["name"]
 
 
-class GenreApiView(generics.ListAPIView):
+class GenreApiView(CatalogCacheMixin, generics.ListAPIView):
     serializer_class = GenreSerializer
 
     def get_queryset(self) -> QuerySet[Genre]:
@@ -373,30 +677,59 @@ class CountrySerializer(serializers.ModelSerializer):
         fields = ["name"]
 
 
-class CountryApiView(generics.ListAPIView):
+class CountryApiView(CatalogCacheMixin, generics.ListAPIView):
     serializer_class = CountrySerializer
 
     def get_queryset(self) -> QuerySet[Country]:
         return Country.objects.all().order_by("name")
 
 
+class BaseMediaItemListSerializer(serializers.ListSerializer):
+    """
+    Serializes a page of MediaItems with a fixed number of queries, however long the
+    page is: at most one per media type to load children, one per media type with
+    genres to load genres, and one for rating aggregates.
+    """
+
+    def to_representation(self, data: Any) -> list[dict[str, Any]]:
+        iterable = data.all() if isinstance(data, BaseManager) else data
+        media_items = BaseMediaItem.get_children(iterable, "genres")
+        self.context["rating_aggregates"] = MediaItemRatingAggregate.objects.in_bulk(
+            [item.pk for item in media_items]
+        )
+        return [self.child.to_representation(item) for item in media_items]
+
+
 class BaseMediaItemSerializer(serializers.Serializer):
+    # Placeholder id used to reverse each url once per serializer, rather than once
+    # per row.
+    url_placeholder_id = uuid.UUID(int=0)
+
+    class Meta:
+        list_serializer_class = BaseMediaItemListSerializer
+
     def to_representation(self, base: BaseMediaItem) -> dict[str, Any]:
         user = self.context["request"].user
         update_url: str | None = None
-        media_item = base.get_child()
+        media_item = base.get_child() if type(base) is BaseMediaItem else base
 
         genres: list[str] = []
         if issubclass(media_item.__class__, GenreMixin):  # type: ignore
-            genres = list(media_item.genres.all().values_list("name", flat=True))  # type: ignore
+            genres = [genre.name for genre in media_item.genres.all()]  # type: ignore
 
         if media_item.can_user_change(user):
-            update_url = reverse("update_media_item", args=[base.id])
+            update_url = self.update_url_template.replace(
+                str(self.url_placeholder_id), str(base.id)
+            )
 
-        base_review_url = reverse("create_review")
         review_query_params = QueryDict(mutable=True)
         review_query_params["base-media-item-id"] = str(base.id)
-        review_url = f"{base_review_url}?{review_query_params.urlencode()}"
+        review_url = f"{self.base_review_url}?{review_query_params.urlencode()}"
+
+        if "rating_aggregates" in self.context:
+            aggregate = self.context["rating_aggregates"].get(base.id)
+        else:
+            aggregate = MediaItemRatingAggregate.objects.filter(pk=base.id).first()
 
         return {
             "id": media_item.id,
@@ -407,23 +740,77 @@ class BaseMediaItemSerializer(serializers.Serializer):
             "icon": media_item.icon(),
             "updateUrl": update_url,
             "reviewUrl": review_url,
+            **rating_aggregate_fields(aggregate),
         }
 
+    @cached_property
+    def update_url_template(self) -> str:
+        return reverse("update_media_item", args=[self.url_placeholder_id])
+
+    @cached_property
+    def base_review_url(self) -> str:
+        return reverse("create_review")
 
-class MediaItemSearchView(generics.ListAPIView):
+
+class MediaItemSearchView(CatalogCacheMixin, generics.ListAPIView):
     serializer_class = BaseMediaItemSerializer
     pagination_class = SupergoodPagination
-    qs: QuerySet[BaseMediaItem]
+    # Used instead of "pagination_class" when the request has "pagination=cursor".
+    # Cursor pages are always ordered by recency, so search results lose their
+    # relevance ordering in this mode.
+    cursor_pagination_class = SupergoodCursorPagination
+    paginator_class = EstimatedCountPaginator
+    qs: QuerySet[MediaItemSearchDocument]
+
+    @property
+    def paginator(self) -> Optional[pagination.BasePagination]:
+        if not hasattr(self, "_paginator"):
+            if self.request.query_params.get("pagination") == "cursor":
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = super().paginator
+        return self._paginator
+
+    def get_catalog_cache_scope(self) -> str:
+        # Signed in users also see their own unvalidated MediaItems, and links to
+        # update the ones they can change.
+        user = self.request.user
+        return f"user:{user.pk}" if user.is_authenticated else "public"
+
+    def is_catalog_cache_shared(self) -> bool:
+        return not self.request.user.is_authenticated
 
-    def get_queryset(self) -> QuerySet[BaseMediaItem]:
+    def get_cache_version(self) -> CatalogVersion:
+        # Results include each MediaItem's rating aggregate.
+        return combine_versions(get_catalog_version(), get_ratings_version())
+
+    def get_queryset(self) -> QuerySet[MediaItemSearchDocument]:
         self.parse_query_params()
         self.set_searchable_media_types()
         self.set_qs()
         self.apply_genre_filter()
         self.apply_user_filter()
-        self.qs = self.qs.filter(title__icontains=self.q)
-        self.qs = self.qs.order_by("-updated_at")
-        return self.qs.distinct()
+        self.apply_search()
+        return self.qs
+
+    def paginate_queryset(self, queryset: QuerySet[Any]) -> Optional[list[Any]]:
+        documents = super().paginate_queryset(queryset)
+        if documents is None:
+            return None
+        return self.get_media_items(documents)
+
+    def get_media_items(
+        self, documents: list[MediaItemSearchDocument]
+    ) -> list[BaseMediaItem]:
+        """Load the MediaItems for a page of search documents, in the same order."""
+        select_related_args = [
+            media_type.__name__.lower() for media_type in self.searchable_media_types
+        ]
+        ids = [document.pk for document in documents]
+        media_items = BaseMediaItem.objects.select_related(
+            *select_related_args
+        ).in_bulk(ids)
+        return [media_items[id] for id in ids if id in media_items]
 
     def parse_query_params(self) -> None:
         query_params = self.request.query_params
@@ -431,6 +818,7 @@ class MediaItemSearchView(generics.ListAPIView):
         self.my_media_only = query_params.get("myMediaOnly", "false") == "true"
         self.genres = query_params.getlist("genres")
         self.media_type_ids = query_params.getlist("mediaTypes")
+        self.include_facets = query_params.get("facets", "false") == "true"
 
     def set_searchable_media_types(self) -> None:
         media_types = [content_type_id_to_model(m_id) for m_id in self.media_type_ids]
@@ -443,57 +831,93 @@ class MediaItemSearchView(generics.ListAPIView):
             )
 
     def set_qs(self) -> None:
-        if not self.searchable_media_types:
-            self.qs = BaseMediaItem.objects.none()
-
-        # select_related media_types
-        select_related_args = [
-            media_type.__name__.lower() for media_type in self.searchable_media_types
-        ]
-        self.qs = BaseMediaItem.objects.select_related(*select_related_args)
-
-        # filter for BaseMediaItems where selected media_types are not null
-        media_type_filter = Q()
-        for media_type in self.searchable_media_types:
-            non_null_media_type_filter = Q(
-                **{f"{media_type.__name__.lower()}__isnull": False}
-            )
-            media_type_filter |= non_null_media_type_filter
-        self.qs = self.qs.filter(media_type_filter)
+        content_types = ContentType.objects.get_for_models(
+            *self.searchable_media_types
+        ).values()
+        self.qs = MediaItemSearchDocument.objects.filter(content_type__in=content_types)
 
     def apply_genre_filter(self) -> None:
         if not self.genres:
             return
-
-        # prefetch our genres
-        prefetch_genres = [
-            Prefetch(f"{m.__name__.lower()}__genres")
-            for m in self.searchable_media_types
-        ]
-        self.qs = self.qs.prefetch_related(*prefetch_genres)
-
-        # filter by genre
-        genre_filter = Q()
-        for media_type in self.searchable_media_types:
-            genre_filter |= Q(
-                **{f"{media_type.__name__.lower()}__genres__name__in": self.genres}
-            )
-        self.qs = self.qs.filter(genre_filter)
+        qs = cast(MediaItemSearchDocumentQuerySet, self.qs)
+        self.qs = qs.with_any_genre(self.genres)
 
     def apply_user_filter(self) -> None:
+        self.qs = self.filter_visible(self.qs)
+
+    def filter_visible(
+        self, qs: QuerySet[MediaItemSearchDocument]
+    ) -> QuerySet[MediaItemSearchDocument]:
         owner_filter = Q(owner=self.request.user)
         validated_filter = Q(validated=True)
 
         if self.my_media_only:
             if self.request.user.is_authenticated:
-                self.qs = self.qs.filter(owner_filter)
+                return qs.filter(owner_filter)
             else:
-                self.qs = BaseMediaItem.objects.none()
+                return qs.none()
         else:
             if self.request.user.is_authenticated:
-                self.qs = self.qs.filter(validated_filter | owner_filter)
+                return qs.filter(validated_filter | owner_filter)
             else:
-                self.qs = self.qs.filter(validated_filter)
+                return qs.filter(validated_filter)
+
+    def apply_search(self) -> None:
+        search_backend = supergood_reads_engine.search_backend
+        self.qs = search_backend.search(self.qs, self.q)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        response = super().get_paginated_response(data)
+        if self.include_facets:
+            response.data["facets"] = self.get_facets()
+        return response
+
+    def get_facets(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        Count the matches for the current query per genre and per media type.
+
+        Both facets come from one query, grouped by each document's media type and
+        genres. Each facet is counted without its own filter, so that its counts show
+        what selecting another option would match.
+        """
+        content_types = ContentType.objects.get_for_models(*self.all_media_types)
+        qs = MediaItemSearchDocument.objects.filter(
+            content_type__in=content_types.values()
+        )
+        qs = self.filter_visible(qs)
+        qs = supergood_reads_engine.search_backend.search(qs, self.q)
+        rows = (
+            qs.order_by().values("content_type", "genres").annotate(count=Count("pk"))
+        )
+
+        searchable_content_type_ids = {
+            content_types[m].pk for m in self.searchable_media_types
+        }
+        selected_genres = set(self.genres)
+        # Selected genres are always listed, so they can still be deselected.
+        genre_counts: Counter[str] = Counter({name: 0 for name in self.genres})
+        media_type_counts: Counter[int] = Counter()
+        for row in rows:
+            genres = row["genres"]
+            if row["content_type"] in searchable_content_type_ids:
+                genre_counts.update({name: row["count"] for name in genres})
+            if not selected_genres or selected_genres.intersection(genres):
+                media_type_counts[row["content_type"]] += row["count"]
+
+        return {
+            "genres": [
+                {"name": name, "count": count}
+                for name, count in sorted(genre_counts.items())
+            ],
+            "mediaTypes": [
+                {
+                    "id": content_types[m].pk,
+                    "name": m._meta.verbose_name,
+                    "count": media_type_counts[content_types[m].pk],
+                }
+                for m in self.all_media_types
+            ],
+        }
 
     @property
     def all_media_types(self) -> list[type[BaseMediaItem]]:
@@ -519,26 +943,152 @@ class LibraryView(TemplateView):
     template_name = "supergood_reads/views/library.html"
 
 
-class MyReviewsView(ListView[Review]):
-    model = Review
+class MyReviewsView(ListView[ReviewListEntry]):
+    """
+    Pages through reviews with a "cursor" query param rather than page numbers, by
+    seeking on ReviewListEntry.sort_key. The key orders by completion date with missing
+    parts last, then by created_at and id, so every page is one range scan of the
+    owner or validated index, however far back it is.
+    """
+
+    model = ReviewListEntry
     paginate_by = 20
     context_object_name = "review_list"
     template_name = "supergood_reads/views/review_list/review_list.html"
 
-    def get_queryset(self) -> QuerySet[Review]:
-        user = self.request.user
-        all_reviews_qs = (
-            Review.objects.all()
-            .with_generic_relations()
-            .order_by("-completed_at_year", "-completed_at_month", "-completed_at_day")
+    def paginate_queryset(
+        self, queryset: "_SupportsPagination[ReviewListEntry]", page_size: int
+    ) -> tuple[Paginator[Any], Page[Any], "_SupportsPagination[ReviewListEntry]", bool]:
+        paginator = KeysetPaginator(queryset, page_size, key="sort_key")
+        try:
+            page = paginator.cursor_page(self.request.GET.get("cursor"))
+        except InvalidPage as e:
+            raise Http404(str(e))
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+    def get_queryset(self) -> ReviewListEntryQuerySet:
+        return ReviewListEntry.objects.get_queryset().visible_to(self.request.user)
+
+
+class ReviewListEntrySerializer(serializers.Serializer):
+    """
+    A row of the review list, with the rating as a number out of "ratingMax" rather
+    than as HTML. Only the fields in the "fields" context are included.
+    """
+
+    # Every field that a row can have, and the column it's read from.
+    columns = {
+        "id": "review_id",
+        "title": "title",
+        "year": "year",
+        "creator": "creator",
+        "mediaTypeId": "media_item_content_type_id",
+        "completedAt": "completed_at",
+        "rating": "rating",
+        "ratingMax": "rating_max",
+        "text": "text",
+        "validated": "validated",
+    }
+
+    def to_representation(self, entry: ReviewListEntry) -> dict[str, Any]:
+        fields = self.context.get("fields") or self.columns
+        return {field: getattr(entry, self.columns[field]) for field in fields}
+
+
+class ReviewListApiView(generics.ListAPIView):
+    """
+    The reviews of MyReviewsView as JSON, one cursor page at a time.
+
+    Clients can ask for only the fields they render with a comma separated "fields"
+    query param, such as "?fields=id,title,rating". Only those columns are read.
+    """
+
+    serializer_class = ReviewListEntrySerializer
+    pagination_class = KeysetCursorPagination
+
+    def get_fields(self) -> list[str]:
+        param = self.request.query_params.get("fields", "")
+        fields = [field for field in param.split(",") if field]
+        unknown = [f for f in fields if f not in ReviewListEntrySerializer.columns]
+        if unknown:
+            raise ValidationError({"fields": [f"Unknown fields: {', '.join(unknown)}"]})
+        return fields or list(ReviewListEntrySerializer.columns)
+
+    def get_serializer_context(self) -> dict[str, Any]:
+        context: dict[str, Any] = super().get_serializer_context()
+        context["fields"] = self.fields
+        return context
+
+    def get_queryset(self) -> ReviewListEntryQuerySet:
+        self.fields = self.get_fields()
+        columns = [ReviewListEntrySerializer.columns[field] for field in self.fields]
+        return (
+            ReviewListEntry.objects.get_queryset()
+            .visible_to(self.request.user)
+            .only(KeysetCursorPagination.key, *columns)
+        )
+
+
+class ReadingStatsApiView(views.APIView):
+    """
+    Reading stats of the signed in user: reviews completed per year and month, reviews
+    per media type, pages read and the distribution of Review.score.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return Response(get_reading_stats(request.user.pk))
+
+
+class BulkCreateReviewsApiView(views.APIView):
+    """
+    Create many of the signed in user's Reviews in one request, such as to import
+    their ratings from elsewhere. See BulkReviewFormGroup for the payload of each one.
+
+    Request:
+        {"reviews": [{...}, ...]}
+    Response:
+        {
+            "created": 1,
+            "failed": 1,
+            "results": [
+                {"index": 0, "id": "<uuid>"},
+                {"index": 1, "errors": {"strategy.fields.stars": ["..."]}},
+            ],
+        }
+
+    The valid reviews are created even when others fail, so that clients only need to
+    fix and resend the failed ones.
+    """
+
+    permission_classes = [permissions.DjangoModelPermissions]
+    # DjangoModelPermissions checks the add_review permission against this.
+    queryset = Review.objects.none()
+    max_reviews = 1000
+
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        payloads = (
+            request.data.get("reviews") if isinstance(request.data, dict) else None
+        )
+        if not isinstance(payloads, list):
+            raise ValidationError({"reviews": ["Expected a list of reviews."]})
+        if len(payloads) > self.max_reviews:
+            raise ValidationError(
+                {
+                    "reviews": [
+                        f"At most {self.max_reviews} reviews can be sent at once."
+                    ]
+                }
+            )
+
+        form_group = BulkReviewFormGroup(payloads, user=cast(User, request.user))
+        form_group.is_valid()
+        results = form_group.save()
+        created = sum(1 for result in results if "id" in result)
+        return Response(
+            {"created": created, "failed": len(results) - created, "results": results}
         )
-        if user.has_perm("supergood_reads.change_review"):
-            qs = all_reviews_qs
-        elif user.is_authenticated:
-            qs = all_reviews_qs.filter(owner=self.request.user)
-        else:
-            qs = all_reviews_qs.filter(validated=True)
-        return qs
 
 
 class StatusTemplateView(TemplateView):
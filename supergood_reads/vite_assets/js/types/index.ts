@@ -27,6 +27,7 @@ export type FilterOption = {
   value: string;
   label: string;
   checked: boolean;
+  count?: number;
 };
 
 export type Filter = {
@@ -45,4 +46,6 @@ export type MediaSearchResult = {
   icon: string;
   UpdateUrl: string;
   reviewUrl: string;
+  reviewCount: number;
+  averageScore: number | null;
 };
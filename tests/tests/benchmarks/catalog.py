@@ -0,0 +1,189 @@
+"""
+Fill the database with a large synthetic catalog for the benchmarks.
+
+Rows are written with bulk inserts rather than factories, so that millions of them can
+be created in minutes. Nothing here sends model signals, so the search documents and
+review list entries are rebuilt once everything else has been written.
+"""
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, Sequence, Type
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.db.models import Field, Model
+from django.utils import timezone
+
+from supergood_reads.models import (
+    AbstractReviewStrategy,
+    BaseMediaItem,
+    Book,
+    EbertStrategy,
+    Film,
+    Genre,
+    GoodreadsStrategy,
+    MediaItemSearchDocument,
+    Review,
+    ReviewListEntry,
+)
+
+WORDS = (
+    "the night house river city last summer king red garden winter war song "
+    "stranger glass road dark light secret island ghost letters bird sea stone "
+    "mountain empire love fire return daughter lost sky wolf long street blue"
+).split()
+GENRES = ["Drama", "Comedy", "Horror", "Documentary", "Action", "Western", "Fantasy"]
+
+
+@dataclass
+class Catalog:
+    users: list[User] = field(default_factory=list)
+    film_ids: list[uuid.UUID] = field(default_factory=list)
+    book_ids: list[uuid.UUID] = field(default_factory=list)
+
+    @property
+    def reviewer(self) -> User:
+        """The user that owns the most reviews."""
+        return self.users[0]
+
+
+def insert_children(model: Type[Model], objs: Sequence[Model]) -> None:
+    """
+    Insert the child table rows of multi-table inherited models, whose parent rows
+    already exist. bulk_create() can't do this for inherited models.
+    """
+    fields = [
+        f
+        for f in model._meta.get_fields(include_parents=False)
+        if isinstance(f, Field) and f.concrete and not f.many_to_many
+    ]
+    columns = ", ".join(connection.ops.quote_name(f.column) for f in fields)
+    placeholders = ", ".join(["%s"] * len(fields))
+    sql = (
+        f"INSERT INTO {connection.ops.quote_name(model._meta.db_table)} "
+        f"({columns}) VALUES ({placeholders})"
+    )
+    rows = [
+        [f.get_db_prep_save(getattr(obj, f.attname), connection) for f in fields]
+        for obj in objs
+    ]
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+
+
+def title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))).title()
+
+
+@transaction.atomic
+def build_catalog(
+    media_items: int, reviews: int, users: int = 100, batch_size: int = 5000
+) -> Catalog:
+    """
+    Create "media_items" Films and Books, split evenly, and "reviews" Reviews spread
+    over them. A third of the reviews belong to the first user.
+    """
+    rng = random.Random(0)
+    now = timezone.now()
+    catalog = Catalog()
+    catalog.users = [
+        User.objects.create_user(username=f"benchmark_user_{i}") for i in range(users)
+    ]
+    genres = [Genre.objects.get_or_create(name=name)[0] for name in GENRES]
+    film_content_type = ContentType.objects.get_for_model(Film)
+    book_content_type = ContentType.objects.get_for_model(Book)
+
+    for i in range(0, media_items, batch_size):
+        bases: list[BaseMediaItem] = []
+        films: list[Film] = []
+        books: list[Book] = []
+        film_genres = []
+        book_genres = []
+        for j in range(i, min(i + batch_size, media_items)):
+            is_film = j % 2 == 0
+            kwargs: dict[str, Any] = {
+                "id": uuid.uuid4(),
+                "owner": rng.choice(catalog.users),
+                "title": title(rng),
+                "year": rng.randint(1900, 2023),
+                "created_at": now,
+                "updated_at": now - timedelta(seconds=j),
+                "validated": rng.random() < 0.9,
+                "content_type": film_content_type if is_film else book_content_type,
+            }
+            bases.append(BaseMediaItem(**kwargs))
+            if is_film:
+                film = Film(basemediaitem_ptr_id=kwargs["id"], director=title(rng))
+                films.append(film)
+                catalog.film_ids.append(film.pk)
+                film_genres.append(
+                    Film.genres.through(film_id=film.pk, genre=rng.choice(genres))
+                )
+            else:
+                book = Book(
+                    basemediaitem_ptr_id=kwargs["id"],
+                    author=title(rng),
+                    pages=rng.randint(50, 900),
+                )
+                books.append(book)
+                catalog.book_ids.append(book.pk)
+                book_genres.append(
+                    Book.genres.through(book_id=book.pk, genre=rng.choice(genres))
+                )
+        BaseMediaItem.objects.bulk_create(bases)
+        insert_children(Film, films)
+        insert_children(Book, books)
+        Film.genres.through._default_manager.bulk_create(film_genres)
+        Book.genres.through._default_manager.bulk_create(book_genres)
+
+    ebert_content_type = ContentType.objects.get_for_model(EbertStrategy)
+    goodreads_content_type = ContentType.objects.get_for_model(GoodreadsStrategy)
+    for i in range(0, reviews, batch_size):
+        eberts: list[EbertStrategy] = []
+        goodreads: list[GoodreadsStrategy] = []
+        review_objs: list[Review] = []
+        for j in range(i, min(i + batch_size, reviews)):
+            owner = catalog.reviewer if j % 3 == 0 else rng.choice(catalog.users)
+            if j % 2 == 0 and catalog.film_ids:
+                media_item_content_type = film_content_type
+                media_item_id = rng.choice(catalog.film_ids)
+                ebert = EbertStrategy(stars=Decimal(rng.randint(0, 8)) / 2)
+                eberts.append(ebert)
+                strategy: AbstractReviewStrategy = ebert
+                strategy_content_type = ebert_content_type
+            else:
+                media_item_content_type = book_content_type
+                media_item_id = rng.choice(catalog.book_ids)
+                goodread = GoodreadsStrategy(stars=rng.randint(0, 5))
+                goodreads.append(goodread)
+                strategy = goodread
+                strategy_content_type = goodreads_content_type
+            completed_at = now - timedelta(days=rng.randint(0, 3650))
+            review_objs.append(
+                Review(
+                    owner=owner,
+                    created_at=now,
+                    updated_at=now,
+                    completed_at_day=completed_at.day,
+                    completed_at_month=completed_at.month,
+                    completed_at_year=completed_at.year,
+                    text=title(rng),
+                    validated=rng.random() < 0.5,
+                    score=strategy.normalized_score,
+                    strategy_content_type=strategy_content_type,
+                    strategy_object_id=strategy.pk,
+                    media_item_content_type=media_item_content_type,
+                    media_item_object_id=media_item_id,
+                )
+            )
+        EbertStrategy.objects.bulk_create(eberts)
+        GoodreadsStrategy.objects.bulk_create(goodreads)
+        Review.objects.bulk_create(review_objs)
+
+    MediaItemSearchDocument.objects.rebuild(batch_size=batch_size)
+    ReviewListEntry.objects.rebuild(batch_size=batch_size)
+    return catalog
@@ -0,0 +1,24 @@
+import os
+from typing import Any
+
+import pytest
+
+from tests.tests.benchmarks.catalog import Catalog, build_catalog
+
+# The benchmarks are slow to set up, so they only run when asked for, e.g. with
+# "make benchmark".
+if not os.environ.get("SUPERGOOD_READS_BENCHMARK"):
+    collect_ignore_glob = ["test_*.py"]
+
+MEDIA_ITEMS = int(os.environ.get("SUPERGOOD_READS_BENCHMARK_MEDIA_ITEMS", 20_000))
+REVIEWS = int(os.environ.get("SUPERGOOD_READS_BENCHMARK_REVIEWS", 100_000))
+
+
+@pytest.fixture(scope="session")
+def catalog(django_db_setup: Any, django_db_blocker: Any) -> Catalog:
+    """
+    Built once for the whole run, outside of any test's transaction, so that every
+    benchmark shares it.
+    """
+    with django_db_blocker.unblock():
+        return build_catalog(MEDIA_ITEMS, REVIEWS)
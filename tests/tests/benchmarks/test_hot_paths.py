@@ -0,0 +1,140 @@
+import os
+from io import StringIO
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+
+from supergood_reads.forms.review_forms import CreateNewMediaOption, ReviewFormGroup
+from supergood_reads.models import Book, Film, GoodreadsStrategy, Review
+from supergood_reads.utils.content_type import model_to_content_type_id
+from supergood_reads.utils.engine import supergood_reads_engine
+from supergood_reads.utils.strategy_storage import (
+    BaseStrategyStorage,
+    JsonStrategyStorage,
+    TableStrategyStorage,
+)
+from tests.factories import ReviewFormDataFactory
+from tests.tests.benchmarks.catalog import Catalog
+
+pytestmark = pytest.mark.django_db
+
+ROUNDS = int(os.environ.get("SUPERGOOD_READS_BENCHMARK_ROUNDS", 20))
+
+
+@pytest.fixture(
+    params=[TableStrategyStorage, JsonStrategyStorage], ids=["table", "json"]
+)
+def strategy_storage(request: Any, monkeypatch: Any) -> BaseStrategyStorage:
+    """Runs a benchmark once with each strategy storage."""
+    storage: BaseStrategyStorage = request.param()
+    monkeypatch.setattr(supergood_reads_engine, "strategy_storage", storage)
+    return storage
+
+
+def get(benchmark: Any, client: Client, url: str, params: Any = None) -> Any:
+    # Responses and counts are cached, so clear the cache before every round to time
+    # the work rather than the cache.
+    response = benchmark.pedantic(
+        client.get, args=(url, params), setup=cache.clear, rounds=ROUNDS
+    )
+    assert response.status_code == 200
+    return response
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"q": "river"},
+        {"pagination": "cursor"},
+        {"genres": ["Drama", "Western"], "facets": "true"},
+    ],
+    ids=["browse", "query", "cursor", "genres-facets"],
+)
+def test_media_item_search_view(
+    benchmark: Any, client: Client, catalog: Catalog, params: dict[str, Any]
+) -> None:
+    media_types = [model_to_content_type_id(Film), model_to_content_type_id(Book)]
+    get(
+        benchmark,
+        client,
+        reverse("media_search"),
+        {"mediaTypes": media_types, **params},
+    )
+
+
+@pytest.mark.parametrize("q", ["", "ri", "river"])
+def test_media_item_autocomplete_view(
+    benchmark: Any, client: Client, catalog: Catalog, q: str
+) -> None:
+    params = {"content_type_id": model_to_content_type_id(Film), "q": q}
+    get(benchmark, client, reverse("media_item_autocomplete"), params)
+
+
+def test_my_reviews_view(benchmark: Any, client: Client, catalog: Catalog) -> None:
+    client.force_login(catalog.reviewer)
+    get(benchmark, client, reverse("reviews"))
+
+
+class TestReviewFormGroup:
+    @pytest.fixture(autouse=True)
+    def setup(self, catalog: Catalog) -> None:
+        self.user = catalog.reviewer
+        data = ReviewFormDataFactory().data
+        data[
+            "review_mgmt-create_new_media_item_object"
+        ] = CreateNewMediaOption.SELECT_EXISTING.value
+        data["review-media_item_content_type"] = model_to_content_type_id(Book)
+        data["review-media_item_object_id"] = str(catalog.book_ids[0])
+        data["review-strategy_content_type"] = model_to_content_type_id(
+            GoodreadsStrategy
+        )
+        data["goodreadsstrategy-stars"] = "4"
+        data["review-text"] = "It was good."
+        self.data = data
+
+    def test_is_valid(self, benchmark: Any) -> None:
+        def is_valid() -> bool:
+            return ReviewFormGroup(data=self.data, user=self.user).is_valid()
+
+        assert benchmark.pedantic(is_valid, rounds=ROUNDS)
+
+    def test_save(self, benchmark: Any, strategy_storage: BaseStrategyStorage) -> None:
+        def save() -> Any:
+            review_form_group = ReviewFormGroup(data=self.data, user=self.user)
+            assert review_form_group.is_valid()
+            return review_form_group.save()
+
+        review = benchmark.pedantic(save, rounds=ROUNDS)
+        assert review.owner == self.user
+
+
+def test_review_strategies(
+    benchmark: Any, catalog: Catalog, strategy_storage: BaseStrategyStorage
+) -> None:
+    # The catalog's Strategies are in tables. Move a page of Reviews into the storage
+    # being measured, which the test's transaction rolls back.
+    review_ids = list(
+        Review.objects.filter(owner=catalog.reviewer).values_list("pk", flat=True)[:100]
+    )
+    strategy_storage.migrate(Review.objects.filter(pk__in=review_ids))
+
+    def rating_html() -> list[str]:
+        reviews = Review.objects.filter(pk__in=review_ids).prefetch_related("strategy")
+        return [review.rating_html for review in reviews]
+
+    assert len(benchmark.pedantic(rating_html, rounds=ROUNDS)) == len(review_ids)
+
+
+def test_load_test_data(benchmark: Any, catalog: Catalog) -> None:
+    # Loads thousands of titles, so a single round is enough.
+    benchmark.pedantic(
+        call_command,
+        args=("supergood_reads_load_test_data",),
+        kwargs={"stdout": StringIO()},
+        rounds=1,
+    )
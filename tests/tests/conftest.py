@@ -1,6 +1,7 @@
 from typing import Any
 
 import pytest
+from django.core.cache import cache
 
 from supergood_reads.forms.media_item_forms import BookForm, FilmForm
 from supergood_reads.forms.strategy_forms import (
@@ -27,3 +28,10 @@ class PytestSupergoodReadsConfig(SupergoodReadsConfig):
 def use_pytest_settings(settings: Any) -> None:
     # Only use a subset of strategies and media_items while testing.
     settings.SUPERGOOD_READS_CONFIG = "tests.tests.conftest.PytestSupergoodReadsConfig"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    # Cached counts would otherwise outlive the database rows of the test that
+    # created them.
+    cache.clear()
@@ -1,8 +1,16 @@
-from typing import Any, Dict
+import json
+from typing import Any, Dict, cast
 
 import pytest
+from django.forms import ModelForm
 
+from supergood_reads.forms.base import ContentTypeChoiceField, GenericRelationFormGroup
 from supergood_reads.forms.review_forms import ReviewForm
+from supergood_reads.forms.strategy_forms import (
+    EbertStrategyForm,
+    GoodreadsStrategyForm,
+    TomatoStrategyForm,
+)
 from supergood_reads.models import (
     Book,
     EbertStrategy,
@@ -10,6 +18,10 @@ from supergood_reads.models import (
     GoodreadsStrategy,
     TomatoStrategy,
 )
+from supergood_reads.templatetags.vue_tags import (
+    clear_field_schemas,
+    vue_field_interface,
+)
 from supergood_reads.utils.content_type import model_to_content_type_id
 
 
@@ -74,3 +86,98 @@ class TestReviewForm:
             form.errors["media_item_content_type"][0]
             == "Ebert is not a valid BaseMediaItem."
         )
+
+    def test_content_type_choices_need_no_queries(
+        self, form_data: Dict[str, Any], django_assert_num_queries: Any
+    ) -> None:
+        strategy_choices = [TomatoStrategy, EbertStrategy, GoodreadsStrategy]
+        form_data["strategy_content_type"] = model_to_content_type_id(Film)
+        with django_assert_num_queries(0):
+            form = ReviewForm(
+                form_data,
+                strategy_choices=strategy_choices,
+                media_item_choices=[Book, Film],
+            )
+            field = cast(ContentTypeChoiceField, form.fields["strategy_content_type"])
+            choices: list[Any] = list(field.choices)
+            form["media_item_content_type"].as_widget()
+            book_content_type = form.fields["media_item_content_type"].clean(
+                str(model_to_content_type_id(Book))
+            )
+
+        assert book_content_type.model_class() is Book
+        assert not form.is_valid()
+        assert sorted(value.value for value, label in choices) == sorted(
+            model_to_content_type_id(model) for model in strategy_choices
+        )
+        assert str(form.errors["strategy_content_type"][0]).startswith(
+            "Select a valid choice."
+        )
+        assert "media_item_content_type" not in form.errors
+
+
+@pytest.mark.django_db
+class TestGenericRelationFormGroup:
+    def test_only_selected_form_is_instantiated(self, monkeypatch: Any) -> None:
+        instantiated = []
+
+        def init(self: Any, *args: Any, **kwargs: Any) -> None:
+            instantiated.append(type(self))
+            super(type(self), self).__init__(*args, **kwargs)
+
+        form_classes: list[type[ModelForm[Any]]] = [
+            EbertStrategyForm,
+            GoodreadsStrategyForm,
+            TomatoStrategyForm,
+        ]
+        for form_class in form_classes:
+            monkeypatch.setattr(form_class, "__init__", init)
+        goodreads_id = model_to_content_type_id(GoodreadsStrategy)
+
+        group = GenericRelationFormGroup(
+            form_classes,
+            selected_form_id=goodreads_id,
+            data={"goodreadsstrategy-stars": "3"},
+        )
+        assert instantiated == [GoodreadsStrategyForm]
+        assert group.selected_form is group.by_content_type_id[goodreads_id]
+        assert group.selected_form.is_valid()
+        assert model_to_content_type_id(TomatoStrategy) in group.by_content_type_id
+        assert instantiated == [GoodreadsStrategyForm]
+
+        # Rendering every form instantiates the rest, unbound.
+        forms = dict(group.by_content_type_id.items())
+        assert sorted(f.__name__ for f in instantiated) == sorted(
+            f.__name__ for f in form_classes
+        )
+        assert not forms[model_to_content_type_id(EbertStrategy)].is_bound
+
+
+@pytest.mark.django_db
+def test_vue_field_interface(django_assert_num_queries: Any) -> None:
+    clear_field_schemas()
+    book_id = model_to_content_type_id(Book)
+    film_id = model_to_content_type_id(Film)
+    form = ReviewForm(prefix="review", media_item_choices=[Book, Film])
+    data = json.loads(vue_field_interface(form["media_item_content_type"]))
+    assert data["name"] == "review-media_item_content_type"
+    assert data["id"] == "id_review-media_item_content_type"
+    assert data["initialValue"] == ""
+    assert sorted(value for value, label in data["choices"]) == sorted(
+        [book_id, film_id]
+    )
+
+    # Only the bound value and errors are new, so the choices aren't queried again.
+    form = ReviewForm(
+        {"review-media_item_content_type": film_id},
+        prefix="review",
+        media_item_choices=[Book, Film],
+    )
+    form.is_valid()
+    with django_assert_num_queries(0):
+        bound_data = json.loads(vue_field_interface(form["media_item_content_type"]))
+    assert bound_data == {**data, "initialValue": film_id}
+
+    form = ReviewForm(prefix="review", media_item_choices=[Book])
+    data = json.loads(vue_field_interface(form["media_item_content_type"]))
+    assert data["choices"] == [[book_id, "Book"]]
@@ -0,0 +1,64 @@
+from typing import Any
+
+import pytest
+
+from supergood_reads.models import BaseMediaItem, Book, Film
+from supergood_reads.utils.content_type import model_to_content_type_id
+from tests.factories import BookFactory, FilmFactory
+
+
+@pytest.mark.django_db
+class TestGetChild:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.film = FilmFactory.create()
+        self.book = BookFactory.create()
+        self.film_content_type_id = model_to_content_type_id(Film)
+        model_to_content_type_id(Book)
+
+    def test_content_type_set_on_save(self) -> None:
+        base = BaseMediaItem.objects.get(pk=self.film.pk)
+        assert base.content_type_id == self.film_content_type_id
+        assert base.child_model_class is Film
+
+    def test_single_lookup(self, django_assert_num_queries: Any) -> None:
+        base = BaseMediaItem.objects.get(pk=self.film.pk)
+        with django_assert_num_queries(1):
+            assert base.get_child() == self.film
+        with django_assert_num_queries(0):
+            assert self.film.get_child() is self.film
+
+    def test_unknown_content_type(self) -> None:
+        BaseMediaItem.objects.filter(pk=self.book.pk).update(content_type=None)
+        base = BaseMediaItem.objects.get(pk=self.book.pk)
+        assert base.child_model_class is None
+        assert base.get_child() == self.book
+
+    def test_get_children(self, django_assert_num_queries: Any) -> None:
+        films = FilmFactory.create_batch(3)
+        bases = list(BaseMediaItem.objects.order_by("title"))
+        with django_assert_num_queries(2):
+            children = BaseMediaItem.get_children(bases)
+        assert [c.pk for c in children] == [b.pk for b in bases]
+        assert {type(c) for c in children} == {Film, Book}
+        assert set(films) < set(children)
+
+
+@pytest.mark.django_db
+def test_as_children(django_assert_num_queries: Any) -> None:
+    FilmFactory.create_batch(3)
+    BookFactory.create_batch(3)
+    qs = BaseMediaItem.objects.get_queryset().order_by("title")
+    expected = [m.pk for m in qs.all()]
+
+    # Rows, then Films and Books, then genres for each, then countries for Films.
+    with django_assert_num_queries(6):
+        children = qs.as_children("genres", "countries")
+    with django_assert_num_queries(0):
+        for child in children:
+            assert list(child.genres.all())  # type: ignore[attr-defined]
+            if isinstance(child, Film):
+                assert list(child.countries.all())
+
+    assert [c.pk for c in children] == expected
+    assert {type(c) for c in children} == {Film, Book}
@@ -0,0 +1,163 @@
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+from django.db import models
+from django.test import Client
+from django.urls import reverse
+
+from supergood_reads.models import (
+    Book,
+    GoodreadsStrategy,
+    MediaItemRatingAggregate,
+    ThumbsStrategy,
+)
+from supergood_reads.utils.content_type import model_to_content_type_id
+from tests.factories import BookFactory, FilmFactory, ReviewFactory
+
+
+def aggregate_fields(aggregate: MediaItemRatingAggregate) -> dict[str, Any]:
+    return {
+        field.attname: getattr(aggregate, field.attname)
+        for field in MediaItemRatingAggregate._meta.get_fields()
+        if isinstance(field, models.Field)
+    }
+
+
+@pytest.mark.django_db
+class TestMediaItemRatingAggregate:
+    def test_create(self) -> None:
+        book = BookFactory.create()
+        ReviewFactory.create(
+            media_item=book, strategy=GoodreadsStrategy.objects.create(stars=4)
+        )
+        review = ReviewFactory.create(
+            media_item=book, strategy=GoodreadsStrategy.objects.create(stars=1)
+        )
+
+        aggregate = MediaItemRatingAggregate.objects.get(media_item_id=book.pk)
+        assert aggregate.review_count == 2
+        assert aggregate.score_count == 2
+        assert aggregate.average_score == Decimal("50")
+        assert aggregate.histogram == [0, 1, 0, 0, 1]
+        assert aggregate.last_reviewed_at == review.created_at
+
+    def test_strategy_changes(self) -> None:
+        book = BookFactory.create()
+        strategy = ThumbsStrategy.objects.create(recommended=False)
+        ReviewFactory.create(media_item=book, strategy=strategy)
+
+        strategy.recommended = True
+        strategy.save()
+        aggregate = MediaItemRatingAggregate.objects.get(media_item_id=book.pk)
+        assert aggregate.average_score == Decimal("100")
+        assert aggregate.histogram == [0, 0, 0, 0, 1]
+
+        strategy.delete()
+        aggregate = MediaItemRatingAggregate.objects.get(media_item_id=book.pk)
+        assert aggregate.review_count == 1
+        assert aggregate.score_count == 0
+        assert aggregate.average_score is None
+        assert aggregate.histogram == [0, 0, 0, 0, 0]
+
+    def test_delete_rescored_review(self) -> None:
+        strategy = ThumbsStrategy.objects.create(recommended=False)
+        review = ReviewFactory.create(strategy=strategy)
+        strategy.recommended = True
+        strategy.save()
+
+        # The instance still has the score from before the strategy changed.
+        review.delete()
+        aggregate = MediaItemRatingAggregate.objects.get(pk=review.media_item_object_id)
+        assert aggregate.score_count == 0
+        assert aggregate.histogram == [0, 0, 0, 0, 0]
+
+    def test_move_and_delete_review(self) -> None:
+        book, film = BookFactory.create(), FilmFactory.create()
+        first = ReviewFactory.create(media_item=book)
+        second = ReviewFactory.create(media_item=book)
+
+        second.media_item = film
+        second.save()
+        assert MediaItemRatingAggregate.objects.get(pk=book.pk).review_count == 1
+        film_aggregate = MediaItemRatingAggregate.objects.get(pk=film.pk)
+        assert film_aggregate.review_count == 1
+        assert film_aggregate.score_sum == second.score
+
+        first.delete()
+        aggregate = MediaItemRatingAggregate.objects.get(pk=book.pk)
+        assert aggregate.review_count == 0
+        assert aggregate.score_count == 0
+        assert aggregate.last_reviewed_at is None
+
+    def test_saves_that_keep_the_aggregates(
+        self, django_assert_num_queries: Any
+    ) -> None:
+        review = ReviewFactory.create(
+            strategy=GoodreadsStrategy.objects.create(stars=4)
+        )
+
+        # The stored aggregation, the Review and its list entry.
+        with django_assert_num_queries(3):
+            review.save()
+        review.text = "Reread"
+        # The Review and its list entry.
+        with django_assert_num_queries(2):
+            review.save(update_fields=["text"])
+        aggregate = MediaItemRatingAggregate.objects.get(pk=review.media_item_object_id)
+        assert aggregate.review_count == 1
+        assert aggregate.histogram == [0, 0, 0, 0, 1]
+
+    def test_rebuild_command(self) -> None:
+        books = BookFactory.create_batch(3)
+        for book in books[:2]:
+            ReviewFactory.create_batch(3, media_item=book)
+        expected = [
+            aggregate_fields(a) for a in MediaItemRatingAggregate.objects.order_by("pk")
+        ]
+        MediaItemRatingAggregate.objects.all().delete()
+
+        call_command(
+            "supergood_reads_rebuild_rating_aggregates", "--batch-size=2", stdout=None
+        )
+        assert [
+            aggregate_fields(a) for a in MediaItemRatingAggregate.objects.order_by("pk")
+        ] == expected
+
+
+@pytest.mark.django_db
+def test_search_includes_rating_aggregate(client: Client) -> None:
+    book = BookFactory.create()
+    ReviewFactory.create(
+        media_item=book, strategy=GoodreadsStrategy.objects.create(stars=3)
+    )
+    BookFactory.create()
+
+    response = client.get(
+        reverse("media_search"), {"mediaTypes": [model_to_content_type_id(Book)]}
+    )
+    results = {r["id"]: r for r in response.json()["results"]}
+    assert len(results) == 2
+    assert results[str(book.pk)]["reviewCount"] == 1
+    assert results[str(book.pk)]["averageScore"] == 60.0
+    for result in results.values():
+        if result["id"] != str(book.pk):
+            assert result["reviewCount"] == 0
+            assert result["averageScore"] is None
+
+
+@pytest.mark.django_db
+def test_autocomplete_includes_rating_aggregate(admin_client: Client) -> None:
+    book = BookFactory.create(title="Dune")
+    ReviewFactory.create(
+        media_item=book, strategy=GoodreadsStrategy.objects.create(stars=5)
+    )
+
+    response = admin_client.get(
+        reverse("media_item_autocomplete"),
+        {"content_type_id": str(model_to_content_type_id(Book)), "q": "Dune"},
+    )
+    [result] = response.json()["results"]
+    assert result["reviewCount"] == 1
+    assert result["averageScore"] == 100.0
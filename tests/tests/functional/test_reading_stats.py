@@ -0,0 +1,137 @@
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from supergood_reads.models import Book, EbertStrategy, Film, GoodreadsStrategy
+from supergood_reads.utils.content_type import model_to_content_type_id
+from supergood_reads.utils.reading_stats import get_reading_stats
+from tests.factories import BookFactory, FilmFactory, ReviewFactory, UserFactory
+
+
+@pytest.mark.django_db
+class TestReadingStatsApiView:
+    def test_stats(self, client: Client, django_assert_max_num_queries: Any) -> None:
+        user = UserFactory.create()
+        dune = BookFactory.create(title="Dune", pages=400)
+        ReviewFactory.create(
+            owner=user,
+            media_item=dune,
+            strategy=GoodreadsStrategy.objects.create(stars=5),
+            completed_at_day=1,
+            completed_at_month=2,
+            completed_at_year=2020,
+        )
+        # Re-reading a Book doesn't count its pages twice.
+        ReviewFactory.create(
+            owner=user,
+            media_item=dune,
+            strategy=GoodreadsStrategy.objects.create(stars=1),
+            completed_at_day=None,
+            completed_at_month=None,
+            completed_at_year=2020,
+        )
+        ReviewFactory.create(
+            owner=user,
+            media_item=BookFactory.create(pages=100),
+            strategy=GoodreadsStrategy.objects.create(stars=3),
+            completed_at=None,
+        )
+        ReviewFactory.create(
+            owner=user,
+            media_item=FilmFactory.create(),
+            strategy=EbertStrategy.objects.create(stars=None),
+            completed_at_day=None,
+            completed_at_month=2,
+            completed_at_year=2020,
+        )
+        ReviewFactory.create_batch(3, owner=UserFactory.create())
+        client.force_login(user)
+
+        # Session, user, then four aggregate queries.
+        with django_assert_max_num_queries(6):
+            response = client.get(reverse("reading_stats_api"))
+        assert response.status_code == 200
+        assert response.json() == {
+            "reviewCount": 4,
+            "completed": [
+                {"year": 2020, "month": None, "count": 1},
+                {"year": 2020, "month": 2, "count": 2},
+            ],
+            "mediaTypes": [
+                {"id": model_to_content_type_id(Book), "name": "Book", "count": 3},
+                {"id": model_to_content_type_id(Film), "name": "Film", "count": 1},
+            ],
+            "pagesRead": 500,
+            "ratings": {"buckets": [0, 1, 0, 1, 1], "unrated": 1},
+        }
+
+        # Session and user only.
+        with django_assert_max_num_queries(2):
+            client.get(reverse("reading_stats_api"))
+
+    def test_anonymous_user(self, client: Client) -> None:
+        response = client.get(reverse("reading_stats_api"))
+        assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestReadingStatsCache:
+    def test_review_writes(self) -> None:
+        user = UserFactory.create()
+        strategy = GoodreadsStrategy.objects.create(stars=1)
+        review = ReviewFactory.create(owner=user, strategy=strategy)
+        assert get_reading_stats(user.pk)["ratings"]["buckets"] == [0, 1, 0, 0, 0]
+
+        strategy.stars = 5
+        strategy.save()
+        assert get_reading_stats(user.pk)["ratings"]["buckets"] == [0, 0, 0, 0, 1]
+
+        ReviewFactory.create(owner=user)
+        assert get_reading_stats(user.pk)["reviewCount"] == 2
+
+        review.delete()
+        assert get_reading_stats(user.pk)["reviewCount"] == 1
+
+    def test_other_users_reviews(self, django_assert_num_queries: Any) -> None:
+        user = UserFactory.create()
+        review = ReviewFactory.create(owner=user)
+        get_reading_stats(user.pk)
+
+        ReviewFactory.create(owner=UserFactory.create(), media_item=review.media_item)
+        with django_assert_num_queries(0):
+            assert get_reading_stats(user.pk)["reviewCount"] == 1
+
+    def test_book_pages_change(self) -> None:
+        user = UserFactory.create()
+        book = BookFactory.create(pages=100)
+        ReviewFactory.create(owner=user, media_item=book)
+        assert get_reading_stats(user.pk)["pagesRead"] == 100
+
+        book.pages = 120
+        book.save()
+        assert get_reading_stats(user.pk)["pagesRead"] == 120
+
+    def test_other_media_item_changes(self, django_assert_num_queries: Any) -> None:
+        user = UserFactory.create()
+        book = BookFactory.create(pages=100)
+        ReviewFactory.create(owner=user, media_item=book)
+        get_reading_stats(user.pk)
+
+        other_book = BookFactory.create(pages=10)
+        other_book.pages = 20
+        other_book.save()
+        book.title = "Retitled"
+        book.save(update_fields=["title"])
+        with django_assert_num_queries(0):
+            assert get_reading_stats(user.pk)["pagesRead"] == 100
+
+    def test_rounding(self) -> None:
+        user = UserFactory.create()
+        ReviewFactory.create(
+            owner=user, strategy=EbertStrategy.objects.create(stars=Decimal("3.0"))
+        )
+        # 75 is in the fourth bucket, [60, 80).
+        assert get_reading_stats(user.pk)["ratings"]["buckets"] == [0, 0, 0, 1, 0]
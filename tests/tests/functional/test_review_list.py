@@ -0,0 +1,260 @@
+import uuid
+from typing import Any
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+
+from supergood_reads.models import GoodreadsStrategy, Review, ReviewListEntry
+from tests.factories import (
+    BookFactory,
+    EbertStrategyFactory,
+    FilmFactory,
+    ReviewFactory,
+    UserFactory,
+)
+
+
+@pytest.mark.django_db
+class TestReviewListEntry:
+    def test_create(self) -> None:
+        book = BookFactory.create(title="Dune", author="Frank Herbert", year=1965)
+        review = ReviewFactory.create(
+            media_item=book,
+            strategy=GoodreadsStrategy.objects.create(stars=4),
+            completed_at_day=2,
+            completed_at_month=3,
+            completed_at_year=2001,
+        )
+
+        entry = ReviewListEntry.objects.get(review=review)
+        assert entry.owner_id == review.owner_id
+        assert entry.title == "Dune"
+        assert entry.year == 1965
+        assert entry.creator == "Frank Herbert"
+        assert entry.completed_at == "02 Mar 2001"
+        assert entry.rating_html == review.strategy.rating_html
+        assert entry.text == review.text
+        assert entry.icon == book.icon()
+
+    def test_media_item_changes(self) -> None:
+        film = FilmFactory.create(title="Alien")
+        review = ReviewFactory.create(media_item=film)
+
+        film.title = "Aliens"
+        film.save()
+        assert ReviewListEntry.objects.get(review=review).title == "Aliens"
+
+    def test_strategy_changes(self) -> None:
+        strategy = EbertStrategyFactory.create(goat=False)
+        review = ReviewFactory.create(strategy=strategy)
+
+        strategy.goat = True
+        strategy.save()
+        entry = ReviewListEntry.objects.get(review=review)
+        assert entry.rating_html == strategy.rating_html
+
+        strategy.delete()
+        assert ReviewListEntry.objects.get(review=review).rating_html == ""
+
+    def test_delete_review(self) -> None:
+        review = ReviewFactory.create()
+        review.delete()
+        assert not ReviewListEntry.objects.exists()
+
+    def test_missing_entry(self) -> None:
+        review = ReviewFactory.create(text="It was bad.")
+        ReviewListEntry.objects.all().delete()
+
+        review.text = "It was good."
+        review.save()
+        assert ReviewListEntry.objects.get(review=review).text == "It was good."
+
+    def test_ordering(self) -> None:
+        older = ReviewFactory.create(completed_at_month=12, completed_at_year=2000)
+        newest = ReviewFactory.create(
+            completed_at_day=1, completed_at_month=1, completed_at_year=2020
+        )
+        undated = ReviewFactory.create(completed_at=None)
+        newer = ReviewFactory.create(completed_at_year=2010)
+
+        assert [e.review_id for e in ReviewListEntry.objects.all()] == [
+            newest.pk,
+            newer.pk,
+            older.pk,
+            undated.pk,
+        ]
+
+    def test_rebuild(self) -> None:
+        reviews = ReviewFactory.create_batch(3)
+        ReviewListEntry.objects.all().delete()
+
+        call_command("supergood_reads_rebuild_review_list", stdout=None)
+        assert {e.review_id for e in ReviewListEntry.objects.all()} == {
+            r.pk for r in reviews
+        }
+
+    def test_rebuild_renders_migrated_entries(self) -> None:
+        book = BookFactory.create(title="Dune")
+        review = ReviewFactory.create(
+            media_item=book, strategy=GoodreadsStrategy.objects.create(stars=4)
+        )
+        # How migrations 0008 and 0009 leave an entry.
+        ReviewListEntry.objects.filter(review=review).update(
+            media_item_content_type=None, title="", rating_html="", rating_max=None
+        )
+
+        call_command("supergood_reads_rebuild_review_list", stdout=None)
+        entry = ReviewListEntry.objects.get(review=review)
+        assert entry.title == "Dune"
+        assert entry.rating_html == review.strategy.rating_html
+        assert entry.rating_max == GoodreadsStrategy.rating_max
+
+
+@pytest.mark.django_db
+class TestMyReviewsView:
+    def test_own_reviews(
+        self, client: Client, django_assert_max_num_queries: Any
+    ) -> None:
+        user = UserFactory.create()
+        own_reviews = ReviewFactory.create_batch(5, owner=user)
+        ReviewFactory.create_batch(2, owner=UserFactory.create())
+        client.force_login(user)
+
+        # Session, user, permissions, count and page, however many reviews there are.
+        with django_assert_max_num_queries(6):
+            response = client.get(reverse("reviews"))
+        assert response.status_code == 200
+        assert {e.review_id for e in response.context["review_list"]} == {
+            r.pk for r in own_reviews
+        }
+        for review in own_reviews:
+            assert (
+                reverse("update_review", args=[review.pk]) in response.content.decode()
+            )
+
+    def test_anonymous_user_sees_validated_reviews(self, client: Client) -> None:
+        validated = ReviewFactory.create(validated=True)
+        ReviewFactory.create(validated=False)
+
+        response = client.get(reverse("reviews"))
+        assert [e.review_id for e in response.context["review_list"]] == [validated.pk]
+
+    def test_count_follows_validation(self, client: Client) -> None:
+        review, _ = ReviewFactory.create_batch(2, validated=True)
+        response = client.get(reverse("reviews"))
+        assert response.context["paginator"].count == 2
+
+        # The entry is updated without a signal, but its cached count still changes.
+        review.validated = False
+        review.save()
+        response = client.get(reverse("reviews"))
+        assert response.context["paginator"].count == 1
+
+    def test_staff_sees_all_reviews(self, client: Client, admin_user: User) -> None:
+        ReviewFactory.create_batch(3)
+        client.force_login(admin_user)
+
+        response = client.get(reverse("reviews"))
+        assert len(response.context["review_list"]) == Review.objects.count()
+
+    def test_cursor_pagination(
+        self, client: Client, django_assert_max_num_queries: Any
+    ) -> None:
+        user = UserFactory.create()
+        reviews = ReviewFactory.create_batch(45, owner=user)
+        # Partial dates sort before undated reviews, after complete ones.
+        reviews += [
+            ReviewFactory.create(owner=user, completed_at_year=1900),
+            ReviewFactory.create(owner=user, completed_at=None),
+        ]
+        expected = [e.review_id for e in ReviewListEntry.objects.filter(owner=user)]
+        assert expected[-2:] == [reviews[-2].pk, reviews[-1].pk]
+        client.force_login(user)
+
+        seen: list[uuid.UUID] = []
+        pages = []
+        params: dict[str, str] = {}
+        while True:
+            with django_assert_max_num_queries(6):
+                response = client.get(reverse("reviews"), params)
+            page = response.context["page_obj"]
+            assert page.start_index() == len(seen) + 1
+            seen += [e.review_id for e in page]
+            pages.append(page)
+            if not page.has_next():
+                break
+            params = {"cursor": page.next_cursor}
+        assert seen == expected
+        assert [len(p) for p in pages] == [20, 20, 7]
+
+        response = client.get(reverse("reviews"), {"cursor": pages[-1].previous_cursor})
+        page = response.context["page_obj"]
+        assert [e.review_id for e in page] == expected[20:40]
+        assert page.start_index() == 21
+        assert page.has_previous()
+
+        response = client.get(reverse("reviews"), {"cursor": page.previous_cursor})
+        page = response.context["page_obj"]
+        assert [e.review_id for e in page] == expected[:20]
+        assert not page.has_previous()
+
+    def test_invalid_cursor(self, client: Client) -> None:
+        response = client.get(reverse("reviews"), {"cursor": "nope"})
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestReviewListApiView:
+    def test_fields(self, client: Client, django_assert_max_num_queries: Any) -> None:
+        user = UserFactory.create()
+        review = ReviewFactory.create(
+            owner=user,
+            media_item=BookFactory.create(title="Dune"),
+            strategy=GoodreadsStrategy.objects.create(stars=4),
+        )
+        client.force_login(user)
+
+        with django_assert_max_num_queries(6):
+            response = client.get(reverse("reviews_api"), {"fields": "id,title,rating"})
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {"id": str(review.pk), "title": "Dune", "rating": 4.0}
+        ]
+
+        response = client.get(reverse("reviews_api"))
+        row = response.json()["results"][0]
+        assert set(row) == {
+            "id",
+            "title",
+            "year",
+            "creator",
+            "mediaTypeId",
+            "completedAt",
+            "rating",
+            "ratingMax",
+            "text",
+            "validated",
+        }
+        assert row["ratingMax"] == 5.0
+
+    def test_unknown_field(self, client: Client) -> None:
+        response = client.get(reverse("reviews_api"), {"fields": "id,rating_html"})
+        assert response.status_code == 400
+
+    def test_pagination(self, client: Client) -> None:
+        reviews = ReviewFactory.create_batch(45, validated=True)
+
+        ids: list[str] = []
+        params = {"fields": "id"}
+        while True:
+            data = client.get(reverse("reviews_api"), params).json()
+            assert data["pagination"]["count"] == 45
+            ids += [row["id"] for row in data["results"]]
+            if not data["pagination"]["hasNext"]:
+                break
+            params["cursor"] = data["pagination"]["nextCursor"]
+        assert sorted(ids) == sorted(str(r.pk) for r in reviews)
+        assert len(ids) == 45
@@ -1,8 +1,20 @@
+from decimal import Decimal
+from typing import Any
+
 import pytest
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 
-from supergood_reads.models import Review
-from tests.factories import ReviewFactory
+from supergood_reads.models import (
+    EbertStrategy,
+    GoodreadsStrategy,
+    ImdbStrategy,
+    LetterboxdStrategy,
+    Review,
+    ThumbsStrategy,
+    TomatoStrategy,
+)
+from tests.factories import EbertStrategyFactory, ReviewFactory
 
 
 @pytest.mark.django_db
@@ -52,3 +64,50 @@ class TestCompletedAt:
         assert "'completed_at_month': [\"Can't input a month without a year.\"]" in str(
             e
         )
+
+
+@pytest.mark.django_db
+class TestScore:
+    @pytest.mark.parametrize(
+        "strategy,score",
+        [
+            (EbertStrategy(stars=Decimal("2.5")), Decimal("62.5")),
+            (EbertStrategy(stars=Decimal("3.0"), goat=True), Decimal("100")),
+            (EbertStrategy(stars=None), None),
+            (GoodreadsStrategy(stars=3), Decimal("60")),
+            (ImdbStrategy(score=7), Decimal("70")),
+            (LetterboxdStrategy(stars=Decimal("0.5")), Decimal("10")),
+            (ThumbsStrategy(recommended=False), Decimal("0")),
+            (TomatoStrategy(fresh=True), Decimal("100")),
+        ],
+    )
+    def test_strategy_score(self, strategy: Any, score: Decimal | None) -> None:
+        strategy.save()
+        review = ReviewFactory.create(strategy=strategy)
+        review.refresh_from_db()
+        assert review.score == score
+
+    def test_strategy_changes(self) -> None:
+        strategy = EbertStrategyFactory.create(stars=Decimal("1.0"))
+        review = ReviewFactory.create(strategy=strategy)
+
+        strategy.stars = Decimal("3.0")
+        strategy.save()
+        review.refresh_from_db()
+        assert review.score == Decimal("75")
+
+        strategy.delete()
+        review.refresh_from_db()
+        assert review.score is None
+
+    def test_update_scores_command(self) -> None:
+        reviews = ReviewFactory.create_batch(5)
+        Review.objects.update(score=None)
+
+        call_command(
+            "supergood_reads_update_review_scores", "--batch-size=2", stdout=None
+        )
+        for review in reviews:
+            review.refresh_from_db()
+            assert review.score == review.strategy.normalized_score
+            assert review.score is not None
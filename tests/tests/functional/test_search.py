@@ -0,0 +1,412 @@
+import json
+from datetime import timedelta
+from io import StringIO
+from typing import Any
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from supergood_reads.models import (
+    BaseMediaItem,
+    Book,
+    Film,
+    Genre,
+    MediaItemSearchDocument,
+    MediaItemSearchDocumentGenre,
+)
+from supergood_reads.search.autocomplete import (
+    PrefixAutocompleteBackend,
+    TrigramAutocompleteBackend,
+    WordPrefixAutocompleteBackend,
+)
+from supergood_reads.search.backends import (
+    IContainsSearchBackend,
+    SqliteFTS5SearchBackend,
+    search_terms,
+)
+from supergood_reads.utils.content_type import model_to_content_type_id
+from supergood_reads.utils.engine import supergood_reads_engine
+from supergood_reads.views.views import SupergoodCursorPagination
+from tests.factories import BookFactory, FilmFactory
+
+
+def search(client: Client, q: str) -> list[dict[str, Any]]:
+    url = reverse("media_search")
+    params: dict[str, Any] = {"q": q, "mediaTypes": [model_to_content_type_id(Film)]}
+    response = client.get(url, params)
+    assert response.status_code == 200
+    results: list[dict[str, Any]] = json.loads(response.content)["results"]
+    return results
+
+
+def test_search_terms() -> None:
+    assert search_terms(" Seven  Samurai! ") == ["seven", "samurai"]
+    assert search_terms('"*') == []
+
+
+@pytest.mark.django_db
+class TestSqliteFTS5SearchBackend:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.backend = SqliteFTS5SearchBackend()
+        FilmFactory.create(title="Seven Samurai")
+        FilmFactory.create(title="Samurai Rebellion")
+        FilmFactory.create(title="Charade")
+
+    def titles(self, q: str) -> list[str]:
+        qs = self.backend.search(MediaItemSearchDocument.objects.all(), q)
+        return [document.title for document in qs]
+
+    def test_prefix_match(self) -> None:
+        assert set(self.titles("sam")) == {"Seven Samurai", "Samurai Rebellion"}
+
+    def test_all_terms_must_match(self) -> None:
+        assert self.titles("seven samurai") == ["Seven Samurai"]
+
+    def test_ranked_by_relevance(self) -> None:
+        FilmFactory.create(title="Samurai Samurai")
+        assert self.titles("samurai")[0] == "Samurai Samurai"
+
+    def test_index_follows_updates_and_deletes(self) -> None:
+        film = Film.objects.get(title="Charade")
+        film.title = "Charades"
+        film.save()
+        assert self.titles("charades") == ["Charades"]
+
+        film.delete()
+        assert self.titles("charade") == []
+
+    def test_punctuation_only(self) -> None:
+        assert self.titles('"') == []
+
+    def test_empty_query(self) -> None:
+        assert len(self.titles("")) == 3
+
+    def test_media_items_not_indexed(self) -> None:
+        # Only the search documents are indexed, so MediaItem writes skip FTS5.
+        with connection.cursor() as cursor:
+            tables = connection.introspection.table_names(cursor)
+        assert "supergood_reads_mediaitemsearchdocument_fts" in tables
+        assert "supergood_reads_basemediaitem_fts" not in tables
+
+
+@pytest.mark.django_db
+def test_icontains_search_backend() -> None:
+    FilmFactory.create(title="Seven Samurai")
+    FilmFactory.create(title="Charade")
+    qs = IContainsSearchBackend().search(BaseMediaItem.objects.all(), "amura")
+    assert [m.title for m in qs] == ["Seven Samurai"]
+
+
+@pytest.mark.django_db
+def test_media_item_search_view(client: Client) -> None:
+    FilmFactory.create(title="Seven Samurai")
+    FilmFactory.create(title="Charade")
+    results = search(client, "sev")
+    assert [r["title"] for r in results] == ["Seven Samurai"]
+
+
+@pytest.mark.django_db
+def test_media_item_search_view_query_count(
+    client: Client, django_user_model: Any
+) -> None:
+    user = django_user_model.objects.create_user(username="owner")
+    client.force_login(user)
+    drama = Genre.objects.create(name="Drama")
+    url = reverse("media_search")
+    params = {"mediaTypes": [model_to_content_type_id(m) for m in (Film, Book)]}
+
+    def get_results() -> tuple[int, list[dict[str, Any]]]:
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, params)
+        results: list[dict[str, Any]] = json.loads(response.content)["results"]
+        return len(queries), results
+
+    FilmFactory.create(owner=user, genres=[drama])
+    BookFactory.create(genres=[drama])
+    num_queries, results = get_results()
+    assert len(results) == 2
+
+    for _ in range(5):
+        FilmFactory.create(owner=user, genres=[drama])
+        BookFactory.create(genres=[drama])
+    assert get_results()[0] == num_queries
+
+    _, results = get_results()
+    assert len(results) == 12
+    assert all(r["genres"] == ["Drama"] for r in results)
+    assert sum(r["updateUrl"] is not None for r in results) == 6
+
+
+@pytest.mark.django_db
+class TestMediaItemSearchDocument:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.drama = Genre.objects.create(name="Drama")
+        self.western = Genre.objects.create(name="Western")
+        self.film = FilmFactory.create(
+            title="Seven Samurai", director="Akira Kurosawa", genres=[self.drama]
+        )
+
+    def document(self) -> MediaItemSearchDocument:
+        return MediaItemSearchDocument.objects.get(pk=self.film.pk)
+
+    def test_created_on_save(self) -> None:
+        document = self.document()
+        assert document.title == "Seven Samurai"
+        assert document.creator == "Akira Kurosawa"
+        assert document.content_type_id == model_to_content_type_id(Film)
+        assert document.genre_names == ["Drama"]
+        assert document.owner_id == self.film.owner_id
+
+        self.film.title = "Shichinin no Samurai"
+        self.film.save()
+        assert self.document().title == "Shichinin no Samurai"
+
+    def test_follows_genres(self) -> None:
+        self.film.genres.add(self.western)
+        assert self.document().genre_names == ["Drama", "Western"]
+        self.drama.film_set.remove(self.film)
+        assert self.document().genre_names == ["Western"]
+
+        self.western.name = "Jidaigeki"
+        self.western.save()
+        assert self.document().genre_names == ["Jidaigeki"]
+        self.western.delete()
+        assert self.document().genre_names == []
+        assert not MediaItemSearchDocumentGenre.objects.exists()
+
+    def test_with_any_genre(self) -> None:
+        pipe = Genre.objects.create(name="Noir|Crime")
+        FilmFactory.create(title="Stray Dog", genres=[pipe])
+        documents = MediaItemSearchDocument.objects.get_queryset()
+
+        def titles(*names: str) -> set[str]:
+            return {d.title for d in documents.with_any_genre(names)}
+
+        assert titles("Drama") == {"Seven Samurai"}
+        assert titles("Drama", "Noir|Crime") == {"Seven Samurai", "Stray Dog"}
+        # Names match exactly, not as substrings or regardless of case.
+        assert titles("drama") == set()
+        assert titles("Noir") == set()
+        assert titles("Dram") == set()
+
+    def test_deleted_with_media_item(self) -> None:
+        self.film.delete()
+        assert not MediaItemSearchDocument.objects.exists()
+
+    def test_rebuild(self) -> None:
+        Film.objects.filter(pk=self.film.pk).update(title="Sanjuro")
+        call_command("supergood_reads_rebuild_search_documents", stdout=StringIO())
+        assert self.document().title == "Sanjuro"
+        assert list(
+            MediaItemSearchDocumentGenre.objects.values_list("name", flat=True)
+        ) == ["Drama"]
+
+    def test_search_view(self, client: Client) -> None:
+        FilmFactory.create(title="Charade", genres=[self.western])
+        assert [r["title"] for r in search(client, "kurosawa")] == ["Seven Samurai"]
+
+        url = reverse("media_search")
+        params: dict[str, Any] = {
+            "mediaTypes": [model_to_content_type_id(Film)],
+            "genres": ["Drama"],
+        }
+        results = json.loads(client.get(url, params).content)["results"]
+        assert [r["title"] for r in results] == ["Seven Samurai"]
+
+
+@pytest.mark.django_db
+def test_media_item_search_view_facets(client: Client) -> None:
+    drama = Genre.objects.create(name="Drama")
+    western = Genre.objects.create(name="Western")
+    FilmFactory.create(title="Seven Samurai", genres=[drama])
+    FilmFactory.create(title="Yojimbo", genres=[drama, western])
+    FilmFactory.create(title="Unvalidated Samurai", genres=[drama], validated=False)
+    BookFactory.create(title="Samurai William", genres=[western])
+
+    url = reverse("media_search")
+    film_id = model_to_content_type_id(Film)
+    book_id = model_to_content_type_id(Book)
+    params: dict[str, Any] = {
+        "q": "samurai",
+        "mediaTypes": [film_id],
+        "genres": ["Western"],
+        "facets": "true",
+    }
+    data = json.loads(client.get(url, params).content)
+    assert data["results"] == []
+    # Genres are counted across the selected media types, and media types across
+    # the selected genres.
+    assert data["facets"]["genres"] == [
+        {"name": "Drama", "count": 1},
+        {"name": "Western", "count": 0},
+    ]
+    assert data["facets"]["mediaTypes"] == [
+        {"id": book_id, "name": "Book", "count": 1},
+        {"id": film_id, "name": "Film", "count": 0},
+    ]
+
+    del params["facets"]
+    assert "facets" not in json.loads(client.get(url, params).content)
+
+
+@pytest.mark.django_db
+class TestTrigramAutocompleteBackend:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch: Any) -> None:
+        self.backend = TrigramAutocompleteBackend()
+        monkeypatch.setattr(
+            supergood_reads_engine, "autocomplete_backend", self.backend
+        )
+        FilmFactory.create(title="Seven Samurai")
+        FilmFactory.create(title="Steel Magnolias")
+        FilmFactory.create(title="Charade")
+
+    def titles(self, q: str) -> list[str]:
+        return [r["title"] for r in self.backend.search(Film, q)]
+
+    def test_typo(self) -> None:
+        assert self.titles("Charde") == ["Charade"]
+
+    def test_empty_query(self) -> None:
+        assert self.titles("") == ["Charade", "Seven Samurai", "Steel Magnolias"]
+
+    def test_index_follows_writes(
+        self, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        assert self.titles("Charade") == ["Charade"]
+        with django_capture_on_commit_callbacks(execute=True):
+            film = Film.objects.get(title="Charade")
+            film.title = "Charades"
+            film.save()
+        assert self.titles("Charades") == ["Charades"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            film.delete()
+        assert self.titles("Charades") == []
+
+
+@pytest.mark.django_db
+class TestPrefixAutocompleteBackend:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch: Any) -> None:
+        self.backend = PrefixAutocompleteBackend()
+        monkeypatch.setattr(
+            supergood_reads_engine, "autocomplete_backend", self.backend
+        )
+        FilmFactory.create(title="Seven Samurai")
+        FilmFactory.create(title="Samurai Rebellion")
+        FilmFactory.create(title="Charade")
+
+    def titles(self, q: str) -> list[str]:
+        return [r["title"] for r in self.backend.search(Film, q)]
+
+    def test_answers_from_index(self, django_assert_num_queries: Any) -> None:
+        self.backend.get_index(Film)
+        with django_assert_num_queries(0):
+            assert self.titles("sam") == ["Samurai Rebellion", "Seven Samurai"]
+
+    def test_index_follows_writes(
+        self, django_capture_on_commit_callbacks: Any
+    ) -> None:
+        self.backend.get_index(Film)
+        with django_capture_on_commit_callbacks(execute=True):
+            film = FilmFactory.create(title="Sanjuro")
+        assert self.titles("san") == ["Sanjuro"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            film.validated = False
+            film.save()
+        assert self.titles("san") == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Film.objects.get(title="Charade").delete()
+        assert self.titles("cha") == []
+
+    def test_falls_back_when_capped(self) -> None:
+        self.backend.max_titles = 1
+        assert self.titles("sam") == ["Samurai Rebellion", "Seven Samurai"]
+        assert self.titles("amurai") == []
+
+
+@pytest.mark.django_db
+def test_word_prefix_autocomplete_backend() -> None:
+    FilmFactory.create(title="Seven Samurai")
+    FilmFactory.create(title="Samurai Rebellion")
+    FilmFactory.create(title="Unvalidated Samurai", validated=False)
+    FilmFactory.create(title="Charade")
+    backend = WordPrefixAutocompleteBackend()
+
+    def titles(q: str) -> list[str]:
+        return [r["title"] for r in backend.search(Film, q)]
+
+    assert titles("SAM") == ["Samurai Rebellion", "Seven Samurai"]
+    assert titles("rebel") == ["Samurai Rebellion"]
+    assert titles("amurai") == []
+
+
+@pytest.mark.django_db
+class TestCursorPagination:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch: Any) -> None:
+        monkeypatch.setattr(SupergoodCursorPagination, "page_size", 2)
+        now = timezone.now()
+        # Two films share an updated_at so that ties have to be broken by pk.
+        for i, minutes in enumerate([5, 4, 3, 3, 1]):
+            film = FilmFactory.create(title=f"Film {i}")
+            Film.objects.filter(pk=film.pk).update(
+                updated_at=now - timedelta(minutes=minutes)
+            )
+        MediaItemSearchDocument.objects.rebuild()
+        self.expected = [str(f.pk) for f in Film.objects.order_by("-updated_at", "-pk")]
+
+    def get_page(self, client: Client, cursor: str | None = None) -> dict[str, Any]:
+        url = reverse("media_search")
+        params: dict[str, Any] = {
+            "pagination": "cursor",
+            "mediaTypes": [model_to_content_type_id(Film)],
+        }
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params)
+        assert response.status_code == 200
+        data: dict[str, Any] = json.loads(response.content)
+        return data
+
+    def test_walk_forwards_and_backwards(self, client: Client) -> None:
+        pages = [self.get_page(client)]
+        while pages[-1]["pagination"]["hasNext"]:
+            pages.append(self.get_page(client, pages[-1]["pagination"]["nextCursor"]))
+
+        ids = [r["id"] for page in pages for r in page["results"]]
+        assert ids == self.expected
+        assert [p["pagination"]["startIndex"] for p in pages] == [1, 3, 5]
+        assert pages[-1]["pagination"]["endIndex"] == 5
+        assert pages[0]["pagination"]["count"] is None
+        assert not pages[0]["pagination"]["hasPrevious"]
+
+        previous = self.get_page(client, pages[-1]["pagination"]["previousCursor"])
+        assert previous["results"] == pages[1]["results"]
+        assert previous["pagination"]["startIndex"] == 3
+        first = self.get_page(client, previous["pagination"]["previousCursor"])
+        assert first["results"] == pages[0]["results"]
+        assert not first["pagination"]["hasPrevious"]
+        assert first["pagination"]["hasNext"]
+
+    def test_invalid_cursor(self, client: Client) -> None:
+        url = reverse("media_search")
+        response = client.get(url, {"pagination": "cursor", "cursor": "nope"})
+        assert response.status_code == 404
+
+    def test_page_numbers_by_default(self, client: Client) -> None:
+        url = reverse("media_search")
+        response = client.get(url, {"mediaTypes": [model_to_content_type_id(Film)]})
+        pagination = json.loads(response.content)["pagination"]
+        assert pagination["count"] == 5
+        assert "nextCursor" not in pagination
@@ -3,6 +3,7 @@ from decimal import Decimal
 import pytest
 
 from supergood_reads.forms.strategy_forms import GOAT, EbertStrategyForm
+from supergood_reads.models import EbertStrategy, GoodreadsStrategy, LetterboxdStrategy
 
 
 @pytest.mark.django_db
@@ -42,3 +43,33 @@ class TestEbertStrategyForm:
 
         update_form = EbertStrategyForm(instance=strategy)
         assert update_form["rating"].value() == "0.0"
+
+
+class TestRatingHtml:
+    def test_ebert(self) -> None:
+        assert EbertStrategy(stars=Decimal("3.5")).rating_html == (
+            "<span class='text-gray-900'>★★★½</span>"
+        )
+        assert EbertStrategy(stars=Decimal("4.0"), goat=True).rating_html == (
+            "<span class='goat-font text-gray-900'>GOAT</span>"
+        )
+        assert EbertStrategy(stars=None).rating_html == (
+            "<span class='text-gray-900'>No Star Rating</span>"
+        )
+        assert EbertStrategy(stars=Decimal("0")).rating_html == (
+            "<span class='text-gray-900'>Zero Stars</span>"
+        )
+
+    def test_goodreads(self) -> None:
+        assert GoodreadsStrategy(stars=2).rating_html == (
+            "<span class='text-orange-500'>★★</span>"
+            "<span class='text-slate-200'>★★★</span>"
+        )
+
+    def test_letterboxd(self) -> None:
+        assert LetterboxdStrategy(stars=Decimal("0.5")).rating_html == (
+            "<span class='text-green-400'>½</span>"
+        )
+        assert LetterboxdStrategy(stars=Decimal("5.0")).rating_html == (
+            "<span class='text-green-400'>★★★★★</span>"
+        )
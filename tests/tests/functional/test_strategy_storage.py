@@ -0,0 +1,183 @@
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db.models.signals import post_delete, post_save
+
+from supergood_reads.forms.review_forms import CreateNewMediaOption, ReviewFormGroup
+from supergood_reads.models import (
+    Book,
+    EbertStrategy,
+    GoodreadsStrategy,
+    Review,
+    ReviewListEntry,
+)
+from supergood_reads.utils.content_type import model_to_content_type_id
+from supergood_reads.utils.engine import supergood_reads_engine
+from supergood_reads.utils.strategy_storage import (
+    JsonStrategyStorage,
+    TableStrategyStorage,
+)
+from tests.factories import BookFactory, ReviewFactory, ReviewFormDataFactory
+
+
+@pytest.fixture
+def json_storage(monkeypatch: Any) -> JsonStrategyStorage:
+    storage = JsonStrategyStorage()
+    monkeypatch.setattr(supergood_reads_engine, "strategy_storage", storage)
+    return storage
+
+
+def review_form_data(book: Book, stars: str) -> dict[str, Any]:
+    data = ReviewFormDataFactory().data
+    data[
+        "review_mgmt-create_new_media_item_object"
+    ] = CreateNewMediaOption.SELECT_EXISTING.value
+    data["review-media_item_content_type"] = model_to_content_type_id(Book)
+    data["review-media_item_object_id"] = str(book.pk)
+    data["review-strategy_content_type"] = model_to_content_type_id(GoodreadsStrategy)
+    data["goodreadsstrategy-stars"] = stars
+    return data
+
+
+def save_review(
+    data: dict[str, Any], user: User, instance: Review | None = None
+) -> Review:
+    review_form_group = ReviewFormGroup(data=data, instance=instance, user=user)
+    assert review_form_group.is_valid()
+    return review_form_group.save()
+
+
+@pytest.mark.django_db
+class TestJsonStrategyStorage:
+    def test_create(self, json_storage: JsonStrategyStorage, admin_user: User) -> None:
+        review = save_review(review_form_data(BookFactory.create(), "4"), admin_user)
+
+        assert not GoodreadsStrategy.objects.exists()
+        review = Review.objects.get(pk=review.pk)
+        assert review.strategy_object_id is None
+        assert review.strategy_data == {"stars": 4}
+        assert isinstance(review.strategy, GoodreadsStrategy)
+        assert review.strategy.stars == 4
+        assert review.rating_html == GoodreadsStrategy(stars=4).rating_html
+        assert review.score == Decimal("80")
+        entry = ReviewListEntry.objects.get(review=review)
+        assert entry.rating_html == review.rating_html
+
+    def test_update(self, json_storage: JsonStrategyStorage, admin_user: User) -> None:
+        book = BookFactory.create()
+        review = save_review(review_form_data(book, "4"), admin_user)
+
+        review = Review.objects.get(pk=review.pk)
+        save_review(review_form_data(book, "2"), admin_user, instance=review)
+        review = Review.objects.get(pk=review.pk)
+        assert review.strategy.stars == 2
+        assert review.score == Decimal("40")
+
+    def test_update_table_strategy(
+        self, json_storage: JsonStrategyStorage, admin_user: User
+    ) -> None:
+        book = BookFactory.create()
+        review = ReviewFactory.create(
+            media_item=book, strategy=EbertStrategy.objects.create(stars=1)
+        )
+
+        save_review(review_form_data(book, "5"), admin_user, instance=review)
+        assert not EbertStrategy.objects.exists()
+        review = Review.objects.get(pk=review.pk)
+        assert review.strategy_data == {"stars": 5}
+        assert review.score == Decimal("100")
+
+    def test_prefetch(
+        self, json_storage: JsonStrategyStorage, django_assert_num_queries: Any
+    ) -> None:
+        ReviewFactory.create_batch(3, strategy__stars=Decimal("2.5"))
+        json_storage.migrate(Review.objects.all())
+
+        with django_assert_num_queries(1):
+            reviews = list(Review.objects.prefetch_related("strategy"))
+            assert [r.strategy.stars for r in reviews] == [Decimal("2.5")] * 3
+
+
+@pytest.mark.django_db
+def test_table_storage_sends_signals(admin_user: User) -> None:
+    """Strategy rows are saved and deleted normally, not as raw fixture writes."""
+    saves, deletes = [], []
+
+    def on_save(sender: Any, instance: Any, raw: bool, **kwargs: Any) -> None:
+        saves.append((sender, raw))
+
+    def on_delete(sender: Any, instance: Any, **kwargs: Any) -> None:
+        deletes.append(sender)
+
+    post_save.connect(on_save, sender=GoodreadsStrategy)
+    post_save.connect(on_save, sender=EbertStrategy)
+    post_delete.connect(on_delete, sender=GoodreadsStrategy)
+    try:
+        book = BookFactory.create()
+        review = save_review(review_form_data(book, "4"), admin_user)
+        data = review_form_data(book, "4")
+        data["review-strategy_content_type"] = model_to_content_type_id(EbertStrategy)
+        data["ebertstrategy-rating"] = "3.0"
+        review = save_review(
+            data, admin_user, instance=Review.objects.get(pk=review.pk)
+        )
+    finally:
+        post_save.disconnect(on_save, sender=GoodreadsStrategy)
+        post_save.disconnect(on_save, sender=EbertStrategy)
+        post_delete.disconnect(on_delete, sender=GoodreadsStrategy)
+
+    assert saves == [(GoodreadsStrategy, False), (EbertStrategy, False)]
+    assert deletes == [GoodreadsStrategy]
+    assert not GoodreadsStrategy.objects.exists()
+    review = Review.objects.get(pk=review.pk)
+    assert review.score == Decimal("75")
+    assert ReviewListEntry.objects.get(review=review).rating_html == review.rating_html
+
+
+@pytest.mark.django_db
+def test_migrate(monkeypatch: Any) -> None:
+    reviews = [
+        ReviewFactory.create(
+            strategy=EbertStrategy.objects.create(stars=Decimal("3.5"), goat=True)
+        ),
+        ReviewFactory.create(strategy=GoodreadsStrategy.objects.create(stars=2)),
+    ]
+    rating_html = [review.rating_html for review in reviews]
+    scores = [review.score for review in reviews]
+
+    monkeypatch.setattr(
+        supergood_reads_engine, "strategy_storage", JsonStrategyStorage()
+    )
+    call_command(
+        "supergood_reads_migrate_strategy_storage", "--batch-size=1", stdout=None
+    )
+    assert not EbertStrategy.objects.exists()
+    assert not GoodreadsStrategy.objects.exists()
+    for review, html, score in zip(reviews, rating_html, scores):
+        review = Review.objects.get(pk=review.pk)
+        assert review.strategy_object_id is None
+        assert review.rating_html == html
+        assert review.score == score
+        assert ReviewListEntry.objects.get(review=review).strategy_object_id is None
+
+    monkeypatch.setattr(
+        supergood_reads_engine, "strategy_storage", TableStrategyStorage()
+    )
+    call_command("supergood_reads_migrate_strategy_storage", stdout=None)
+    assert EbertStrategy.objects.count() == 1
+    assert GoodreadsStrategy.objects.count() == 1
+    for review, html in zip(reviews, rating_html):
+        review = Review.objects.get(pk=review.pk)
+        assert review.strategy_data is None
+        assert review.rating_html == html
+        entry = ReviewListEntry.objects.get(review=review)
+        assert entry.strategy_object_id == review.strategy_object_id
+
+    # Strategy rows are linked again, so changing one updates its Review.
+    strategy = GoodreadsStrategy.objects.get()
+    strategy.stars = 5
+    strategy.save()
+    assert Review.objects.get(pk=reviews[1].pk).score == Decimal("100")
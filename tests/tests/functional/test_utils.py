@@ -1,11 +1,109 @@
+from typing import Any
+from unittest import mock
+
 import pytest
 from django.contrib.contenttypes.models import ContentType
+from django.template import loader
 
-from supergood_reads.models import Book
-from supergood_reads.utils.content_type import model_to_content_type_id
+from supergood_reads.models import BaseMediaItem, Book, Film
+from supergood_reads.utils import fragments
+from supergood_reads.utils.content_type import (
+    content_type_id_to_model,
+    model_to_content_type_id,
+)
+from supergood_reads.utils.engine import supergood_reads_engine
+from supergood_reads.utils.pagination import (
+    CachedCountPaginator,
+    EstimatedCountPaginator,
+)
+from tests.factories import FilmFactory
 
 
 @pytest.mark.django_db
 def test_model_to_content_type_id() -> None:
     book_content_type_id = model_to_content_type_id(Book)
     assert ContentType.objects.get_for_id(book_content_type_id).model_class() == Book
+
+
+@pytest.mark.django_db
+def test_content_type_registry(django_assert_num_queries: Any) -> None:
+    supergood_reads_engine.clear_content_types()
+    ContentType.objects.clear_cache()
+    with django_assert_num_queries(1):
+        registry = supergood_reads_engine.content_types
+
+    book_content_type = ContentType.objects.get_for_model(Book)
+    with django_assert_num_queries(0):
+        entry = registry.by_model[Book]
+        assert entry.content_type == book_content_type
+        assert entry.label == "Book"
+        assert registry.by_id[book_content_type.pk] is entry
+        assert model_to_content_type_id(Book) == book_content_type.pk
+        assert model_to_content_type_id(Book()) == book_content_type.pk
+        assert content_type_id_to_model(book_content_type.pk) is Book
+
+
+@pytest.mark.django_db
+class TestCachedCountPaginator:
+    def test_count_is_cached(self, django_assert_num_queries: Any) -> None:
+        FilmFactory.create_batch(3)
+        assert CachedCountPaginator(Film.objects.order_by("title"), 2).count == 3
+        with django_assert_num_queries(0):
+            assert CachedCountPaginator(Film.objects.order_by("-title"), 2).count == 3
+
+    def test_cache_is_keyed_on_filters(self) -> None:
+        FilmFactory.create(title="Charade")
+        FilmFactory.create(title="Seven Samurai")
+        assert CachedCountPaginator(Film.objects.all(), 2).count == 2
+        qs = Film.objects.filter(title="Charade")
+        assert CachedCountPaginator(qs, 2).count == 1
+
+    def test_writes_invalidate_counts(self) -> None:
+        film = FilmFactory.create()
+        assert CachedCountPaginator(BaseMediaItem.objects.all(), 2).count == 1
+        FilmFactory.create()
+        assert CachedCountPaginator(BaseMediaItem.objects.all(), 2).count == 2
+        film.delete()
+        assert CachedCountPaginator(BaseMediaItem.objects.all(), 2).count == 1
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPaginator:
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch: Any) -> None:
+        monkeypatch.setattr(EstimatedCountPaginator, "count_limit", 3)
+        FilmFactory.create_batch(6)
+
+    def test_exact_under_limit(self) -> None:
+        qs = Film.objects.filter(pk__in=Film.objects.all()[:2].values("pk"))
+        paginator = EstimatedCountPaginator(qs, 2)
+        assert paginator.count == 2
+        assert paginator.count_label == "2"
+
+    def test_capped_over_limit(self) -> None:
+        paginator = EstimatedCountPaginator(Film.objects.all(), 2)
+        page = paginator.page(1)
+        assert paginator.count == 3
+        assert paginator.count_label == "3+"
+        assert page.has_next()
+
+    def test_limit_follows_requested_page(self) -> None:
+        paginator = EstimatedCountPaginator(Film.objects.all(), 2)
+        page = paginator.page(3)
+        assert len(page) == 2
+        assert paginator.count == 6
+        assert paginator.count_is_exact
+
+
+def test_render_fragment() -> None:
+    fragments.clear_fragments()
+    with mock.patch.object(
+        fragments, "render_to_string", wraps=loader.render_to_string
+    ) as render_to_string:
+        icons = [Book.icon() for _ in range(3)]
+        assert render_to_string.call_count == 1
+        assert icons[0] == icons[2]
+        assert icons[0].startswith("<span class='text-xs text-cyan-500'><svg")
+
+        Film.icon()
+        assert render_to_string.call_count == 2
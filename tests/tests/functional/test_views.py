@@ -1,5 +1,6 @@
 import json
 from dataclasses import dataclass
+from decimal import Decimal
 from typing import Any, TypeAlias, cast
 from urllib.parse import urlencode
 from uuid import UUID, uuid4
@@ -15,8 +16,21 @@ from django.test import Client
 from django.urls import reverse
 
 from supergood_reads.forms.review_forms import CreateNewMediaOption, ReviewForm
-from supergood_reads.models import Book, EbertStrategy, Film, GoodreadsStrategy, Review
+from supergood_reads.models import (
+    Book,
+    EbertStrategy,
+    Film,
+    Genre,
+    GoodreadsStrategy,
+    MediaItemRatingAggregate,
+    Review,
+    ReviewListEntry,
+    TomatoStrategy,
+)
 from supergood_reads.utils.content_type import model_to_content_type_id
+from supergood_reads.utils.engine import supergood_reads_engine
+from supergood_reads.utils.strategy_storage import JsonStrategyStorage
+from supergood_reads.views.views import BulkCreateReviewsApiView
 from tests.factories import (
     BookFactory,
     EbertStrategyFactory,
@@ -220,6 +234,34 @@ class TestCreateReviewView:
         assert review
         assert review.text == "It was okay."
 
+    def test_query_budget(
+        self,
+        client: Client,
+        create_review_data: ReviewFormData,
+        reviewer_user: User,
+        django_assert_max_num_queries: Any,
+    ) -> None:
+        book = BookFactory.create()
+        ReviewFactory.create(media_item=book)
+        create_review_data[
+            "review_mgmt-create_new_media_item_object"
+        ] = CreateNewMediaOption.SELECT_EXISTING.value
+        create_review_data["review-media_item_content_type"] = self.book_content_type
+        create_review_data["review-media_item_object_id"] = book.id
+        client.force_login(reviewer_user)
+
+        # Session, user and permissions, an EXISTS for the Book, then a transaction
+        # that inserts the Strategy and Review, updates the Book's rating aggregate,
+        # fetches the Book for the Review's list entry and inserts that.
+        with django_assert_max_num_queries(12):
+            response = client.post(self.url, create_review_data)
+        assert response.status_code == 302
+        review = Review.objects.get(owner=reviewer_user)
+        assert review.score == 100
+        entry = ReviewListEntry.objects.get(review=review)
+        assert entry.rating_html == review.rating_html
+        assert MediaItemRatingAggregate.objects.get(pk=book.pk).review_count == 2
+
     def test_existing_book(
         self, client: Client, create_review_data: ReviewFormData, reviewer_user: User
     ) -> None:
@@ -695,6 +737,51 @@ class TestUpdateReviewView:
         assert review.strategy.id == strategy.id
         assert review.strategy.stars == 4
 
+    def test_query_budget(
+        self,
+        client: Client,
+        reviewer_user: User,
+        django_assert_max_num_queries: Any,
+    ) -> None:
+        strategy = GoodreadsStrategyFactory.create(stars=5)
+        review = ReviewFactory.create(strategy=strategy, owner=reviewer_user)
+        data = ReviewFormDataFactory(instance=review).data
+        data["goodreadsstrategy-stars"] = 2
+        url = self.get_url(review.id)
+        client.force_login(reviewer_user)
+
+        # The Review, session, user and permissions, the Strategy and an EXISTS for
+        # the MediaItem, then a transaction that updates the Strategy in place, reads
+        # the Review's stored score, updates the Review and its rating aggregate,
+        # fetches the MediaItem for the Review's list entry and updates that.
+        with django_assert_max_num_queries(15):
+            res = client.post(url, data)
+        assert res.status_code == 302
+        # Not refresh_from_db(), which keeps the cached Strategy before Django 4.1.
+        review = Review.objects.get(pk=review.id)
+        assert review.strategy_object_id == strategy.id
+        assert review.score == 40
+        entry = ReviewListEntry.objects.get(review=review)
+        assert entry.rating_html == review.rating_html
+        aggregate = MediaItemRatingAggregate.objects.get(pk=review.media_item_object_id)
+        assert aggregate.score_sum == 40
+        assert aggregate.histogram == [0, 0, 1, 0, 0]
+
+        # Changing the type of Strategy costs one more write, to delete the old one.
+        data["review-strategy_content_type"] = model_to_content_type_id(TomatoStrategy)
+        data["tomatostrategy-fresh"] = "True"
+        with django_assert_max_num_queries(16):
+            res = client.post(url, data)
+        assert res.status_code == 302
+        review.refresh_from_db()
+        assert isinstance(review.strategy, TomatoStrategy)
+        assert not GoodreadsStrategy.objects.filter(pk=strategy.pk).exists()
+        entry.refresh_from_db()
+        assert entry.rating_html == review.rating_html
+        aggregate.refresh_from_db()
+        assert aggregate.score_sum == 100
+        assert aggregate.histogram == [0, 0, 0, 0, 1]
+
     def test_replace_strategy(self, client: Client, reviewer_user: User) -> None:
         """Test that existing strategy is replaced when we change strategies."""
         strategy = EbertStrategyFactory()
@@ -754,3 +841,273 @@ class TestUpdateReviewView:
         review.save()
         res = client.get(url, follow=True)
         assert res.status_code == 200
+
+
+@pytest.mark.django_db
+class TestCatalogCaching:
+    @pytest.fixture(autouse=True)
+    def setup(self) -> None:
+        self.film = FilmFactory.create(title="Seven Samurai")
+        self.url = reverse("media_search")
+        self.params: dict[str, Any] = {"mediaTypes": [model_to_content_type_id(Film)]}
+
+    def test_not_modified(self, client: Client) -> None:
+        res = client.get(self.url, self.params)
+        assert res.status_code == 200
+        etag = res["ETag"]
+
+        res = client.get(self.url, self.params, HTTP_IF_NONE_MATCH=etag)
+        assert res.status_code == 304
+
+        res = client.get(self.url, {**self.params, "q": "sev"}, HTTP_IF_NONE_MATCH=etag)
+        assert res.status_code == 200
+
+        self.film.title = "Sanjuro"
+        self.film.save()
+        res = client.get(self.url, self.params, HTTP_IF_NONE_MATCH=etag)
+        assert res.status_code == 200
+        assert res["ETag"] != etag
+
+    def test_cached_response(
+        self, client: Client, django_assert_num_queries: Any
+    ) -> None:
+        res = client.get(self.url, self.params)
+        with django_assert_num_queries(0):
+            cached = client.get(self.url, self.params)
+        assert cached.content == res.content
+
+        genres_url = reverse("genres_api")
+        res = client.get(genres_url)
+        assert "Jidaigeki" not in {g["name"] for g in json.loads(res.content)}
+        Genre.objects.create(name="Jidaigeki")
+        res = client.get(genres_url)
+        assert "Jidaigeki" in {g["name"] for g in json.loads(res.content)}
+
+    def test_media_type_choices(self, client: Client) -> None:
+        url = reverse("media_type_choices_api")
+        res = client.get(url)
+        assert res.status_code == 200
+        assert {choice["name"] for choice in res.json()} == {"Book", "Film"}
+        assert res.has_header("ETag")
+
+        res = client.get(url, HTTP_IF_NONE_MATCH=res["ETag"])
+        assert res.status_code == 304
+
+    def test_not_shared_between_users(
+        self, client: Client, reviewer_user: User
+    ) -> None:
+        film = FilmFactory.create(title="Sanjuro", owner=reviewer_user, validated=False)
+        res = client.get(self.url, self.params)
+        assert media_item_response_matches(
+            cast(HttpResponse, res),
+            [MediaItemFixtureData(str(self.film.id), "Seven Samurai", 0)],
+        )
+        client.force_login(reviewer_user)
+        res = client.get(self.url, self.params, HTTP_IF_NONE_MATCH=res["ETag"])
+        assert res.status_code == 200
+        assert str(film.id) in {r["id"] for r in json.loads(res.content)["results"]}
+
+    def test_review_writes(self, client: Client, reviewer_user: User) -> None:
+        res = client.get(self.url, self.params)
+        [result] = res.json()["results"]
+        assert result["reviewCount"] == 0
+
+        ReviewFactory.create(media_item=self.film)
+        res = client.get(self.url, self.params, HTTP_IF_NONE_MATCH=res["ETag"])
+        assert res.status_code == 200
+        [result] = res.json()["results"]
+        assert result["reviewCount"] == 1
+
+        client.force_login(reviewer_user)
+        payload = {
+            "mediaItem": {
+                "contentType": model_to_content_type_id(Film),
+                "id": str(self.film.pk),
+            },
+            "strategy": {
+                "contentType": model_to_content_type_id(GoodreadsStrategy),
+                "fields": {"stars": 4},
+            },
+        }
+        client.post(
+            reverse("reviews_bulk_api"),
+            {"reviews": [payload]},
+            content_type="application/json",
+        )
+        client.logout()
+        res = client.get(self.url, self.params, HTTP_IF_NONE_MATCH=res["ETag"])
+        assert res.status_code == 200
+        [result] = res.json()["results"]
+        assert result["reviewCount"] == 2
+
+
+def bulk_review_payload(book: Book, stars: int = 4, **kwargs: Any) -> dict[str, Any]:
+    return {
+        "mediaItem": {
+            "contentType": model_to_content_type_id(Book),
+            "id": str(book.pk),
+        },
+        "strategy": {
+            "contentType": model_to_content_type_id(GoodreadsStrategy),
+            "fields": {"stars": stars},
+        },
+        "completedAt": {"year": 2020, "month": 2, "day": 1},
+        "text": "It was good.",
+        **kwargs,
+    }
+
+
+@pytest.mark.django_db
+class TestBulkCreateReviewsApiView:
+    url = reverse("reviews_bulk_api")
+
+    def post(self, client: Client, payloads: Any) -> Any:
+        return client.post(
+            self.url, {"reviews": payloads}, content_type="application/json"
+        )
+
+    def test_create(self, client: Client, reviewer_user: User) -> None:
+        client.force_login(reviewer_user)
+        assert client.get(reverse("reading_stats_api")).json()["reviewCount"] == 0
+        book = BookFactory.create()
+        film = FilmFactory.create()
+        payloads = [
+            bulk_review_payload(book, 4),
+            {
+                "mediaItem": {
+                    "contentType": model_to_content_type_id(Film),
+                    "id": str(film.pk),
+                },
+                "strategy": {
+                    "contentType": model_to_content_type_id(EbertStrategy),
+                    "fields": {"rating": "3.5"},
+                },
+            },
+        ]
+
+        res = self.post(client, payloads)
+        assert res.status_code == 200
+        data = res.json()
+        assert data["created"] == 2
+        assert data["failed"] == 0
+        first, second = (
+            Review.objects.get(pk=result["id"]) for result in data["results"]
+        )
+        assert first.owner == reviewer_user
+        assert first.media_item == book
+        assert first.strategy.stars == 4
+        assert first.score == 80
+        assert (first.completed_at_year, first.text) == (2020, "It was good.")
+        assert second.media_item == film
+        assert second.strategy.stars == Decimal("3.5")
+
+        # Derived data that signals keep current is written too.
+        entry = ReviewListEntry.objects.get(review=first)
+        assert entry.title == book.title
+        assert entry.rating_html == first.rating_html
+        aggregate = MediaItemRatingAggregate.objects.get(media_item_id=book.pk)
+        assert aggregate.review_count == 1
+        assert aggregate.histogram == [0, 0, 0, 0, 1]
+        assert client.get(reverse("reading_stats_api")).json()["reviewCount"] == 2
+
+    def test_errors(self, client: Client, reviewer_user: User) -> None:
+        client.force_login(reviewer_user)
+        book = BookFactory.create()
+        book_id, missing = model_to_content_type_id(Book), str(uuid4())
+        payloads = [
+            bulk_review_payload(book, 4),
+            bulk_review_payload(book, 9),
+            bulk_review_payload(
+                book, mediaItem={"contentType": book_id, "id": missing}
+            ),
+            {"mediaItem": {"contentType": book_id}},
+            "not a review",
+        ]
+
+        res = self.post(client, payloads)
+        assert res.status_code == 200
+        data = res.json()
+        assert data["created"] == 1
+        assert data["failed"] == 4
+        results = data["results"]
+        assert Review.objects.get(pk=results[0]["id"]).media_item == book
+        assert list(results[1]["errors"]) == ["strategy.fields.stars"]
+        assert results[2]["errors"] == {
+            "mediaItem.id": ["The selected object does not exist."]
+        }
+        assert set(results[3]["errors"]) == {"strategy.contentType", "mediaItem.id"}
+        assert "nonFieldErrors" in results[4]["errors"]
+        assert Review.objects.count() == 1
+
+    def test_create_media_item(self, client: Client, reviewer_user: User) -> None:
+        client.force_login(reviewer_user)
+        payload = bulk_review_payload(BookFactory.create())
+        payload["mediaItem"] = {
+            "contentType": model_to_content_type_id(Book),
+            "fields": {"title": "Middlemarch", "author": "George Eliot"},
+        }
+        invalid = bulk_review_payload(BookFactory.create())
+        invalid["mediaItem"] = {
+            "contentType": model_to_content_type_id(Book),
+            "fields": {"author": "George Eliot"},
+        }
+
+        results = self.post(client, [payload, invalid]).json()["results"]
+        media_item = Review.objects.get(pk=results[0]["id"]).media_item
+        assert media_item is not None
+        assert media_item.title == "Middlemarch"
+        assert media_item.owner == reviewer_user
+        assert list(results[1]["errors"]) == ["mediaItem.fields.title"]
+        assert Book.objects.filter(author="George Eliot").count() == 1
+
+    def test_json_strategy_storage(
+        self, client: Client, reviewer_user: User, monkeypatch: Any
+    ) -> None:
+        monkeypatch.setattr(
+            supergood_reads_engine, "strategy_storage", JsonStrategyStorage()
+        )
+        client.force_login(reviewer_user)
+
+        [result] = self.post(
+            client, [bulk_review_payload(BookFactory.create(), 2)]
+        ).json()["results"]
+        assert not GoodreadsStrategy.objects.exists()
+        review = Review.objects.get(pk=result["id"])
+        assert review.strategy_data == {"stars": 2}
+        assert review.score == 40
+
+    def test_query_budget(
+        self,
+        client: Client,
+        reviewer_user: User,
+        django_assert_max_num_queries: Any,
+    ) -> None:
+        client.force_login(reviewer_user)
+        books = BookFactory.create_batch(10)
+        self.post(client, [bulk_review_payload(books[0])])
+
+        # The number of queries doesn't grow with the number of reviews.
+        with django_assert_max_num_queries(16):
+            res = self.post(client, [bulk_review_payload(book) for book in books])
+        assert res.json()["created"] == 10
+
+    def test_permissions(self, client: Client, reviewer_user: User) -> None:
+        payloads = [bulk_review_payload(BookFactory.create())]
+        assert self.post(client, payloads).status_code == 403
+
+        client.force_login(UserFactory.create())
+        assert self.post(client, payloads).status_code == 403
+
+        client.force_login(reviewer_user)
+        assert self.post(client, payloads).status_code == 200
+
+    def test_invalid_request(
+        self, client: Client, reviewer_user: User, monkeypatch: Any
+    ) -> None:
+        client.force_login(reviewer_user)
+        assert self.post(client, {"not": "a list"}).status_code == 400
+
+        monkeypatch.setattr(BulkCreateReviewsApiView, "max_reviews", 2)
+        res = self.post(client, [bulk_review_payload(BookFactory.create())] * 3)
+        assert res.status_code == 400
+        assert not Review.objects.exists()
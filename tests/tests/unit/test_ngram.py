@@ -0,0 +1,50 @@
+from supergood_reads.search.ngram import IndexEntry, NgramIndex
+
+
+def entry(id: int, title: str) -> IndexEntry:
+    return IndexEntry(id=id, title=title, autocomplete_label=title)
+
+
+class TestNgramIndex:
+    def setup_method(self) -> None:
+        self.index = NgramIndex()
+        self.index.build(
+            [
+                entry(1, "Seven Samurai"),
+                entry(2, "Steel Magnolias"),
+                entry(3, "Charade"),
+            ]
+        )
+
+    def titles(self, q: str) -> list[str]:
+        return [e.title for e in self.index.search(q)]
+
+    def test_ngrams_match_pg_trgm(self) -> None:
+        assert self.index.ngrams("Cat") == {"  c", " ca", "cat", "at "}
+
+    def test_exact_match(self) -> None:
+        assert self.titles("Charade") == ["Charade"]
+
+    def test_typo(self) -> None:
+        assert self.titles("Charde") == ["Charade"]
+
+    def test_ordered_by_similarity(self) -> None:
+        self.index.add(entry(4, "Seven"))
+        assert self.titles("seven") == ["Seven", "Seven Samurai"]
+
+    def test_limit(self) -> None:
+        for i in range(10):
+            self.index.add(entry(10 + i, f"Charade {i}"))
+        assert len(self.index.search("charade", limit=5)) == 5
+
+    def test_add_replaces_existing_id(self) -> None:
+        self.index.add(entry(3, "Charades"))
+        assert len(self.index) == 3
+        assert self.titles("Charades") == ["Charades"]
+
+    def test_discard_and_compact(self) -> None:
+        self.index.discard(1)
+        self.index.discard(2)
+        assert 1 not in self.index
+        assert self.titles("Seven Samurai") == []
+        assert self.titles("Charade") == ["Charade"]
@@ -0,0 +1,56 @@
+from supergood_reads.search.ngram import IndexEntry
+from supergood_reads.search.prefix import PrefixIndex, normalize
+
+
+def entry(id: int, title: str) -> IndexEntry:
+    return IndexEntry(id=id, title=title, autocomplete_label=title)
+
+
+def test_normalize() -> None:
+    assert normalize("  Seven   SAMURAI! ") == "seven samurai"
+
+
+class TestPrefixIndex:
+    def setup_method(self) -> None:
+        self.index = PrefixIndex(key_length=8)
+        self.index.build(
+            [
+                entry(1, "Seven Samurai"),
+                entry(2, "Samurai Rebellion"),
+                entry(3, "Charade"),
+            ]
+        )
+
+    def titles(self, q: str, limit: int = 20) -> list[str]:
+        return [e.title for e in self.index.search(q, limit=limit)]
+
+    def test_title_prefix_first(self) -> None:
+        assert self.titles("sam") == ["Samurai Rebellion", "Seven Samurai"]
+
+    def test_title_prefix_within_limit(self) -> None:
+        self.index.add(entry(4, "A Samurai"))
+        self.index.add(entry(5, "Sam"))
+        assert self.titles("sam", limit=2) == ["Sam", "Samurai Rebellion"]
+
+    def test_word_prefix(self) -> None:
+        assert self.titles("rebel") == ["Samurai Rebellion"]
+
+    def test_no_substring_match(self) -> None:
+        assert self.titles("amurai") == []
+
+    def test_query_longer_than_keys(self) -> None:
+        assert self.titles("seven samurai") == ["Seven Samurai"]
+        assert self.titles("seven samurat") == []
+
+    def test_limit(self) -> None:
+        assert len(self.titles("", limit=2)) == 2
+
+    def test_add_and_discard(self) -> None:
+        self.index.add(entry(3, "Charades"))
+        assert self.titles("charades") == ["Charades"]
+        assert len(self.index) == 3
+
+        self.index.discard(3)
+        self.index.discard(2)
+        assert self.titles("cha") == []
+        assert self.titles("sam") == ["Seven Samurai"]